@@ -2,17 +2,433 @@ from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
+    PrivateAttr,
     computed_field,
 )
 import numpy as np
+import math
+import numbers
+import time
+import itertools
+import hashlib
+import json
+import mmap
+import struct
+import threading
+import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from multiprocessing import shared_memory
 from pathlib import Path
-from typing import Type
-    
+from queue import Full, Queue
+from typing import Type, Optional
+from dataclasses import dataclass
+from collections import OrderedDict, namedtuple
+
+try:
+    import numba
+    from numba.extending import register_jitable as _jitable
+except ImportError:  # optional, evaluate(backend="numba") falls back to NumPy
+    numba = None
+
+    def _jitable(function):
+        return function
+
+# compiled Numba kernels, built on first use
+_NUMBA_KERNELS = {}
+
+# sampled enveloping cam shapes, keyed by (length, height, order, increment)
+_ELLIPSE_BASES = {}
+
+
+@dataclass
+class MF62Forces:
+    """Forces and moments from MF62tire.evaluate, one array per output"""
+
+    fx0: np.ndarray
+    fy0: np.ndarray
+    mz0: np.ndarray
+
+    # only filled when evaluate is called with intermediates=True
+    kxk: Optional[np.ndarray] = None
+    kya: Optional[np.ndarray] = None
+    trail: Optional[np.ndarray] = None
+    mzr0: Optional[np.ndarray] = None
+
+    # only filled when evaluate is called with combined=True
+    fx: Optional[np.ndarray] = None
+    fy: Optional[np.ndarray] = None
+    mz: Optional[np.ndarray] = None
+
+    # only filled when evaluate is called with combined=True and intermediates=True
+    gxa: Optional[np.ndarray] = None
+    gyk: Optional[np.ndarray] = None
+    svyk: Optional[np.ndarray] = None
+    s: Optional[np.ndarray] = None
+
+    # only filled when evaluate is called with moments=True
+    mx: Optional[np.ndarray] = None
+    my: Optional[np.ndarray] = None
+
+
+@dataclass
+class MF62Jacobian:
+    """Pure-slip forces and their analytic partial derivatives, from MF62tire.evaluate_jacobian"""
+
+    fx0: np.ndarray
+    fy0: np.ndarray
+
+    dfx0_dlongslip: np.ndarray
+    dfx0_dfz: np.ndarray
+    dfx0_dinclangl: np.ndarray
+
+    dfy0_dslipangl: np.ndarray
+    dfy0_dfz: np.ndarray
+    dfy0_dinclangl: np.ndarray
+
+
+@dataclass
+class MF62Peaks:
+    """Peak forces, the slips they occur at and the slip stiffnesses, from MF62tire.calc_peaks"""
+
+    longslip: np.ndarray
+    fx0: np.ndarray
+    slipangl: np.ndarray
+    fy0: np.ndarray
+
+    # 4.E15, 4.E25
+    kxk: np.ndarray
+    kya: np.ndarray
+
+
+@dataclass
+class MF62Vertical:
+    """Vertical load, radii and rolling speed of the tyre, from the MF62tire vertical calculations"""
+
+    fz: np.ndarray
+    deflection: np.ndarray
+    loaded_radius: np.ndarray
+    effective_radius: np.ndarray
+
+    # omega*effective_radius, the speed the tread rolls at
+    rolling_speed: np.ndarray
+
+    # only filled when vcx is given
+    longslip: Optional[np.ndarray] = None
+
+
+@dataclass
+class MF62RoadPlane:
+    """Effective road plane under each wheel, from MF62Road.evaluate"""
+
+    # height and forward slope [rad] of the plane the tyre rolls on
+    height: np.ndarray
+    slope: np.ndarray
+
+    # lateral angle of the plane [rad], 0 on a single-line profile
+    banking: np.ndarray
+
+    # contact patch half length and half width [m] at the load
+    half_length: np.ndarray
+    half_width: np.ndarray
+
+
+class MF62Workspace:
+    """Preallocated buffers for MF62tire.evaluate_into, sized once for a batch shape"""
+
+    # intermediate terms of the fused kernel, one buffer each
+    TERMS = (
+        'dfz', 'dfz2', 'gammaAst', 'gammaAst2', 'gammaAstAbs',
+        'dx', 'kappax', 'ex', 'bx', 'svx',
+        'dy', 'kya_', 'svyg', 'kygO', 'svy', 'shy', 'alphay', 'ey', 'by',
+        'sgnVcx', 'alphaAst', 'alphaCos', 'alphar', 'alphat', 'dt', 'bt', 'et', 'br', 'dr',
+        'tmp1', 'tmp2',
+    )
+
+    def __init__(self, shape):
+        self.shape = (shape,) if isinstance(shape, int) else tuple(shape)
+
+        # one contiguous block for all intermediates
+        self._terms = np.empty((len(self.TERMS),) + self.shape)
+        for name, buffer in zip(self.TERMS, self._terms):
+            setattr(self, name, buffer)
+
+        self.forces = MF62Forces(
+            fx0=np.empty(self.shape),
+            fy0=np.empty(self.shape),
+            mz0=np.empty(self.shape),
+            kxk=np.empty(self.shape),
+            kya=np.empty(self.shape),
+            trail=np.empty(self.shape),
+            mzr0=np.empty(self.shape),
+        )
+
+
+class MF62Lookup:
+    """Tabulated fx0 and fy0 over (slip, fz, pressure, inclangl) on evenly spaced nodes, with vectorized multilinear interpolation"""
+
+    # table axes, in table dimension order after the slip axis
+    LOAD_AXES = ('fz', 'pressure', 'inclangl')
+
+    # tables with their scalar inputs folded in, kept per table
+    FOLDED_SIZE = 8
+
+    def __init__(self, axes: dict, fx0: np.ndarray, fy0: np.ndarray, max_error: dict):
+        # axes: {'longslip', 'slipangl', 'fz', 'pressure', 'inclangl': increasing, evenly spaced 1-D node arrays}
+        self.axes = {name: np.asarray(nodes, dtype=float) for name, nodes in axes.items()}
+        for name, nodes in self.axes.items():
+            steps = np.diff(nodes)
+            if nodes.size < 2 or np.any(steps <= 0) or not np.allclose(steps, steps[0], rtol=1e-9, atol=0):
+                raise ValueError(f"Lookup axis {name!r} needs at least 2 evenly spaced, increasing nodes")
+        self.fx0_table = np.ascontiguousarray(fx0, dtype=float)
+        self.fy0_table = np.ascontiguousarray(fy0, dtype=float)
+        # (first node, step, node count) per axis, the cell of a point is then plain arithmetic
+        grids = {name: (nodes[0], (nodes[-1]-nodes[0])/(nodes.size-1), nodes.size) for name, nodes in self.axes.items()}
+        self._fx0Grids = [grids[name] for name in ('longslip',)+self.LOAD_AXES]
+        self._fy0Grids = [grids[name] for name in ('slipangl',)+self.LOAD_AXES]
+        self._folded = {'fx0': OrderedDict(), 'fy0': OrderedDict()}
+
+        # estimated max |interpolated - closed form| [N], per table
+        self.max_error = dict(max_error)
+
+    def calc_fx0(self, longslip, fz, pressure, inclangl):
+
+        """Interpolated fx0, inputs are clamped to the table bounds"""
+
+        return _interpolate(self.fx0_table, self._fx0Grids, (longslip, fz, pressure, inclangl),
+                            self._folded['fx0'], self.FOLDED_SIZE)
+
+    def calc_fy0(self, slipangl, fz, pressure, inclangl):
+
+        """Interpolated fy0, inputs are clamped to the table bounds"""
+
+        return _interpolate(self.fy0_table, self._fy0Grids, (slipangl, fz, pressure, inclangl),
+                            self._folded['fy0'], self.FOLDED_SIZE)
+
+    def save(self, file_path: Path):
+
+        """Write the tables, axes and error estimate to an .npz file"""
+
+        np.savez(
+            file_path,
+            fx0=self.fx0_table,
+            fy0=self.fy0_table,
+            **{f'axis_{name}': nodes for name, nodes in self.axes.items()},
+            **{f'max_error_{name}': error for name, error in self.max_error.items()},
+        )
+
+    @classmethod
+    def load(cls, file_path: Path) -> 'MF62Lookup':
+
+        """Read a table written by save"""
+
+        with np.load(file_path) as data:
+            axes = {key[len('axis_'):]: data[key] for key in data.files if key.startswith('axis_')}
+            max_error = {key[len('max_error_'):]: float(data[key]) for key in data.files if key.startswith('max_error_')}
+            return cls(axes, data['fx0'], data['fy0'], max_error)
+
+
+class MF62TestRun:
+    """Tyre test-rig run held as memory-mapped float64 columns, streamed to the evaluators in blocks"""
+
+    # evaluator input / measured output -> rig channel name
+    CHANNELS = {
+        'slipangl': 'SA',
+        'longslip': 'SL',
+        'fz': 'FZ',
+        'inclangl': 'IA',
+        'pressure': 'P',
+        'vcx': 'V',
+        'fx0': 'FX',
+        'fy0': 'FY',
+        'mz0': 'MZ',
+    }
+
+    def __init__(self, columns: dict):
+        # columns: {rig channel name: 1-D array}, all the same length
+        self.columns = dict(columns)
+        self.rows = len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def __len__(self) -> int:
+        return self.rows
+
+    @classmethod
+    def from_text(cls, file_path: Path, cache_dir=None, chunk_rows: int = 65_536) -> 'MF62TestRun':
+
+        """
+        Open a whitespace or comma separated run, converting it once into a
+        columnar cache (<name>.mf62run, next to the file or in cache_dir)
+        that later opens are memory-mapped from. The cache is rebuilt when
+        the size or mtime of the text file changes.
+
+        The channel names are taken from the first text line before the
+        data that contains a known channel (SA, FZ, ...), or from the last
+        one, so description and units lines are skipped.
+
+        Parameters:
+        - file_path (Path): text file of the run
+        - cache_dir (Path): directory for the cache
+        - chunk_rows (int): rows parsed per chunk while converting
+
+        Returns:
+        - MF62TestRun: run backed by np.memmap columns
+        """
+
+        file_path = Path(file_path)
+        cache = _run_cache_path(file_path, cache_dir)
+        stat = file_path.stat()
+        meta = _read_run_meta(cache)
+        if meta is None or meta['size'] != stat.st_size or meta['mtime_ns'] != stat.st_mtime_ns:
+            meta = _convert_run(file_path, cache, chunk_rows)
+
+        return cls({
+            name: np.memmap(cache / f'{i}.f64', dtype='<f8', mode='r', shape=(meta['rows'],)) if meta['rows'] else np.empty(0)
+            for i, name in enumerate(meta['channels'])
+        })
+
+    def blocks(self, block: int = 65_536, channels=None, scale=None, defaults=None):
+
+        """
+        Yield the run in aligned blocks of {evaluator name: array}, ready for
+        MF62tire.evaluate or fit.
+
+        Parameters:
+        - block (int): rows per block
+        - channels (dict): overrides of CHANNELS, {evaluator name: rig channel}
+        - scale (dict): {evaluator name: factor} unit and sign conversions,
+          e.g. {'slipangl': np.pi/180, 'fz': -1, 'pressure': 1000}
+        - defaults (dict): {evaluator name: value} for channels the run lacks
+        """
+
+        channels = {**self.CHANNELS, **(channels or {})}
+        scale = scale or {}
+        defaults = defaults or {}
+        present = {name: channel for name, channel in channels.items() if channel in self.columns}
+        for start in range(0, self.rows, block):
+            stop = min(start+block, self.rows)
+            data = {}
+            for name, channel in present.items():
+                # copied out of the map, so the read happens here and not at first use
+                values = np.array(self.columns[channel][start:stop], dtype=float)
+                data[name] = values*scale[name] if name in scale else values
+            for name, value in defaults.items():
+                data.setdefault(name, np.full(stop-start, float(value)))
+            yield data
+
+    def statistics(self, tire: 'MF62tire', block: int = 65_536, channels=None, scale=None, combined=False) -> dict:
+
+        """
+        Residuals of the model against the measured forces, accumulated
+        block by block so memory stays bounded by the block size.
+
+        Parameters:
+        - tire (MF62tire): model to compare
+        - block, channels, scale: as in blocks
+        - combined (bool): compare the combined-slip fx, fy and mz instead
+          of the pure-slip fx0, fy0 and mz0
+
+        Returns:
+        - dict: {fx0/fy0/mz0: {'count', 'bias', 'rms', 'max_abs', 'r2'}} for
+          every measured output in the run
+        """
+
+        defaults = dict(longslip=0.0, slipangl=0.0, inclangl=0.0, pressure=tire.NOMPRES, vcx=tire.LONGVL)
+        sums = {}
+        for data in self.blocks(block, channels, scale, defaults):
+            if 'fz' not in data:
+                raise ValueError("Test run has no vertical load channel")
+            forces = tire.evaluate(*(data[name] for name in _SWEEP_AXES), combined=combined)
+            for target in ('fx0', 'fy0', 'mz0'):
+                if target not in data:
+                    continue
+                measured = data[target]
+                modelled = getattr(forces, target[:2] if combined else target)
+                keep = np.isfinite(measured) & np.isfinite(modelled)
+                error = modelled[keep]-measured[keep]
+                total = sums.setdefault(target, np.zeros(6))
+                total += (keep.sum(), error.sum(), error@error, measured[keep].sum(), measured[keep]@measured[keep], 0)
+                total[5] = max(total[5], np.abs(error).max(initial=0))
+
+        statistics = {}
+        for target, (count, errorSum, errorSquares, measuredSum, measuredSquares, maxAbs) in sums.items():
+            count = max(count, 1)
+            variance = measuredSquares/count-(measuredSum/count)**2
+            statistics[target] = {
+                'count': int(count),
+                'bias': float(errorSum/count),
+                'rms': math.sqrt(errorSquares/count),
+                'max_abs': float(maxAbs),
+                'r2': float(1-errorSquares/count/variance) if variance > 0 else float('nan'),
+            }
+        return statistics
+
+
+class MF62PressureCache:
+    """LRU cache of MF62PressureFactors keyed by scalar pressure, with hit/miss/eviction counters"""
+
+    def __init__(self, maxsize: int = 16):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # pressure -> (coefficient pack the factors were built from, factors)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, c, pressure) -> 'MF62PressureFactors':
+
+        """Factors of c at pressure, computed on a miss or when c is not the pack they were built from"""
+
+        with self._lock:
+            entry = self._entries.get(pressure)
+            if entry is not None and entry[0] is c:
+                self.hits += 1
+                self._entries.move_to_end(pressure)
+                return entry[1]
+
+            self.misses += 1
+            factors = _pressure_factors(c, pressure)
+            if self.maxsize > 0:
+                self._entries[pressure] = (c, factors)
+                self._entries.move_to_end(pressure)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+            return factors
+
+    def __reduce__(self):
+        # copies and pickles start empty, the lock cannot be shared
+        return (type(self), (self.maxsize,))
+
+    def resize(self, maxsize: int):
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._entries) > max(maxsize, 0):
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self) -> dict:
+        lookups = self.hits+self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'hit_rate': self.hits/lookups if lookups else 0.0,
+        }
+
+
 class MF62tire(BaseModel):
     """Base model containing shared properties between linear and nonlinear models"""
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    # coefficient pack built by frozen_coefficients(), dropped on any field change
+    _coefficients: Optional['MF62Coefficients'] = PrivateAttr(default=None)
+
+    # LRU cache of pressure factor packs, see pressure_cache_stats()
+    _pressure_cache: MF62PressureCache = PrivateAttr(default_factory=MF62PressureCache)
+
     # ----------------------#
     # MDI_HEADER            #
     # ----------------------#
@@ -1176,299 +1592,3419 @@ class MF62tire(BaseModel):
         ''' Calculate the fx0.
         
         Parameters:
-        - MF62tire (class): data on tires from tir file
-        - longslip (float): longitudinal slip of the tire 
-        - fz (float): forces acting in the z direction [N]
-        - pressure (float): Tire Pressure [kg]
-        - inclangl (float): incline angle [degrees]
+        - longslip (float or array): longitudinal slip of the tire 
+        - fz (float or array): forces acting in the z direction [N]
+        - pressure (float or array): Tire Pressure [Pa]
+        - inclangl (float or array): incline angle [rad]
 
         Returns:
-        - float: fx0 '''
+        - float or array: fx0 '''
 
-        # 4.E1, 4.E2a
-        fzO = self.FNOMIN*self.LFZO
-        dfz = (fz-fzO)/fzO
+        # turn slip is not modelled, so every ZETA factor is 1
+        c = self.frozen_coefficients()
 
-        # 4.#2b
-        piO = self.NONPRES
-        dpi = (pressure-piO)/piO
+        # single operating point: use the math-module kernel
+        if _is_scalar(longslip, fz, pressure, inclangl):
+            return _point_fx0(c, float(longslip), float(fz), self.__pydantic_private__['_pressure_cache'].get(c, float(pressure)), float(inclangl))
 
-        # 4.E11
-        cx = self.PCXI*self.LCX
+        # 4.E2b and its pressure polynomials, cached per pressure
+        pf = self._pressure_factors(c, pressure)
 
-        # 4.E13
-        mux = self.LMUX*(self.PDX1 + self.PDX2)*(1+self.PPX3*dpi+self.PPX4*dpi**2)*(1-self.PDX3*inclangl**2)
+        # 4.E10 - 4.E18
+        longitudinal, kxk = _longitudinal_shape(c, fz, pf, inclangl, longslip)
 
-        # 4.E12
-        dx = mux*fz*self.ZETA1
+        # 4.E9
+        Fx0 = _magic_formula_curve(longitudinal, longslip+longitudinal.SH)
 
-        # 4.E17
-        shx = self.LHX*(self.PHX1+self.PHX2*dfz)
+        return Fx0
+    
+    def calc_fy0(self, slipangl, fz, pressure, inclangl) -> 'Fy0': 
 
-        # 4.E8
-        amu = 10 # FROM MATLAB CODE
-        lmux = amu*self.LMUX/(1+(amu-1)*self.LMUX)
+        """
+        Calculate the fy0.
+        
+        Parameters:
+        - slipangl (float or array): slip angle [rad]
+        - fz (float or array): forces acting in the z direction [N]
+        - pressure (float or array): Tire Pressure [Pa]
+        - inclangl (float or array): incline angle [rad]
 
-        # 4.E18
-        sVx = self.ZETA1*lmux*fz*(self.PVX1+self.PVX2*dfz)
+        Returns:
+        - float or array: fy0
+        
+        """
 
-        # 4.E10
-        kappax = longslip + shx
-        kappaxSgn = np.sign(kappax)
+        # turn slip is not modelled, so every ZETA factor is 1
+        c = self.frozen_coefficients()
 
-        # 4.E14
-        ex = self.LEX*(self.PEX1+self.PEX2*dfz+self.PEX3*dfz**2)*(1-self.PEX4*kappaxSgn)
+        # single operating point: use the math-module kernel
+        if _is_scalar(slipangl, fz, pressure, inclangl):
+            return _point_fy0(c, float(slipangl), float(fz), self.__pydantic_private__['_pressure_cache'].get(c, float(pressure)), float(inclangl))
 
-        # 4.E15
-        kxk = self.LKX*fz*(self.PKX1+self.PKX2)*(np.exp(self.PKX3*dfz))*(1+self.PPX1*dpi+self.PPX2*dpi**2)
+        # 4.E2B
+        pf = self._pressure_factors(c, pressure)
 
-        # 4.E16
-        eps_Kxk = np.finfo(float).eps*np.maximum(1,np.abs(kxk))
-        bx = kxk/(cx * dx + eps_Kxk)
+        # 4.E20 - 4.E30
+        lateral, kya, kya_, muy = _lateral_shape(c, fz, pf, inclangl, slipangl)
 
-        # (4.E9)
-        Fx0 = dx*np.sin(cx*np.arctan(bx*kappax-ex*(bx*kappax-np.arctan(bx*kappax))))+sVx
+        # 4.E19
+        Fy0 = _magic_formula_curve(lateral, slipangl+lateral.SH)
 
-        return Fx0
+        return Fy0
     
-    def calc_fy0(self, slipangl, fz, pressure, inclangl) -> 'Fy0': 
+    def calc_mz0(self, slipangl, fz, pressure, inclangl, vcx)-> 'mz0':
 
         """
-        Calculate the fy0.
+        Calculate the mz0.
         
         Parameters:
-        - MF62tire (class): data on tires from tir file
-        - longslip (float): longitudinal slip of the tire 
-        - fz (float): forces acting in the z direction [N]
-        - pressure (float): Tire Pressure [kg]
-        - inclangl (float): incline angle [degrees]
+        - slipangl (float or array): slip angle [rad]
+        - fz (float or array): forces acting in the z direction [N]
+        - pressure (float or array): Tire Pressure [Pa]
+        - inclangl (float or array): incline angle [rad]
+        - vcx (float or array): longitudinal velocity of the contact centre [m/s]
 
         Returns:
-        - float: fy0
+        - float or array: mz0
         
         """
 
-        # 4.E4
-        gammaAst = np.sin(inclangl)
-        gammaAst2 = gammaAst**2
+        # turn slip is not modelled, so every ZETA factor is 1
+        c = self.frozen_coefficients()
 
-        # 4.E1 and 4.E2a
-        fzO = MF62tire.FNOMIN*MF62tire.LFZO
-        dfz = (fz-fzO)/fzO
+        # single operating point: use the math-module kernel
+        if _is_scalar(slipangl, fz, pressure, inclangl, vcx):
+            return _point_mz0(c, float(slipangl), float(fz), self.__pydantic_private__['_pressure_cache'].get(c, float(pressure)), float(inclangl), float(vcx))
 
         # 4.E2B
-        piO = MF62tire.NOMPRES
-        dpi = (pressure-piO)/piO
-        dpi2 = dpi**2
+        pf = self._pressure_factors(c, pressure)
+
+        # 4.E19 - 4.E30, fy0 computed once here rather than through calc_fy0
+        lateral, kya, kya_, muy = _lateral_shape(c, fz, pf, inclangl, slipangl)
+        fy0 = _magic_formula_curve(lateral, slipangl+lateral.SH)
+
+        # 4.E34 - 4.E47
+        trail, residual, alphaAst = _aligning_shape(c, fz, pf, inclangl, slipangl, vcx, lateral, kya_)
+
+        # 4.E33, 4.E32, 4.E36
+        tO = _magic_formula_curve(trail, alphaAst+trail.SH, np.cos)
+        mzrO = _magic_formula_curve(residual, alphaAst+residual.SH, np.cos)
+        mz0 = -tO*fy0 + mzrO
+
+        return mz0
+
+    def calc_fx(self, longslip, slipangl, fz, pressure, inclangl, vcx) -> 'Fx':
+
+        """
+        Calculate the combined-slip fx (4.E50).
+        
+        Parameters:
+        - longslip (float or array): longitudinal slip of the tire 
+        - slipangl (float or array): slip angle [rad]
+        - fz (float or array): forces acting in the z direction [N]
+        - pressure (float or array): Tire Pressure [Pa]
+        - inclangl (float or array): incline angle [rad]
+        - vcx (float or array): longitudinal velocity of the contact centre [m/s]
+
+        Returns:
+        - float or array: fx
+        
+        """
 
-        # 4.E21
-        cy = MF62tire.LCY*MF62tire.PCY1
+        return self.evaluate(longslip, slipangl, fz, pressure, inclangl, vcx, combined=True).fx
 
-        # 4.E23
-        muy = (MF62tire.PDY1+MF62tire.PDY2*dfz)*(1+MF62tire.PPY3*dpi+MF62tire.PPY4*dpi2)
+    def calc_fy(self, longslip, slipangl, fz, pressure, inclangl, vcx) -> 'Fy':
 
-        # 4.E22
-        dy = muy*fz*MF62tire.ZETA2
+        """
+        Calculate the combined-slip fy (4.E58).
+        
+        Parameters: as for calc_fx
 
-        # 4.E25
-        kya = (MF62tire.PKY1*fzO*(1+MF62tire.PPY1*dpi)*(1-MF62tire.PKY3*np.abs(gammaAst))*np.sin(MF62tire.PKY4*np.arctan(fz/fzO/((MF62tire.PKY2+MF62tire.PKY5*gammaAst2)*(1+MF62tire.PPY2*dpi))))*MF62tire.LKY*MF62tire.ZETA3)
+        Returns:
+        - float or array: fy
+        
+        """
 
-        # 4.E39
-        signKya = np.sign(kya)
-        signKya[signKya == 0] =1
-        kya_ = kya + np.finfo(float).eps*signKya
+        return self.evaluate(longslip, slipangl, fz, pressure, inclangl, vcx, combined=True).fy
 
-        # 4.E28
-        svyg = MF62tire.ZETA2*MF62tire.LKYC*MF62tire.LMUY*fz*(MF62tire.PVY3+MF62tire.PVY4*dfz)*gammaAst
+    def calc_mz(self, longslip, slipangl, fz, pressure, inclangl, vcx) -> 'Mz':
 
-        # 4.E30
-        kygO = fz*(MF62tire.PKY6+MF62tire.PKY7*dfz)*(1+MF62tire.PPY5*dpi)*MF62tire.LKYC
+        """
+        Calculate the combined-slip mz (4.E71).
+        
+        Parameters: as for calc_fx
 
-        # 4.E29
-        svy = MF62tire.ZETA2*MF62tire.LMUY*MF62tire.LVY*fz*(MF62tire.PVY1+MF62tire.PVY2)+svyg
+        Returns:
+        - float or array: mz
+        
+        """
 
-        # 4.E27
-        shy = MF62tire.LHY*(MF62tire.PHY1+MF62tire.PHY2*dfz)+(kygO*gammaAst-svyg)/kya_*MF62tire.ZETA0+MF62tire.ZETA4-1
+        return self.evaluate(longslip, slipangl, fz, pressure, inclangl, vcx, combined=True).mz
 
-        # 4.20
-        alphay = slipangl+shy
-        alphaySgn = np.sign(slipangl)
+    def calc_mx(self, fy, fz, pressure, inclangl) -> 'Mx':
 
-        # 4.E24
-        ey = (MF62tire.PEY1+MF62tire.PEY2*dfz)*(1+MF62tire.PEY5*gammaAst**2-(MF62tire.PEY3+MF62tire.PEY4*gammaAst)*alphaySgn)*MF62tire.LEY
+        """
+        Calculate the overturning moment mx (4.E69).
+        
+        Parameters:
+        - fy (float or array): lateral force [N]
+        - fz (float or array): forces acting in the z direction [N]
+        - pressure (float or array): Tire Pressure [Pa]
+        - inclangl (float or array): incline angle [rad]
 
-        # 4.E26
-        signCy= np.sign(cy)
-        signCy[signCy == 0] = 1
-        by = kya/(cy*dy+np.finfo(float).eps*signCy)
+        Returns:
+        - float or array: mx
+        
+        """
 
-        # 4.E19
-        Fy0 = dy*np.sin(cy*np.arctan(by*alphay-ey*(by*alphay-np.arctan(by*alphay))))+svy
+        c = self.frozen_coefficients()
+        return _mx(c, fy, fz, self._pressure_factors(c, pressure), inclangl)
 
-        return Fy0
-    
-    def calc_mz0(self, slipangl, fz, pressure, inclangl, vcx)-> 'mz0':
+    def calc_my(self, fx, fz, pressure, inclangl, vcx) -> 'My':
 
         """
-        Calculate the mz0.
+        Calculate the rolling resistance moment my (4.E70).
         
         Parameters:
-        - MF62tire (class): data on tires from tir file
-        - longslip (float): longitudinal slip of the tire 
-        - fz (float): forces acting in the z direction [N]
-        - pressure (float): Tire Pressure [kg]
-        - inclangl (float): incline angle [degrees]
-        - vcxm(float):
+        - fx (float or array): longitudinal force [N]
+        - fz (float or array): forces acting in the z direction [N]
+        - pressure (float or array): Tire Pressure [Pa]
+        - inclangl (float or array): incline angle [rad]
+        - vcx (float or array): longitudinal velocity of the contact centre [m/s]
 
         Returns:
-        - float: mz0
+        - float or array: my
         
         """
 
-        # 4.E1 and 4.E2a
-        fzO = MF62tire.FNOMIN*MF62tire.LFZO
-        dfz = (fz-fzO)/fzO
+        c = self.frozen_coefficients()
+        return _my(c, fx, fz, self._pressure_factors(c, pressure), inclangl, vcx)
 
-        # 4.E2B
-        piO = MF62tire.NOMPRES
-        dpi = (pressure-piO)/piO
+    def evaluate(self, longslip, slipangl, fz, pressure, inclangl, vcx, intermediates=False, backend='numpy', combined=False, moments=False, coefficients=None, workers=None, chunk=None, turnslip=None) -> 'MF62Forces':
 
-        # 4.E2B
-        piO = MF62tire.NOMPRES
-        dpi = (pressure-piO)/piO
-        dpi2 = dpi**2
+        """
+        Calculate fx0, fy0 and mz0 in one pass, computing every term they
+        share (dfz, dpi, gammaAst, kya, svy, shy, ...) only once. With
+        combined=True the combined-slip fx, fy and mz are added from the
+        same pure-slip terms.
+        
+        Parameters:
+        - longslip (float or array): longitudinal slip of the tire 
+        - slipangl (float or array): slip angle [rad]
+        - fz (float or array): forces acting in the z direction [N]
+        - pressure (float or array): Tire Pressure [Pa]
+        - inclangl (float or array): incline angle [rad]
+        - vcx (float or array): longitudinal velocity of the contact centre [m/s]
+        - intermediates (bool): also return kxk, kya, trail and mzr0
+        - backend (str): 'numpy', or 'numba' for single-pass parallel kernels
+          of the pure-slip outputs (falls back to 'numpy' when numba is not
+          installed). The Numba kernels do not model turn slip, so with
+          turnslip the pass runs on NumPy.
+        - combined (bool): also return the combined-slip fx, fy and mz
+          (always evaluated with NumPy)
+        - moments (bool): also return the overturning moment mx and rolling
+          resistance moment my, from the fx/fy of the same pass (combined
+          when combined=True, pure slip otherwise)
+        - coefficients (MF62Coefficients): evaluate against this pack, e.g.
+          from with_overrides, instead of the model's own (always NumPy)
+        - workers (int): split the broadcast inputs into chunks and evaluate
+          them on this many threads, bounding the temporaries to one chunk
+          per thread
+        - chunk (int): points per chunk, autotuned by a short calibration
+          run on first use when None (setting only chunk runs on one thread)
+        - turnslip (float or array): spin of the contact patch [1/m], e.g.
+          from calc_turn_slip. Turns on the ZETA factors of the turn-slip
+          extension (always NumPy), None keeps them all at 1 at no cost
 
-        # 4.E21
-        cy = MF62tire.LCY*MF62tire.PCY1
+        Returns:
+        - MF62Forces: fx0, fy0 and mz0 broadcast to the shape of the inputs
+          (and of the coefficients, when they carry a sample axis)
         
-        # 4.E3
-        vcy = -vcx*np.tan(slipangl)
-        sgnVcx = np.sign(vcx)
-        alphaAst = np.tan(slipangl)*sgnVcx
+        """
 
-        # 4.E6a
-        vc = np.sqrt(vcx**2+vcy**2)
-        vc = vc+np.finfo(float).eps
+        if backend not in ('numpy', 'numba'):
+            raise ValueError(f"Unknown backend {backend!r}, expected 'numpy' or 'numba'")
 
-        # 4.E6
-        alphaCos = vcx/vc
+        if workers is not None or chunk is not None:
+            if coefficients is not None and any(np.ndim(value) for value in coefficients):
+                raise ValueError("Chunked evaluation needs coefficients without a sample axis")
+            if chunk is None:
+                chunk = _autotune_chunk(self, intermediates, backend, combined, moments)
+            # turnslip, when given, is chunked with the other inputs
+            return _evaluate_chunked(
+                lambda *inputs: self.evaluate(*inputs[:6], intermediates=intermediates, backend=backend, combined=combined, moments=moments, coefficients=coefficients, turnslip=inputs[6] if len(inputs) > 6 else None),
+                (longslip, slipangl, fz, pressure, inclangl, vcx) + (() if turnslip is None else (turnslip,)), workers or 1, int(chunk),
+            )
 
-        # 4.E4
-        gammaAst = np.sin(inclangl)
-        gammaAst2 = gammaAst**2
-        gammaAstAbs = np.abs(gammaAst)
+        if coefficients is not None:
+            return _evaluate_pack(coefficients, longslip, slipangl, fz, pressure, inclangl, vcx, intermediates, combined, moments, turnslip=turnslip)
 
-        # 4.E25
-        kya = (MF62tire.PKY1*fzO*(1+MF62tire.PPY1*dpi)*(1-MF62tire.PKY3*np.abs(gammaAst))*np.sin(MF62tire.PKY4*np.arctan(fz/fzO/((MF62tire.PKY2+MF62tire.PKY5*gammaAst2)*(1+MF62tire.PPY2*dpi))))*MF62tire.LKY*MF62tire.ZETA3)
+        c = self.frozen_coefficients()
 
-        # 4.E23
-        muy = (MF62tire.PDY1+MF62tire.PDY2*dfz)*(1+MF62tire.PPY3*dpi+MF62tire.PPY4*dpi2)
+        if turnslip is not None:
+            return _evaluate_pack(c, longslip, slipangl, fz, pressure, inclangl, vcx, intermediates, combined, moments,
+                                  self._pressure_factors(c, pressure), turnslip)
 
-        # 4.E22
-        dy = muy*fz*MF62tire.ZETA2
+        if not (combined or moments):
+            # single operating point: skip the ufunc overhead entirely
+            if _is_scalar(longslip, slipangl, fz, pressure, inclangl, vcx):
+                fx0, fy0, mz0, kxk, kya, tO, mzrO = _evaluate_point(c, float(longslip), float(slipangl), float(fz), self.__pydantic_private__['_pressure_cache'].get(c, float(pressure)),
+                                                                    float(inclangl), float(vcx))
+                if not intermediates:
+                    return MF62Forces(fx0=fx0, fy0=fy0, mz0=mz0)
+                return MF62Forces(fx0=fx0, fy0=fy0, mz0=mz0, kxk=kxk, kya=kya, trail=tO, mzr0=mzrO)
 
-        # 4.E26
-        signCy= np.sign(cy)
-        signCy[signCy == 0] = 1
-        by = kya/(cy*dy+np.finfo(float).eps*signCy)
+            if backend == 'numba' and numba is not None:
+                return _evaluate_numba(c, longslip, slipangl, fz, pressure, inclangl, vcx, intermediates)
 
-        # 4.E28
-        svyg = MF62tire.ZETA2*MF62tire.LKYC*MF62tire.LMUY*fz*(MF62tire.PVY3+MF62tire.PVY4*dfz)*gammaAst
+        return _evaluate_pack(c, longslip, slipangl, fz, pressure, inclangl, vcx, intermediates, combined, moments,
+                              self._pressure_factors(c, pressure))
 
-        # 4.E30
-        kygO = fz*(MF62tire.PKY6+MF62tire.PKY7*dfz)*(1+MF62tire.PPY5*dpi)*MF62tire.LKYC
+    def calc_turn_slip(self, yawrate, omega, fz, inclangl, vcx):
 
-        # 4.E29
-        svy = MF62tire.ZETA2*MF62tire.LMUY*MF62tire.LVY*fz*(MF62tire.PVY1+MF62tire.PVY2)+svyg
+        """
+        Spin of the contact patch, the turnslip input of evaluate: path
+        curvature from the yaw rate plus the part of the camber that acts
+        as spin.
 
-        # 4.E27
-        shy = MF62tire.LHY*(MF62tire.PHY1+MF62tire.PHY2*dfz)+(kygO*gammaAst-svyg)/kya_*MF62tire.ZETA0+MF62tire.ZETA4-1
+        Parameters:
+        - yawrate (float or array): yaw velocity of the wheel plane [rad/s]
+        - omega (float or array): wheel spin velocity [rad/s]
+        - fz (float or array): forces acting in the z direction [N]
+        - inclangl (float or array): incline angle [rad]
+        - vcx (float or array): longitudinal velocity of the contact centre [m/s]
 
-        # 4.E39
-        signKya = np.sign(kya)
-        signKya[signKya == 0] =1
-        kya_ = kya + np.finfo(float).eps*signKya
+        Returns:
+        - float or array: spin phi [1/m]
         
-        dfz2 = dfz**2
-        rO = MF62tire.UNLOADED_RADIUS
+        """
 
-        # 4.E35
-        shf = shy+svy/kya
+        c = self.frozen_coefficients()
+        dfz = (fz-c.fzO)/c.fzO
+        epsGamma = c.PECP1*(1+c.PECP2*dfz)
+        # VXLOW keeps the spin finite at standstill
+        return -(yawrate-(1-epsGamma)*omega*np.sin(inclangl))/np.maximum(np.abs(vcx), c.VXLOW)
 
-        # 4.E35
-        sht = MF62tire.QHZ1 + MF62tire.QHZ2*dfz + (MF62tire.QHZ3 + MF62tire.QHZ4*dfz)*gammaAst
+    def evaluate_jacobian(self, longslip, slipangl, fz, pressure, inclangl, coefficients=None) -> 'MF62Jacobian':
+
+        """
+        Calculate fx0 and fy0 together with their analytic derivatives with
+        respect to slip, fz and inclination angle, in one vectorized pass.
+        Turn slip is not modelled (every ZETA factor is 1), use
+        evaluate(turnslip=...) for the forces under spin.
+        
+        Parameters:
+        - longslip (float or array): longitudinal slip of the tire 
+        - slipangl (float or array): slip angle [rad]
+        - fz (float or array): forces acting in the z direction [N]
+        - pressure (float or array): Tire Pressure [Pa]
+        - inclangl (float or array): incline angle [rad]
+        - coefficients (MF62Coefficients): evaluate against this pack instead
+          of the model's own
 
-        # 4.E34
-        alphat = alphaAst+sht
+        Returns:
+        - MF62Jacobian: fx0, fy0 and their partial derivatives
+        
+        """
 
-        # 4.E37
-        alphar = alphaAst+shf
+        if coefficients is not None:
+            return _evaluate_jacobian_pack(coefficients, longslip, slipangl, fz, _pressure_factors(coefficients, pressure), inclangl)
+        c = self.frozen_coefficients()
+        return _evaluate_jacobian_pack(c, longslip, slipangl, fz, self._pressure_factors(c, pressure), inclangl)
 
-        # 4.E42
-        dtO = fz*(rO/fzO)*(MF62tire.QDZ1+MF62tire.QDZ2*dfz)*(1-MF62tire.PPZ1*dpi)*MF62tire.LTR*sgnVcx
+    def calc_peaks(self, fz, pressure, inclangl, side=1, iterations: int = 50, tolerance: float = 1e-12) -> 'MF62Peaks':
 
-        # 4.E40
-        bt = (MF62tire.QBZ1+MF62tire.QBZ2*dfz+MF62tire.QBZ3*dfz2)*(1+MF62tire.QBZ4*gammaAst+MF62tire.QBZ5*gammaAstAbs)*MF62tire.LKY/MF62tire.LMUY
+        """
+        Find the peak fx0 and fy0 and the slips they occur at for every
+        operating point at once, together with the slip stiffnesses Kxk
+        (4.E15) and Kya (4.E25). When a curve is still rising at the slip
+        range of the .tir (KPUMIN/KPUMAX, ALPMIN/ALPMAX), the bound is returned.
 
-        # 4.E41
-        ct = MF62tire.QCZ1
+        Parameters:
+        - fz (float or array): forces acting in the z direction [N]
+        - pressure (float or array): Tire Pressure [Pa]
+        - inclangl (float or array): incline angle [rad]
+        - side (int): 1 for the peaks at positive slip, -1 for negative slip
+        - iterations (int): maximum Newton iterations
+        - tolerance (float): relative step size at which Newton stops
 
-        # 4.E43
-        dt = dtO*(1+MF62tire.QDZ3*gammaAstAbs+MF62tire.QDZ4*gammaAst2*MF62tire.ZETA5)
+        Returns:
+        - MF62Peaks: peak slips and forces, and kxk and kya
+        
+        """
 
-        # 4.E44
-        et = (MF62tire.QEZ1+MF62tire.QEZ2*dfz+MF62tire.QEZ3*dfz2)
+        if side not in (1, -1):
+            raise ValueError(f"side must be 1 or -1, got {side!r}")
 
-        # 4.E45
-        br = (MF62tire.QBZ9*MF62tire.LKY/MF62tire.LMUY+MF62tire.QBZ10*by*cy)*MF62tire.ZETA6
+        c = self.frozen_coefficients()
+        # before broadcasting, so a scalar pressure still hits the cache
+        pf = self._pressure_factors(c, pressure)
+        fz, pressure, inclangl = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (fz, pressure, inclangl)))
+        longitudinal, lateral = _slip_shape_factors(c, fz, pf, inclangl, side)
 
-        # 4.E46
-        cr = MF62tire.ZETA7
+        longslip = _slip_at_peak(longitudinal, c.KPUMAX if side > 0 else c.KPUMIN, side, iterations, tolerance)
+        slipangl = _slip_at_peak(lateral, c.ALPMAX if side > 0 else c.ALPMIN, side, iterations, tolerance)
 
-        # 4.E47
-        dr = fz*rO*((MF62tire.QDZ6+MF62tire.QD27*dfz)*MF62tire.LRES*MF62tire.ZETA2 + ((MF62tire.QDZ8+MF62tire.QDZ9*dfz)*(1+MF62tire.PPZ2*dpi)+(MF62tire.QDZ10+MF62tire.QDZ11*dfz)*gammaAstAbs)*gammaAst*MF62tire.LKZC*MF62tire.ZETA0)*MF62tire.LMUY*sgnVcx*alphaCos+MF62tire.ZETA8-1
+        forces = _evaluate_pack(c, longslip, slipangl, fz, pressure, inclangl, c.LONGVL, intermediates=True, pf=pf)
+        return MF62Peaks(longslip=longslip, fx0=forces.fx0, slipangl=slipangl, fy0=forces.fy0, kxk=forces.kxk, kya=forces.kya)
 
-        # 4.E33
-        tO = dt*np.cos(ct*np.arctan(bt*alphat-et*(bt*alphat-np.arctan(bt*alphat))))*alphaCos
+    def calc_longslip(self, fx0, fz, pressure, inclangl, iterations: int = 50, tolerance: float = 1e-12) -> tuple:
 
-        # 4.E32
-        fy0 = self.calc_fy0(MF62tire, slipangl, fz, pressure, inclangl)
-        mzO_ = -tO*fy0
-        mzrO = dr*np.cos(cr*np.arctan(br*alphar))*alphaCos
-        mz0 = mzO_ + mzrO
+        """
+        Longitudinal slip that produces fx0, on the monotonic branch between
+        the braking and driving peaks, for every target at once.
+        
+        Parameters:
+        - fx0 (float or array): target longitudinal force [N]
+        - fz (float or array): forces acting in the z direction [N]
+        - pressure (float or array): Tire Pressure [Pa]
+        - inclangl (float or array): incline angle [rad]
+        - iterations (int): maximum Newton iterations
+        - tolerance (float): relative step size at which Newton stops
 
-        return mz0
+        Returns:
+        - float or np.ndarray: longitudinal slip
+        - bool or np.ndarray: True where |fx0| is beyond the peak force, the
+          slip there is the peak slip
+        
+        """
 
-    @classmethod
-    def from_tir_file(cls, file_path: Path) -> 'MF62tire':
-        data = {}
+        c = self.frozen_coefficients()
+        pf = self._pressure_factors(c, pressure)
+        fx0, fz, pressure, inclangl = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (fx0, fz, pressure, inclangl)))
+        positive, negative = (_slip_shape_factors(c, fz, pf, inclangl, side)[0] for side in (1, -1))
+        peaks = (_slip_at_peak(positive, c.KPUMAX, 1, iterations, tolerance),
+                 _slip_at_peak(negative, c.KPUMIN, -1, iterations, tolerance))
+        slip, saturated = _slip_for_force(fx0, positive, negative, peaks, iterations, tolerance)
+        if slip.ndim == 0:
+            # scalar in, scalar out, like calc_fx0 and calc_fy0
+            return float(slip), bool(saturated)
+        return slip, saturated
+
+    def calc_slipangl(self, fy0, fz, pressure, inclangl, iterations: int = 50, tolerance: float = 1e-12) -> tuple:
+
+        """
+        Slip angle that produces fy0, on the monotonic branch between the two
+        lateral peaks, for every target at once.
+        
+        Parameters:
+        - fy0 (float or array): target lateral force [N]
+        - fz (float or array): forces acting in the z direction [N]
+        - pressure (float or array): Tire Pressure [Pa]
+        - inclangl (float or array): incline angle [rad]
+        - iterations (int): maximum Newton iterations
+        - tolerance (float): relative step size at which Newton stops
+
+        Returns:
+        - float or np.ndarray: slip angle [rad]
+        - bool or np.ndarray: True where fy0 is beyond the peak force, the
+          slip angle there is the peak slip angle
+        
+        """
+
+        c = self.frozen_coefficients()
+        pf = self._pressure_factors(c, pressure)
+        fy0, fz, pressure, inclangl = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (fy0, fz, pressure, inclangl)))
+        positive, negative = (_slip_shape_factors(c, fz, pf, inclangl, side)[1] for side in (1, -1))
+        peaks = (_slip_at_peak(positive, c.ALPMAX, 1, iterations, tolerance),
+                 _slip_at_peak(negative, c.ALPMIN, -1, iterations, tolerance))
+        slip, saturated = _slip_for_force(fy0, positive, negative, peaks, iterations, tolerance)
+        if slip.ndim == 0:
+            # scalar in, scalar out, like calc_fx0 and calc_fy0
+            return float(slip), bool(saturated)
+        return slip, saturated
+
+    def calc_relaxation_lengths(self, fz, pressure, inclangl) -> tuple:
+
+        """
+        Longitudinal and lateral relaxation lengths of the first-order slip
+        dynamics, from the slip stiffnesses Kxk (4.E15) and Kya (4.E25) over
+        the load- and pressure-dependent carcass stiffnesses
+        (LONGITUDINAL_STIFFNESS, LATERAL_STIFFNESS, PCFX*, PCFY*).
+
+        Parameters:
+        - fz (float or array): forces acting in the z direction [N]
+        - pressure (float or array): Tire Pressure [Pa]
+        - inclangl (float or array): incline angle [rad]
+
+        Returns:
+        - tuple: (sigmaKappa, sigmaAlpha) [m]
+        
+        """
+
+        c = self.frozen_coefficients()
+        return _relaxation_lengths(c, fz, self._pressure_factors(c, pressure), inclangl)
+
+    def calc_fz_from_deflection(self, deflection, pressure, omega=0.0, fx=0.0, fy=0.0, vcx=None) -> 'MF62Vertical':
+
+        """
+        Vertical load from the radial deflection of the tyre, with the
+        speed, pressure and fx/fy influence on the vertical stiffness.
+
+        Parameters:
+        - deflection (float or array): free radius minus loaded radius [m]
+        - pressure (float or array): Tire Pressure [Pa]
+        - omega (float or array): wheel spin velocity [rad/s]
+        - fx, fy (float or array): forces of the previous step [N]
+        - vcx (float or array): longitudinal velocity of the contact centre
+          [m/s], when given the longitudinal slip is returned too
+
+        Returns:
+        - MF62Vertical: fz with the radii, rolling speed and slip at it
+        
+        """
+
+        c = self.frozen_coefficients()
+        pf = self._pressure_factors(c, pressure)
+        rOmega = _free_radius(c, omega)
+        qfz1, scale = _vertical_stiffness_terms(c, pf, omega, fx, fy)
+
+        # the tyre only pushes on the road
+        rho = np.maximum(deflection, 0.0)
+        x = rho/c.UNLOADED_RADIUS
+        fz = scale*(qfz1*x+c.Q_FZ2*x**2)
+        return _rolling(c, pf, rOmega, rho, fz, omega, vcx)
+
+    def calc_loaded_radius(self, fz, pressure, omega=0.0, fx=0.0, fy=0.0, vcx=None) -> 'MF62Vertical':
+
+        """
+        Loaded radius at a vertical load, the closed-form inverse of
+        calc_fz_from_deflection.
+
+        Parameters:
+        - fz (float or array): forces acting in the z direction [N]
+        - pressure, omega, fx, fy, vcx: as for calc_fz_from_deflection
+
+        Returns:
+        - MF62Vertical: loaded_radius with the deflection, effective radius,
+          rolling speed and slip at it
+        
+        """
+
+        c = self.frozen_coefficients()
+        pf = self._pressure_factors(c, pressure)
+        rOmega = _free_radius(c, omega)
+        qfz1, scale = _vertical_stiffness_terms(c, pf, omega, fx, fy)
+
+        # positive root of Q_FZ2*x**2 + qfz1*x = fz/scale, in a form that holds for Q_FZ2 = 0
+        fz = np.maximum(fz, 0.0)
+        y = fz/scale
+        x = 2*y/(qfz1+np.sqrt(qfz1**2+4*c.Q_FZ2*y))
+        return _rolling(c, pf, rOmega, x*c.UNLOADED_RADIUS, fz, omega, vcx)
+
+    def calc_effective_rolling_radius(self, fz, pressure, omega, vcx=None) -> 'MF62Vertical':
+
+        """
+        Effective rolling radius, omega*effective_radius being the speed the
+        tread rolls at, for turning wheel speeds into longitudinal slip.
+
+        Parameters:
+        - fz (float or array): forces acting in the z direction [N]
+        - pressure (float or array): Tire Pressure [Pa]
+        - omega (float or array): wheel spin velocity [rad/s]
+        - vcx (float or array): longitudinal velocity of the contact centre
+          [m/s], when given the longitudinal slip is returned too
+
+        Returns:
+        - MF62Vertical: effective_radius, rolling_speed and longslip, with
+          the loaded radius and deflection they come from
+        
+        """
+
+        return self.calc_loaded_radius(fz, pressure, omega, vcx=vcx)
+
+    def evaluate_into(self, workspace, longslip, slipangl, fz, pressure, inclangl, vcx, out=None) -> 'MF62Forces':
+
+        """
+        Allocation-free version of evaluate: every intermediate is kept in
+        the workspace and the results are written in place. Pure slip
+        only: turn slip is not modelled (every ZETA factor is 1), use
+        evaluate(turnslip=...) for it.
+        
+        Parameters:
+        - workspace (MF62Workspace): buffers sized for the batch shape
+        - longslip, slipangl, fz, pressure, inclangl, vcx: as for evaluate,
+          arrays of the workspace shape or scalars
+        - out (MF62Forces): optional caller arrays for the results, fields
+          left as None are written to workspace.forces instead
+
+        Returns:
+        - MF62Forces: out, or workspace.forces when out is None
+        
+        """
+
+        if out is None:
+            out = workspace.forces
+        c = self.frozen_coefficients()
+        _evaluate_workspace(c, workspace, out, longslip, slipangl, fz, self._pressure_factors(c, pressure), inclangl, vcx)
+        return out
+
+    def stream(self, blocks, prefetch: int = 2, out_dir=None):
+
+        """
+        Evaluate fx0, fy0 and mz0 over a stream of input blocks, for logs
+        that do not fit in memory. A reader thread pulls up to prefetch
+        blocks ahead from the iterator while the current block is computed
+        with evaluate_into, so disk reads overlap the NumPy work and memory
+        stays bounded by a few blocks whatever the log length. Like
+        evaluate_into, it does not model turn slip.
+
+        Parameters:
+        - blocks (iterable of dict): {input name: 1-D array} per block, e.g.
+          MF62TestRun.blocks(). Missing inputs default to 0 slip and
+          inclangl, NOMPRES and LONGVL.
+        - prefetch (int): blocks read ahead of the one being computed
+        - out_dir (Path): also append the forces to fx0.f64, fy0.f64 and
+          mz0.f64 (raw float64, np.memmap-readable) in this directory
+
+        Yields:
+        - (dict, MF62Forces): each input block and its forces. The forces
+          live in a reused workspace and are overwritten by the next block,
+          copy them to keep them.
+        """
+
+        defaults = dict(longslip=0.0, slipangl=0.0, inclangl=0.0, pressure=self.NOMPRES, vcx=self.LONGVL)
+        outputs = ('fx0', 'fy0', 'mz0')
+        files = []
+        if out_dir is not None:
+            Path(out_dir).mkdir(parents=True, exist_ok=True)
+            files = [open(Path(out_dir) / f'{name}.f64', 'wb') for name in outputs]
+
+        workspace = None
+        try:
+            for block in _read_ahead(blocks, prefetch):
+                size = len(block['fz'])
+                # one workspace for the full-size blocks, replaced once for a shorter tail
+                if workspace is None or workspace.shape != (size,):
+                    workspace = MF62Workspace(size)
+                forces = self.evaluate_into(workspace, *(block.get(name, defaults.get(name)) for name in _SWEEP_AXES))
+                for file, name in zip(files, outputs):
+                    file.write(getattr(forces, name).tobytes())
+                yield block, forces
+        finally:
+            for file in files:
+                file.close()
+
+    def build_lookup(self, grid=None, samples=10_000, seed=0) -> 'MF62Lookup':
+
+        """
+        Tabulate fx0 and fy0 over slip, fz, pressure and inclination angle.
+        Bounds default to the KPU/ALP/FZ/PRES/CAM MIN and MAX fields.
+        
+        Parameters:
+        - grid (dict): per axis ('longslip', 'slipangl', 'fz', 'pressure',
+          'inclangl') either a number of nodes or the evenly spaced node
+          array itself; missing axes use the default node counts
+        - samples (int): random points used to estimate the max
+          interpolation error against the closed-form functions
+        - seed (int): seed for those random points
+
+        Returns:
+        - MF62Lookup: the tables, with max_error filled in
+        
+        """
+
+        bounds = {
+            'longslip': (self.KPUMIN, self.KPUMAX),
+            'slipangl': (self.ALPMIN, self.ALPMAX),
+            'fz': (self.FZMIN, self.FZMAX),
+            'pressure': (self.PRESMIN, self.PRESMAX),
+            'inclangl': (self.CAMMIN, self.CAMMAX),
+        }
+        counts = {'longslip': 801, 'slipangl': 401, 'fz': 33, 'pressure': 13, 'inclangl': 9}
+
+        axes = {}
+        for name, (low, high) in bounds.items():
+            nodes = (grid or {}).get(name, counts[name])
+            if np.ndim(nodes) == 0:
+                nodes = np.linspace(low, high, int(nodes))
+            nodes = np.asarray(nodes, dtype=float)
+            axes[name] = nodes
+
+        load = [axes[name] for name in MF62Lookup.LOAD_AXES]
+        longslip, fz, pressure, inclangl = np.meshgrid(axes['longslip'], *load, indexing='ij')
+        fx0 = self.calc_fx0(longslip, fz, pressure, inclangl)
+        slipangl, fz, pressure, inclangl = np.meshgrid(axes['slipangl'], *load, indexing='ij')
+        fy0 = self.calc_fy0(slipangl, fz, pressure, inclangl)
+        lookup = MF62Lookup(axes, fx0, fy0, {})
+
+        # compare against the closed form at random points inside the bounds
+        rng = np.random.default_rng(seed)
+        points = {name: rng.uniform(nodes[0], nodes[-1], samples) for name, nodes in axes.items()}
+        loadPoints = [points[name] for name in MF62Lookup.LOAD_AXES]
+        lookup.max_error = {
+            'fx0': float(np.max(np.abs(lookup.calc_fx0(points['longslip'], *loadPoints) - self.calc_fx0(points['longslip'], *loadPoints)))),
+            'fy0': float(np.max(np.abs(lookup.calc_fy0(points['slipangl'], *loadPoints) - self.calc_fy0(points['slipangl'], *loadPoints)))),
+        }
+        return lookup
+
+    def frozen_coefficients(self) -> 'MF62Coefficients':
+
+        """
+        Pack the coefficients into an immutable MF62Coefficients record,
+        together with the constants that do not depend on load or slip
+        (fzO, cx, cy, lmux, ...). The pack is built once and rebuilt after
+        any field is changed.
+
+        Returns:
+        - MF62Coefficients: coefficient pack used by the evaluators
+        
+        """
+
+        # read the private slot directly, pydantic's __getattr__ costs microseconds
+        coefficients = self.__pydantic_private__['_coefficients']
+        if coefficients is None:
+            coefficients = _pack_coefficients({name: float(getattr(self, name)) for name in _COEFFICIENT_FIELDS})
+            self._coefficients = coefficients
+        return coefficients
+
+    def with_overrides(self, **arrays) -> 'MF62Coefficients':
+
+        """
+        Copy of the coefficient pack with some coefficients replaced, without
+        building or validating a new MF62tire. Derived constants (fzO, cx,
+        lmux, ...) are recomputed from the overrides.
+
+        A 1-D override of length K becomes a leading sample axis of shape
+        (K, 1), so evaluating K parameter sets against M operating points
+        gives (K, M) outputs. Scalars replace the value for every sample and
+        other shapes are used as given.
+
+        Parameters:
+        - **arrays (float or array): new values keyed by coefficient name
+
+        Returns:
+        - MF62Coefficients: pack for evaluate(..., coefficients=...)
+        
+        """
+
+        return _override_pack(self.frozen_coefficients(), arrays)
+
+    def fit(self, data: dict, stages=None, max_iterations: int = 30, tolerance: float = 1e-6, jacobian_samples: int = 50_000, verbose=False) -> 'MF62tire':
+
+        """
+        Fit the pure-slip coefficients to measured data, one coefficient
+        group at a time: 'longitudinal' (P*X* against fx0), 'lateral'
+        (P*Y* against fy0) and 'aligning' (Q*Z*, PPZ* against mz0, with the
+        lateral coefficients held). Each stage is a Levenberg-Marquardt
+        least-squares fit, starting from this tyre's coefficients. The
+        residuals are evaluated over the whole run in chunks. The Jacobian
+        comes from forward differences of all coefficients of the stage,
+        evaluated as one broadcast over a with_overrides sample axis on an
+        evenly strided subsample of at most jacobian_samples points.
+
+        Parameters:
+        - data (dict): arrays of fz and the measured fx0, fy0 and/or mz0,
+          plus longslip, slipangl, inclangl (default 0), pressure (default
+          NOMPRES) and vcx (default LONGVL). Points where the target is
+          not finite are left out of that stage.
+        - stages (sequence of str): stages to run, in order. Defaults to
+          every stage whose target is in data.
+        - max_iterations (int): iterations per stage
+        - tolerance (float): stop a stage once an accepted step lowers the
+          cost by less than this fraction
+        - jacobian_samples (int): points used for the Jacobian
+        - verbose (bool): print the rms residual of each stage
+
+        Returns:
+        - MF62tire: new tyre with the fitted coefficients
+        
+        """
+
+        if stages is None:
+            stages = [stage for stage, (target, _) in _FIT_STAGES.items() if target in data]
+        if 'fz' not in data:
+            raise ValueError("Fit data needs fz")
+
+        fz = np.asarray(data['fz'], dtype=float)
+        defaults = dict(longslip=0.0, slipangl=0.0, pressure=self.NOMPRES, inclangl=0.0, vcx=self.LONGVL)
+        inputs = {name: np.broadcast_to(np.asarray(data.get(name, defaults.get(name)), dtype=float), fz.shape) for name in _SWEEP_AXES}
+
+        pack = self.frozen_coefficients()
+        fitted = {}
+        for stage in stages:
+            if stage not in _FIT_STAGES:
+                raise ValueError(f"Unknown fit stage {stage!r}, expected one of {', '.join(_FIT_STAGES)}")
+            target, names = _FIT_STAGES[stage]
+            if target not in data:
+                raise ValueError(f"Fit stage {stage!r} needs {target} in data")
+
+            measured = np.broadcast_to(np.asarray(data[target], dtype=float), fz.shape)
+            keep = np.isfinite(measured)
+            for values in inputs.values():
+                keep &= np.isfinite(values)
+            stageInputs = [values[keep] for values in inputs.values()]
+
+            values, rms, iterations = _fit_stage(pack, names, target, stageInputs, measured[keep], max_iterations, tolerance, jacobian_samples)
+            fitted.update(values)
+            pack = _override_pack(pack, values)
+            if verbose:
+                print(f"{stage:<14}{rms:12.4g} rms after {iterations} iterations on {keep.sum()} points")
+
+        return type(self)(**{**self.model_dump(), **fitted})
+
+    def to_tir_file(self, file_path: Path):
+
+        """
+        Write the tyre out as a .tir property file, one [SECTION] per
+        coefficient group, readable by from_tir_file and other MF-Tyre tools.
+        The [UNITS] mass unit is not kept: MASS holds the [INERTIA] mass, so
+        the unit is always written as 'kg' and the mass must be in kg.
+
+        Parameters:
+        - file_path (Path): file to write
+        """
+
+        starts = dict(_TIR_SECTIONS)
+        lines = []
+        for name, field in type(self).model_fields.items():
+            if name in starts:
+                lines.append(f"[{starts[name]}]")
+                if name == 'IXX':
+                    lines.append(_tir_line('MASS', self.MASS, field.description))
+            if name == 'MASS':
+                # MASS is the unit name in [UNITS], its value belongs to [INERTIA];
+                # the unit read from a .tir is dropped, so write the SI one
+                lines.append(_tir_line(name, 'kg', 'mass unit'))
+                continue
+            lines.append(_tir_line(name, getattr(self, name), field.description))
+
+        Path(file_path).write_text('\n'.join(lines)+'\n')
+
+    def pressure_cache_stats(self) -> dict:
+
+        """
+        Hit/miss/eviction counters of the pressure factor cache.
+
+        Returns:
+        - dict: hits, misses, evictions, size, maxsize and hit_rate
+        """
+
+        return self.__pydantic_private__['_pressure_cache'].stats()
+
+    def set_pressure_cache_size(self, maxsize: int):
+
+        """
+        Set how many pressures the factor cache holds before evicting the
+        least recently used one. 0 disables caching.
+
+        Parameters:
+        - maxsize (int): number of cached pressures
+        """
+
+        self.__pydantic_private__['_pressure_cache'].resize(maxsize)
+
+    def _pressure_factors(self, c, pressure) -> 'MF62PressureFactors':
+        # scalar pressures go through the LRU cache, arrays are computed directly
+        if _is_scalar(pressure):
+            return self.__pydantic_private__['_pressure_cache'].get(c, pressure)
+        return _pressure_factors(c, pressure)
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            self._coefficients = None
+
+    def model_copy(self, *, update=None, deep: bool = False) -> 'MF62tire':
+        # update= bypasses __setattr__, so a copy never inherits the pack or its cached pressure factors
+        copy = super().model_copy(update=update, deep=deep)
+        copy.__pydantic_private__['_coefficients'] = None
+        copy.__pydantic_private__['_pressure_cache'] = MF62PressureCache(self.__pydantic_private__['_pressure_cache'].maxsize)
+        return copy
+
+    @classmethod
+    def from_tir_file(cls, file_path: Path, cache=False, cache_dir=None) -> 'MF62tire':
+
+        """
+        Read a tyre from a .tir file.
+
+        With cache=True a binary sidecar (<name>.tir.mf62, next to the file
+        or in cache_dir) holds the coefficient pack and string fields.
+        Later loads mmap it instead of parsing the .tir, and reuse the
+        stored pack, as long as the .tir size and mtime, or failing that
+        its sha1, are unchanged.
+        """
+
+        file_path = Path(file_path)
+        if cache:
+            tire = _load_sidecar(file_path, cache_dir)
+            if tire is not None:
+                return tire
+
+        tire = cls(**_parse_tir_file(file_path))
+        if cache:
+            _write_sidecar(tire, file_path, cache_dir)
+        return tire
+
+    @classmethod
+    def load_directory(cls, directory: Path, pattern='*.tir', workers=None, cache=True, cache_dir=None) -> dict:
+
+        """
+        Read every .tir file in a directory, parsing cache misses in
+        parallel worker processes. Once the Numba backend has run on the TBB
+        threading layer, forking hangs the interpreter at exit, so the
+        misses are then parsed in this process, as in sweep.
+
+        Returns:
+        - dict: {file path: MF62tire}, sorted by path
+        """
+
+        paths = sorted(Path(directory).glob(pattern))
+        tires = {}
+        if cache:
+            for file_path in paths:
+                tire = _load_sidecar(file_path, cache_dir)
+                if tire is not None:
+                    tires[file_path] = tire
+
+        misses = [file_path for file_path in paths if file_path not in tires]
+        if len(misses) > 1 and workers != 1 and not _numba_tbb_running():
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                parsed = list(pool.map(_parse_tir_file, misses))
+        else:
+            parsed = [_parse_tir_file(file_path) for file_path in misses]
+
+        for file_path, data in zip(misses, parsed):
+            tires[file_path] = cls(**data)
+            if cache:
+                _write_sidecar(tires[file_path], file_path, cache_dir)
+
+        return {file_path: tires[file_path] for file_path in paths}
+
+
+# names of every numeric field, in declaration order, as stored in the pack
+_COEFFICIENT_FIELDS = tuple(name for name, field in MF62tire.model_fields.items() if field.annotation in (float, int))
+
+# load- and slip-independent constants precomputed once per tyre
+_DERIVED_FIELDS = (
+    'fzO',      # 4.E1 nominal load
+    'cx',       # 4.E11
+    'cy',       # 4.E21
+    'lmux',     # 4.E8 amu-scaled LMUX
+    'lkyLmuy',  # LKY/LMUY ratio used in 4.E40 and 4.E45
+    'epsCy',    # signed eps guard of 4.E26
+)
+
+
+class MF62Coefficients(namedtuple('MF62Coefficients', _COEFFICIENT_FIELDS + _DERIVED_FIELDS)):
+    """Flat, immutable coefficient pack the evaluators run against"""
+
+    __slots__ = ()
+
+    def as_array(self) -> np.ndarray:
+        """Contiguous float64 copy of the pack, in field order"""
+        return np.array(self, dtype=float)
+
+
+# _IDX_<field>: position of every pack field, so the point kernels read a pack and its as_array() copy alike
+globals().update({f'_IDX_{name}': index for index, name in enumerate(MF62Coefficients._fields)})
+
+
+def _pack_coefficients(values: dict) -> MF62Coefficients:
+
+    """Build a MF62Coefficients from {field name: value}, filling in the derived constants"""
+
+    # 4.E8
+    amu = 10 # FROM MATLAB CODE
+
+    return MF62Coefficients(
+        **values,
+        fzO=values['FNOMIN']*values['LFZO'],
+        cx=values['PCX1']*values['LCX'],
+        cy=values['LCY']*values['PCY1'],
+        lmux=amu*values['LMUX']/(1+(amu-1)*values['LMUX']),
+        lkyLmuy=values['LKY']/values['LMUY'],
+        epsCy=np.copysign(np.finfo(float).eps, values['LCY']*values['PCY1']),
+    )
+
+
+# 4.E2b and every pressure polynomial of the model, see _pressure_factors
+MF62PressureFactors = namedtuple('MF62PressureFactors', (
+    'dpi',
+    'dpi2',
+    'ppx34',    # 4.E13
+    'ppx12',    # 4.E15
+    'ppy34',    # 4.E23
+    'ppy1',     # 4.E25 numerator
+    'ppy2',     # 4.E25 denominator
+    'ppy5',     # 4.E30
+    'ppz1',     # 4.E42
+    'ppz2',     # 4.E47
+    'ppmx1',    # 4.E69
+    'pQsy8',    # 4.E70
+    'pfz1',     # vertical stiffness
+))
+
+
+@_jitable
+def _pressure_factors(c, pressure) -> MF62PressureFactors:
+
+    """Pressure-dependent factors of a coefficient pack, the only terms of the pure-slip kernel that depend on pressure"""
+
+    # 4.E2b
+    dpi = (pressure-c[_IDX_NOMPRES])/c[_IDX_NOMPRES]
+    dpi2 = dpi**2
+
+    return MF62PressureFactors(
+        dpi=dpi,
+        dpi2=dpi2,
+        ppx34=1+c[_IDX_PPX3]*dpi+c[_IDX_PPX4]*dpi2,
+        ppx12=1+c[_IDX_PPX1]*dpi+c[_IDX_PPX2]*dpi2,
+        ppy34=1+c[_IDX_PPY3]*dpi+c[_IDX_PPY4]*dpi2,
+        ppy1=1+c[_IDX_PPY1]*dpi,
+        ppy2=1+c[_IDX_PPY2]*dpi,
+        ppy5=1+c[_IDX_PPY5]*dpi,
+        ppz1=1-c[_IDX_PPZ1]*dpi,
+        ppz2=1+c[_IDX_PPZ2]*dpi,
+        ppmx1=1+c[_IDX_PPMX1]*dpi,
+        pQsy8=(pressure/c[_IDX_NOMPRES])**c[_IDX_QSY8],
+        pfz1=1+c[_IDX_PFZ1]*dpi,
+    )
+
+def _override_pack(pack: MF62Coefficients, overrides: dict) -> MF62Coefficients:
+
+    """Copy of pack with some coefficients replaced, 1-D values becoming a (K, 1) sample axis"""
+
+    values = pack._asdict()
+    for name, value in overrides.items():
+        if name not in _COEFFICIENT_FIELDS:
+            raise ValueError(f"{name!r} is not a numeric MF62tire coefficient")
+        value = np.asarray(value, dtype=float)
+        if value.ndim == 0:
+            value = float(value)
+        elif value.ndim == 1:
+            value = value[:, None]
+        values[name] = value
+
+    for name in _DERIVED_FIELDS:
+        del values[name]
+    return _pack_coefficients(values)
+
+
+# outputs that change sign when a tyre is mirrored to the other side of the vehicle
+_MIRRORED_OUTPUTS = ('fy0', 'mz0', 'mzr0', 'fy', 'mz', 'svyk', 'mx')
+
+
+class TyreSet:
+
+    """
+    N tyres evaluated together: their coefficient packs are stacked into one
+    (N, n_coefficients) array so that all N tyres x M operating points are a
+    single broadcast through the fused evaluator.
+
+    The packs are a snapshot taken at construction, later edits to the
+    MF62tire objects are not seen by the set.
+    """
+
+    def __init__(self, tires, sides=None):
+
+        """
+        Parameters:
+        - tires (sequence of MF62tire): one model per position, the same
+          instance may be repeated
+        - sides (sequence of str): 'LEFT' or 'RIGHT' mounting side per
+          position. A tyre mounted on the other side than its TYRESIDE is
+          mirrored by flipping the signs of slipangl, inclangl and the
+          lateral outputs. Defaults to every tyre's own TYRESIDE.
+        """
+
+        self.tires = tuple(tires)
+        if sides is None:
+            sides = [tire.TYRESIDE for tire in self.tires]
+        if len(sides) != len(self.tires):
+            raise ValueError(f"Got {len(sides)} sides for {len(self.tires)} tyres")
+
+        mirror = []
+        for tire, side in zip(self.tires, sides):
+            side, tyreSide = side.strip("'\" ").upper(), tire.TYRESIDE.strip("'\" ").upper()
+            if side not in ('LEFT', 'RIGHT'):
+                raise ValueError(f"Unknown tyre side {side!r}, expected 'LEFT' or 'RIGHT'")
+            mirror.append(1.0 if side == tyreSide or tyreSide not in ('LEFT', 'RIGHT') else -1.0)
+
+        self.sides = tuple(side.strip("'\" ").upper() for side in sides)
+        self.coefficients = np.stack([tire.frozen_coefficients().as_array() for tire in self.tires])
+        # one (N, 1) column per coefficient, so every pack term broadcasts against (M,) or (N, M) inputs
+        self._pack = MF62Coefficients(*self.coefficients.T[:, :, None])
+        self._mirror = np.array(mirror)[:, None]
+        self._mirrored = bool(np.any(self._mirror < 0))
+
+    def __len__(self) -> int:
+        return len(self.tires)
+
+    def evaluate(self, longslip, slipangl, fz, pressure, inclangl, vcx, intermediates=False, combined=False, moments=False, turnslip=None) -> 'MF62Forces':
+
+        """
+        Evaluate every tyre of the set in one pass, see MF62tire.evaluate.
+
+        Inputs of shape (M,) are shared by all tyres, inputs of shape (N, M)
+        or (N, 1) are per tyre. turnslip, like slipangl, is mirrored.
+
+        Returns:
+        - MF62Forces: every output has shape (N, M)
+        
+        """
+
+        if self._mirrored:
+            slipangl = slipangl*self._mirror
+            inclangl = inclangl*self._mirror
+            if turnslip is not None:
+                turnslip = turnslip*self._mirror
+
+        forces = _evaluate_pack(self._pack, longslip, slipangl, fz, pressure, inclangl, vcx, intermediates, combined, moments, turnslip=turnslip)
+
+        if self._mirrored:
+            for name in _MIRRORED_OUTPUTS:
+                value = getattr(forces, name)
+                if value is not None:
+                    setattr(forces, name, value*self._mirror)
+        return forces
+
+class MF62Memo:
+
+    """
+    Opt-in memoization of MF62tire.evaluate for simulations that revisit
+    nearly identical operating points. Inputs are quantized to a grid of
+    per-input tolerances and every grid cell is evaluated once, at its
+    centre, so results do not depend on which nearby point came first.
+    Cells are held in a bounded LRU, and a batch only evaluates its misses,
+    in one vectorized call.
+    """
+
+    # default quantum per input
+    TOLERANCES = {
+        'longslip': 1e-4,
+        'slipangl': 1e-4,   # [rad]
+        'fz': 1.0,          # [N]
+        'pressure': 100.0,  # [Pa]
+        'inclangl': 1e-4,   # [rad]
+        'vcx': 0.01,        # [m/s]
+    }
+
+    def __init__(self, tire: 'MF62tire', tolerances=None, maxsize: int = 1_000_000, combined=False, moments=False):
+
+        """
+        Parameters:
+        - tire (MF62tire): model to evaluate, edits to it clear the cache
+        - tolerances (dict): overrides of TOLERANCES, {input name: quantum}
+        - maxsize (int): cells held before the least recently used is evicted
+        - combined, moments (bool): as in MF62tire.evaluate
+        """
+
+        self.tire = tire
+        self.tolerances = {**self.TOLERANCES, **(tolerances or {})}
+        self.maxsize = maxsize
+        self.combined = combined
+        self.moments = moments
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._quanta = np.array([self.tolerances[name] for name in _SWEEP_AXES])
+        # cell -> slot of its outputs in _values, least recently used first
+        self._entries = OrderedDict()
+        self._values = None
+        self._free = []
+        self._pack = None
+        self._names = None
+
+    def evaluate(self, longslip, slipangl, fz, pressure, inclangl, vcx) -> 'MF62Forces':
+
+        """
+        Forces at the quantized operating points, see MF62tire.evaluate.
+
+        Returns:
+        - MF62Forces: outputs broadcast to the shape of the inputs
+        """
+
+        # an edited tyre has a new coefficient pack, and every cached cell is stale
+        pack = self.tire.frozen_coefficients()
+        if pack is not self._pack:
+            self._entries.clear()
+            self._free = []
+            self._pack = pack
+
+        inputs = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (longslip, slipangl, fz, pressure, inclangl, vcx)))
+        shape = inputs[0].shape
+        cells = np.rint(np.stack([x.ravel() for x in inputs], axis=1)/self._quanta).astype(np.int64)
+        # the raw bytes of each cell row are its dict key
+        keys = cells.view(np.dtype((np.void, cells.itemsize*len(_SWEEP_AXES)))).ravel().tolist()
+
+        entries = self._entries
+        slots = np.fromiter(map(entries.get, keys, itertools.repeat(-1)), dtype=np.int64, count=len(keys))
+        hit = slots >= 0
+        for key in itertools.compress(keys, hit):
+            entries.move_to_end(key)
+
+        if self._names is not None and hit.all():
+            self.hits += len(keys)
+            table = self._values[slots]
+        else:
+            # evaluate each missing cell once, at its centre: a cell repeated
+            # within the batch is one miss, its repeats are served by it
+            missing = dict.fromkeys(itertools.compress(keys, ~hit))
+            self.misses += len(missing)
+            self.hits += len(keys)-len(missing)
+            centres = np.frombuffer(b''.join(missing), dtype=np.int64).reshape(-1, len(_SWEEP_AXES))*self._quanta
+            forces = self.tire.evaluate(*centres.T, combined=self.combined, moments=self.moments)
+            if self._names is None:
+                self._names = [name for name, value in vars(forces).items() if value is not None]
+                self._values = np.empty((0, len(self._names)))
+            fresh = np.stack([np.broadcast_to(getattr(forces, name), len(missing)) for name in self._names], axis=1)
+
+            table = np.empty((len(keys), len(self._names)))
+            table[hit] = self._values[slots[hit]]
+            row = dict(zip(missing, range(len(missing))))
+            table[~hit] = fresh[[row[key] for key in itertools.compress(keys, ~hit)]]
+            self._store(missing, fresh)
+
+        return MF62Forces(**{name: table[:, i].reshape(shape) for i, name in enumerate(self._names)})
+
+    def _store(self, keys, values):
+
+        """Insert new cells, evicting the least recently used ones beyond maxsize"""
+
+        entries = self._entries
+        # a batch with more new cells than maxsize only keeps its last ones,
+        # the dropped ones count as evicted
+        keep = min(len(keys), max(self.maxsize, 0))
+        self.evictions += len(keys)-keep
+        keys = list(keys)[len(keys)-keep:]
+        values = values[len(values)-keep:]
+        for key, value in zip(keys, values):
+            while len(entries) >= self.maxsize:
+                self._free.append(entries.popitem(last=False)[1])
+                self.evictions += 1
+            if self._free:
+                slot = self._free.pop()
+            else:
+                slot = len(entries)
+                if slot >= len(self._values):
+                    grown = np.empty((min(self.maxsize, max(1024, 2*len(self._values))), len(self._names)))
+                    grown[:len(self._values)] = self._values
+                    self._values = grown
+            self._values[slot] = value
+            entries[key] = slot
+
+    def clear(self):
+        self._entries.clear()
+        self._free = []
+
+    def stats(self) -> dict:
+        lookups = self.hits+self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'hit_rate': self.hits/lookups if lookups else 0.0,
+        }
+
+
+class MF62Transient:
+
+    """
+    First-order relaxation-length slip dynamics for a batch of scenarios,
+    advanced together one time step at a time:
+
+        sigma*d(slip')/dt + |vcx|*slip' = |vcx|*slip
+
+    for longslip and tan(slipangl). Each step integrates this exactly for
+    inputs held over the step, so it stays stable for any dt and at low
+    speed, and the forces are then evaluated at the lagged slips. The
+    state arrays are updated in place.
+    """
+
+    def __init__(self, tire: 'MF62tire', shape, longslip=0.0, slipangl=0.0, coefficients=None):
+
+        """
+        Parameters:
+        - tire (MF62tire): model the forces and relaxation lengths come from
+        - shape (int or tuple): batch shape, e.g. the number of scenarios
+        - longslip, slipangl (float or array): initial transient slips
+        - coefficients (MF62Coefficients): step against this pack, e.g. from
+          with_overrides for one tyre variant per scenario, instead of the
+          model's own. Its sample axis runs along the first batch axis.
+        """
+
+        self.tire = tire
+        self.shape = (shape,) if isinstance(shape, int) else tuple(shape)
+        if coefficients is not None:
+            coefficients = _align_sample_axis(coefficients, self.shape)
+        self.coefficients = coefficients
+        self.longslip = np.empty(self.shape)
+        self._tanAlpha = np.empty(self.shape)
+        self.reset(longslip, slipangl)
+        # relaxation lengths used by the last step
+        self.sigma_kappa = None
+        self.sigma_alpha = None
+
+    @property
+    def slipangl(self) -> np.ndarray:
+        return np.arctan(self._tanAlpha)
+
+    def reset(self, longslip=0.0, slipangl=0.0):
+        self.longslip[...] = longslip
+        self._tanAlpha[...] = np.tan(slipangl)
+
+    def step(self, dt, longslip, slipangl, fz, pressure, inclangl, vcx, intermediates=False, combined=False, moments=False) -> 'MF62Forces':
+
+        """
+        Advance every scenario by dt and evaluate the forces at the new
+        transient slips.
+
+        Parameters:
+        - dt (float or array): time step [s]
+        - longslip, slipangl (float or array): steady-state slips the
+          transient ones relax towards
+        - fz, pressure, inclangl, vcx (float or array): as for
+          MF62tire.evaluate, held over the step
+        - intermediates, combined, moments (bool): as for MF62tire.evaluate
+
+        Returns:
+        - MF62Forces: outputs of the batch shape
+        """
+
+        if self.coefficients is not None:
+            c = self.coefficients
+            pf = _pressure_factors(c, pressure)
+        else:
+            c = self.tire.frozen_coefficients()
+            pf = self.tire._pressure_factors(c, pressure)
+
+        self.sigma_kappa, self.sigma_alpha = _relaxation_lengths(c, fz, pf, inclangl)
+
+        # distance rolled over the step, in relaxation lengths
+        travel = np.abs(vcx)*dt
+        eps = np.finfo(float).eps
+        _relax(self.longslip, longslip, np.exp(-travel/np.maximum(self.sigma_kappa, eps)))
+        _relax(self._tanAlpha, np.tan(slipangl), np.exp(-travel/np.maximum(self.sigma_alpha, eps)))
+
+        return _evaluate_pack(c, self.longslip, self.slipangl, fz, pressure, inclangl, vcx, intermediates, combined, moments, pf)
+
+
+class MF62Road:
+
+    """
+    Road profile for the tandem elliptical cam enveloping model. The road
+    is resampled once on a regular grid of ROAD_INCREMENT, and the height
+    of a cam resting on the road is precomputed at every grid point, so
+    evaluating many wheels and positions only interpolates that index.
+    The cam shape is the same for every load: only the cam spacing and the
+    tracks across the width follow the contact patch size.
+    """
+
+    def __init__(self, tire: 'MF62tire', x, z, y=None, chunk: int = 8192):
+
+        """
+        Parameters:
+        - tire (MF62tire): tyre whose ELLIPS_*, Q_RA*, Q_RB*, ENV_C* and
+          ROAD_* fields shape the envelope
+        - x (array): increasing positions along the road [m]
+        - z (array): road heights [m], (len(x),) for a single line or
+          (len(x), len(y)) for a scanned surface
+        - y (array): increasing lateral positions of the columns of z [m]
+        - chunk (int): grid points per block of the envelope precompute
+        """
+
+        x = np.asarray(x, dtype=float)
+        z = np.asarray(z, dtype=float)
+        if z.ndim == 1:
+            z = z[:, None]
+            y = np.zeros(1)
+        elif y is None:
+            raise ValueError("A 2-D road profile needs its lateral positions y")
+        if z.shape != (len(x), len(y)):
+            raise ValueError(f"z has shape {z.shape}, expected {(len(x), len(y))}")
+
+        self.tire = tire
+        self.increment = tire.ROAD_INCREMENT
+        self.x0 = x[0]
+        self.y = np.asarray(y, dtype=float)
+        # rounded, a span like 0.29/0.01 = 28.999... must not lose its last sample
+        grid = self.x0+self.increment*np.arange(int(round((x[-1]-x[0])/self.increment))+1)
+        self.heights = np.stack([np.interp(grid, x, column) for column in z.T], axis=1)
+
+        rO = tire.UNLOADED_RADIUS
+        basis = _ellipse_basis(tire.ELLIPS_LENGTH*rO, tire.ELLIPS_HEIGHT*rO, tire.ELLIPS_ORDER, self.increment)
+        half = len(basis)//2
+
+        # lowest point of a cam centred on each grid point, resting on the road
+        padded = np.pad(self.heights, ((half, half), (0, 0)), mode='edge')
+        self.envelope = np.empty_like(self.heights)
+        for start in range(0, len(grid), chunk):
+            stop = min(start+chunk, len(grid))
+            windows = np.lib.stride_tricks.sliding_window_view(padded[start:stop+2*half], len(basis), axis=0)
+            np.max(windows-basis, axis=-1, out=self.envelope[start:stop])
+        # steps beyond ELLIPS_MAX_STEP lift the cam no further
+        np.minimum(self.envelope, self.heights+tire.ELLIPS_MAX_STEP, out=self.envelope)
+
+    def evaluate(self, x, y=0.0, fz=None, pressure=None) -> 'MF62RoadPlane':
+
+        """
+        Effective road plane for every wheel position at once.
+
+        Parameters:
+        - x (float or array): wheel centre position along the road [m]
+        - y (float or array): wheel centre lateral position [m]
+        - fz (float or array): forces acting in the z direction [N],
+          FNOMIN when None
+        - pressure (float or array): Tire Pressure [Pa], NOMPRES when None
+
+        Returns:
+        - MF62RoadPlane: height, slope and banking broadcast to the inputs
+        
+        """
+
+        tire = self.tire
+        c = tire.frozen_coefficients()
+        fz = c.FNOMIN if fz is None else fz
+        pressure = c.NOMPRES if pressure is None else pressure
+        x, y, fz, pressure = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (x, y, fz, pressure)))
+
+        # contact patch size at the deflection of this load
+        rO = c.UNLOADED_RADIUS
+        rho = tire.calc_loaded_radius(fz, pressure).deflection/rO
+        halfLength = rO*(c.Q_RA2*rho+c.Q_RA1*np.sqrt(rho))
+        halfWidth = c.WIDTH*(c.Q_RB2*rho+c.Q_RB1*np.cbrt(rho))
+
+        # front and rear cams ELLIPS_SHIFT half lengths apart, on ELLIPS_NWIDTH tracks
+        spacing = c.ELLIPS_SHIFT*halfLength
+        offset = c.ROAD_DIRECTION*spacing/2
+        tracks = np.linspace(-1, 1, int(c.ELLIPS_NWIDTH)) if c.ELLIPS_NWIDTH > 1 else np.zeros(1)
+        yTrack = y[..., None]+tracks*halfWidth[..., None]
+        front = self._interpolate(self.envelope, (x+offset)[..., None], yTrack)
+        rear = self._interpolate(self.envelope, (x-offset)[..., None], yTrack)
+
+        trackHeights = (front+rear)/2
+        height = trackHeights.mean(axis=-1)
+        slope = np.arctan(c.ROAD_DIRECTION*(front-rear).mean(axis=-1)/np.maximum(spacing, np.finfo(float).eps))
+
+        # least-squares lateral slope over the tracks
+        lateral = tracks*halfWidth[..., None]
+        spread = (lateral**2).sum(axis=-1)
+        tilt = ((trackHeights-height[..., None])*lateral).sum(axis=-1)/np.where(spread > 0, spread, 1)
+        banking = np.arctan(np.where(spread > 0, tilt, 0.0))
+
+        # ENV_C1 and ENV_C2 pull the plane back towards the bare road under the wheel centre
+        road = self._interpolate(self.heights, x, y)
+        height = road+(1-c.ENV_C1)*(height-road)
+        slope = (1-c.ENV_C2)*slope
+
+        return MF62RoadPlane(height=height, slope=slope, banking=banking, half_length=halfLength, half_width=halfWidth)
+
+    def _interpolate(self, table, x, y) -> np.ndarray:
+
+        """Bilinear interpolation of a grid table, clamped to the edges of the road"""
+
+        u = np.clip((x-self.x0)/self.increment, 0, len(table)-1)
+        i = np.minimum(u.astype(np.intp), len(table)-2) if len(table) > 1 else np.zeros(u.shape, dtype=np.intp)
+        fu = u-i
+        if len(self.y) == 1:
+            i1 = np.minimum(i+1, len(table)-1)
+            return table[i, 0]*(1-fu)+table[i1, 0]*fu
+
+        y = np.clip(y, self.y[0], self.y[-1])
+        j = np.clip(np.searchsorted(self.y, y, side='right')-1, 0, len(self.y)-2)
+        fv = (y-self.y[j])/(self.y[j+1]-self.y[j])
+        i1 = np.minimum(i+1, len(table)-1)
+        return ((table[i, j]*(1-fv)+table[i, j+1]*fv)*(1-fu)
+                + (table[i1, j]*(1-fv)+table[i1, j+1]*fv)*fu)
+
+
+# field name -> python type, looked up once instead of per .tir line
+_FIELD_TYPES = {name: field.annotation for name, field in MF62tire.model_fields.items()}
+_STRING_FIELDS = tuple(name for name, field_type in _FIELD_TYPES.items() if field_type is str)
+
+# .tir sections, keyed by the first field written under each
+_TIR_SECTIONS = (
+    ('FILE_TYPE', 'MDI_HEADER'),
+    ('LENGTH', 'UNITS'),
+    ('FITTYP', 'MODEL'),
+    ('UNLOADED_RADIUS', 'DIMENSION'),
+    ('INFLPRES', 'OPERATING_CONDITIONS'),
+    ('IXX', 'INERTIA'),
+    ('FNOMIN', 'VERTICAL'),
+    ('LONGITUDINAL_STIFFNESS', 'STRUCTURAL'),
+    ('Q_RA1', 'CONTACT_PATCH'),
+    ('PRESMIN', 'INFLATION_PRESSURE_RANGE'),
+    ('FZMIN', 'VERTICAL_FORCE_RANGE'),
+    ('KPUMIN', 'LONG_SLIP_RANGE'),
+    ('ALPMIN', 'SLIP_ANGLE_RANGE'),
+    ('CAMMIN', 'INCLINATION_ANGLE_RANGE'),
+    ('LFZO', 'SCALING_COEFFICIENTS'),
+    ('PCX1', 'LONGITUDINAL_COEFFICIENTS'),
+    ('QSX1', 'OVERTURNING_COEFFICIENTS'),
+    ('PCY1', 'LATERAL_COEFFICIENTS'),
+    ('QSY1', 'ROLLING_COEFFICIENTS'),
+    ('QBZ1', 'ALIGNING_COEFFICIENTS'),
+    ('PDXP1', 'TURNSLIP_COEFFICIENTS'),
+)
+
+
+def _tir_line(name, value, description) -> str:
+
+    """One 'NAME = value $description' line of a .tir file"""
+
+    if isinstance(value, str):
+        value = f"'{value}'"
+    elif isinstance(value, float) and value.is_integer():
+        value = str(int(value))
+    else:
+        value = repr(value)
+    comment = f"  ${description}" if description else ''
+    return f"{name:<25}= {value}{comment}"
+
+
+# fit() stages: measured output and the coefficients fitted against it
+_FIT_STAGES = {
+    'longitudinal': ('fx0', (
+        'PCX1', 'PDX1', 'PDX2', 'PDX3', 'PEX1', 'PEX2', 'PEX3', 'PEX4', 'PKX1', 'PKX2', 'PKX3',
+        'PHX1', 'PHX2', 'PVX1', 'PVX2', 'PPX1', 'PPX2', 'PPX3', 'PPX4',
+    )),
+    'lateral': ('fy0', (
+        'PCY1', 'PDY1', 'PDY2', 'PDY3', 'PEY1', 'PEY2', 'PEY3', 'PEY4', 'PEY5',
+        'PKY1', 'PKY2', 'PKY3', 'PKY4', 'PKY5', 'PKY6', 'PKY7',
+        'PHY1', 'PHY2', 'PVY1', 'PVY2', 'PVY3', 'PVY4', 'PPY1', 'PPY2', 'PPY3', 'PPY4', 'PPY5',
+    )),
+    'aligning': ('mz0', (
+        'QBZ1', 'QBZ2', 'QBZ3', 'QBZ4', 'QBZ5', 'QBZ9', 'QBZ10', 'QCZ1',
+        'QDZ1', 'QDZ2', 'QDZ3', 'QDZ4', 'QDZ6', 'QDZ7', 'QDZ8', 'QDZ9', 'QDZ10', 'QDZ11',
+        'QEZ1', 'QEZ2', 'QEZ3', 'QEZ4', 'QEZ5', 'QHZ1', 'QHZ2', 'QHZ3', 'QHZ4', 'PPZ1', 'PPZ2',
+    )),
+}
+
+# points per NumPy call while fitting: bounds the temporaries of one evaluation
+_FIT_BLOCK = 262_144
+
+
+def _fit_residual(pack, target, inputs, measured) -> np.ndarray:
+
+    """Model minus measurement over a whole run, evaluated in chunks"""
+
+    forces = _evaluate_chunked(lambda *chunk: _evaluate_pack(pack, *chunk), inputs, 1, _FIT_BLOCK)
+    return getattr(forces, target)-measured
+
+
+def _fit_jacobian(pack, names, params, target, inputs, measured, residual) -> np.ndarray:
+
+    """Forward-difference Jacobian of the residual, every coefficient perturbed in one sample-axis broadcast"""
+
+    steps = 1e-7*np.maximum(np.abs(params), 1)
+    perturbed = _override_pack(pack, {name: params[i]+steps[i]*(np.arange(len(names)) == i) for i, name in enumerate(names)})
+
+    jacobian = np.empty((len(residual), len(names)))
+    block = max(1, _FIT_BLOCK//len(names))
+    for start in range(0, len(residual), block):
+        stop = start+block
+        forces = _evaluate_pack(perturbed, *(values[start:stop] for values in inputs))
+        jacobian[start:stop] = (getattr(forces, target)-measured[start:stop]-residual[start:stop]).T/steps
+    return jacobian
+
+
+def _fit_stage(pack, names, target, inputs, measured, max_iterations, tolerance, jacobian_samples):
+
+    """Levenberg-Marquardt fit of one coefficient group, returns ({name: value}, rms, iterations)"""
+
+    params = np.array([getattr(pack, name) for name in names])
+    residual = _fit_residual(pack, target, inputs, measured)
+    cost = residual@residual
+
+    # the Jacobian runs on an evenly strided subsample of the run
+    stride = max(1, -(-len(measured)//jacobian_samples))
+    sampleInputs = [values[::stride] for values in inputs]
+    sampleMeasured = measured[::stride]
+
+    damping = 1e-3
+    iteration = 0
+    for iteration in range(1, max_iterations+1):
+        sampleResidual = residual[::stride]
+        jacobian = _fit_jacobian(pack, names, params, target, sampleInputs, sampleMeasured, sampleResidual)
+        normal = jacobian.T@jacobian
+        gradient = jacobian.T@sampleResidual
+
+        # coefficients the data does not excite (e.g. PPX* at one pressure) stay fixed
+        diagonal = np.diag(normal).copy()
+        active = diagonal > 1e-12*diagonal.max() if diagonal.max() > 0 else np.zeros(len(names), bool)
+        if not active.any():
+            break
+        normal = normal[np.ix_(active, active)]
+        diagonal = diagonal[active]
+
+        improved = False
+        while damping < 1e12:
+            step = np.zeros(len(names))
+            try:
+                step[active] = np.linalg.solve(normal+damping*np.diag(diagonal), -gradient[active])
+            except np.linalg.LinAlgError:
+                damping *= 4
+                continue
+            trialParams = params+step
+            trialPack = _override_pack(pack, dict(zip(names, trialParams)))
+            trialResidual = _fit_residual(trialPack, target, inputs, measured)
+            trialCost = trialResidual@trialResidual
+            if np.isfinite(trialCost) and trialCost < cost:
+                improved = True
+                break
+            damping *= 4
+
+        if not improved:
+            break
+        decrease = (cost-trialCost)/cost
+        params, pack, residual, cost = trialParams, trialPack, trialResidual, trialCost
+        damping = max(damping/3, 1e-12)
+        if decrease < tolerance:
+            break
+
+    return dict(zip(names, params.tolist())), math.sqrt(cost/max(1, len(measured))), iteration
+
+
+# sidecar layout: header, float64 coefficient pack, utf-8 JSON of the string fields.
+# The header holds the cache key (.tir size, mtime and sha1) and a checksum of the
+# pack field names so sidecars from another version of this file are rejected.
+_SIDECAR_HEADER = struct.Struct('<8sqq40sIII4x')
+_SIDECAR_MAGIC = b'MF62TIR1'
+_SIDECAR_LAYOUT = zlib.crc32(','.join(MF62Coefficients._fields).encode())
+
+
+def _parse_tir_file(file_path: Path) -> dict:
+
+    """Parse a .tir file in one pass into {field name: typed value}"""
+
+    data = {}
+    section = None
+    with open(file_path, 'r') as file:
+        for line in file:
+            line = line.strip()
+            if not line or line[0] == '$':
+                continue
+            if line[0] == '[':
+                section = line.strip('[]')
+                continue
+            key, sep, value = line.partition('=')
+            field_type = _FIELD_TYPES.get(key.strip())
+            if not sep or field_type is None:
+                continue
+            if section == 'UNITS' and field_type is not str and value.lstrip().startswith("'"):
+                # unit name of a numeric field, e.g. MASS = 'kg', its value is in [INERTIA]
+                continue
+            try:
+                data[key.strip()] = field_type(value.split()[0].strip("'"))
+            except (ValueError, IndexError) as e:
+                print(f"Skiped {line} of tir file for {e}")
+    return data
+
+
+def _file_sha1(file_path: Path) -> bytes:
+    return hashlib.sha1(Path(file_path).read_bytes()).hexdigest().encode()
+
+
+def _sidecar_path(file_path: Path, cache_dir) -> Path:
+    directory = file_path.parent if cache_dir is None else Path(cache_dir)
+    return directory / (file_path.name + '.mf62')
+
+
+def _write_sidecar(tire: MF62tire, file_path: Path, cache_dir=None):
+
+    """Store the tyre's coefficient pack and string fields for file_path"""
+
+    stat = file_path.stat()
+    pack = tire.frozen_coefficients().as_array()
+    strings = json.dumps({name: getattr(tire, name) for name in _STRING_FIELDS}).encode()
+    header = _SIDECAR_HEADER.pack(_SIDECAR_MAGIC, stat.st_size, stat.st_mtime_ns, _file_sha1(file_path),
+                                  _SIDECAR_LAYOUT, pack.size, len(strings))
+
+    sidecar = _sidecar_path(file_path, cache_dir)
+    sidecar.parent.mkdir(parents=True, exist_ok=True)
+    sidecar.write_bytes(header + pack.tobytes() + strings)
+
+
+def _load_sidecar(file_path: Path, cache_dir=None) -> Optional[MF62tire]:
+
+    """The cached tyre for file_path, or None when the sidecar is missing or stale"""
+
+    sidecar = _sidecar_path(file_path, cache_dir)
+    try:
+        with open(sidecar, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            magic, size, mtime_ns, sha1, layout, packSize, stringsSize = _SIDECAR_HEADER.unpack_from(view)
+            if magic != _SIDECAR_MAGIC or layout != _SIDECAR_LAYOUT or packSize != len(MF62Coefficients._fields):
+                return None
+            stat = file_path.stat()
+            touched = (size, mtime_ns) != (stat.st_size, stat.st_mtime_ns)
+            if touched and sha1 != _file_sha1(file_path):
+                return None
+            offset = _SIDECAR_HEADER.size
+            pack = MF62Coefficients(*np.frombuffer(view, dtype=float, count=packSize, offset=offset).tolist())
+            offset += 8*packSize
+            strings = json.loads(view[offset:offset+stringsSize])
+        # plain-float validation in pydantic-core is cheaper than model_construct
+        tire = MF62tire(**{name: getattr(pack, name) for name in _COEFFICIENT_FIELDS}, **strings)
+    except (OSError, ValueError, TypeError, struct.error):
+        # unreadable or corrupted sidecar, parse the .tir instead
+        return None
+
+    tire._coefficients = pack
+    if touched:
+        # same content under a new mtime: refresh the key so the next load skips the sha1
+        _write_sidecar(tire, file_path, cache_dir)
+    return tire
+
+
+# bumped when the .mf62run cache layout changes
+_RUN_CACHE_VERSION = 1
+
+
+def _run_cache_path(file_path: Path, cache_dir) -> Path:
+    directory = file_path.parent if cache_dir is None else Path(cache_dir)
+    return directory / (file_path.name + '.mf62run')
+
+
+def _read_run_meta(cache: Path) -> Optional[dict]:
+
+    """meta.json of a run cache, None when missing, unreadable or from another layout"""
+
+    try:
+        meta = json.loads((cache / 'meta.json').read_text())
+    except (OSError, ValueError):
+        return None
+    if meta.get('version') != _RUN_CACHE_VERSION:
+        return None
+    return meta
+
+
+def _is_number(token: str) -> bool:
+    try:
+        float(token)
+    except ValueError:
+        return False
+    return True
+
+
+def _convert_run(file_path: Path, cache: Path, chunk_rows: int) -> dict:
+
+    """Stream a text run into one raw float64 file per channel, chunk_rows lines at a time"""
+
+    cache.mkdir(parents=True, exist_ok=True)
+    (cache / 'meta.json').unlink(missing_ok=True)
+    stat = file_path.stat()
+
+    with open(file_path, 'r') as file:
+        # leading text lines: description, channel names, units
+        preamble, first = [], None
+        for line in file:
+            if not line.strip():
+                continue
+            tokens = line.replace(',', ' ').split()
+            if all(_is_number(token) for token in tokens):
+                first = line
+                break
+            preamble.append(line)
+        if not preamble:
+            raise ValueError(f"{file_path} has no channel name line")
+
+        known = set(MF62TestRun.CHANNELS.values())
+        named = [line for line in preamble if known.intersection(line.replace(',', ' ').split())]
+        header = named[0] if named else preamble[-1]
+
+        delimiter = ',' if ',' in header else None
+        channels = [name.strip() for name in (header.split(',') if delimiter else header.split())]
+        outputs = [open(cache / f'{i}.f64', 'wb') for i in range(len(channels))]
+        rows = 0
+        try:
+            lines = itertools.chain([first] if first else [], file)
+            while True:
+                chunk = [line for line in itertools.islice(lines, chunk_rows) if line.strip()]
+                if not chunk:
+                    break
+                values = np.loadtxt(chunk, delimiter=delimiter, dtype='<f8', ndmin=2)
+                if values.shape[1] != len(channels):
+                    raise ValueError(f"{file_path} has {values.shape[1]} columns but {len(channels)} channel names")
+                for output, column in zip(outputs, values.T):
+                    output.write(np.ascontiguousarray(column).tobytes())
+                rows += len(values)
+        finally:
+            for output in outputs:
+                output.close()
+
+    # written last, so an interrupted conversion is redone on the next open
+    meta = dict(version=_RUN_CACHE_VERSION, size=stat.st_size, mtime_ns=stat.st_mtime_ns, channels=channels, rows=rows)
+    (cache / 'meta.json').write_text(json.dumps(meta))
+    return meta
+
+
+def _read_ahead(iterable, depth: int):
+
+    """Iterate over iterable while a background thread reads up to depth items ahead"""
+
+    items = Queue(maxsize=max(1, depth))
+    stop = threading.Event()
+    finished = object()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except Full:
+                continue
+        return False
+
+    def reader():
+        try:
+            for item in iterable:
+                if not put((item, None)):
+                    return
+        except BaseException as error:
+            put((finished, error))
+            return
+        put((finished, None))
+
+    thread = threading.Thread(target=reader, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, error = items.get()
+            if item is finished:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        # a consumer that stops early releases the reader
+        stop.set()
+
+
+# ZETA factors of the turn-slip extension, see _turn_slip_factors
+MF62TurnSlip = namedtuple('MF62TurnSlip', ('zeta0', 'zeta1', 'zeta2', 'zeta3', 'zeta4', 'zeta5', 'zeta6', 'zeta7', 'zeta8'))
+
+
+def _turn_slip_factors(c, phi, longslip, slipangl, fz, pf, inclangl, vcx) -> MF62TurnSlip:
+
+    """ZETA0 - ZETA8 at spin phi [1/m], reducing the peak forces, stiffnesses and residual moment as the path curves"""
+
+    eps = np.finfo(float).eps
+    rO = c.UNLOADED_RADIUS
+    rOPhi = rO*phi
+    rOPhiAbs = np.abs(rOPhi)
+
+    fzO = c.fzO
+    dfz = (fz-fzO)/fzO
+    gammaAst = np.sin(inclangl)
+
+    # camber enters through phi, so its explicit shy and dr terms are switched off
+    zeta0 = 0.0
+
+    # peak fx0 reduction
+    bxp = c.PDXP1*(1+c.PDXP2*dfz)*np.cos(np.arctan(c.PDXP3*longslip))
+    zeta1 = np.cos(np.arctan(bxp*rOPhi))
+
+    # peak fy0 reduction
+    byp = c.PDYP1*(1+c.PDYP2*dfz)*np.cos(np.arctan(c.PDYP3*np.tan(slipangl)))
+    zeta2 = np.cos(np.arctan(byp*(rOPhiAbs+c.PDYP4*np.sqrt(rOPhiAbs))))
+
+    # cornering stiffness reduction
+    zeta3 = np.cos(np.arctan(c.PKYP1*rOPhi**2))
+
+    # 4.E25 with zeta3, at zero camber and at inclangl
+    kyaO = _kya(c, fz, pf, 0.0)*zeta3
+    kya = _kya(c, fz, pf, gammaAst)*zeta3
+    kyaO_ = kyaO + eps*np.where(np.sign(kyaO) == 0, 1, np.sign(kyaO))
+    kya_ = kya + eps*np.where(np.sign(kya) == 0, 1, np.sign(kya))
+
+    # 4.E28 with zeta2, 4.E30
+    svyg, kygO = _camber_terms(c, fz, dfz, pf, gammaAst)
+    svyg = svyg*zeta2
+
+    # share of camber that acts as spin
+    epsGamma = c.PECP1*(1+c.PECP2*dfz)
+
+    # horizontal shift of fy0 from spin
+    chyp = c.PHYP1
+    dhyp = (c.PHYP2+c.PHYP3*dfz)*np.sign(vcx)
+    ehyp = np.minimum(c.PHYP4, 1.0)
+    denominator = chyp*dhyp*kyaO_
+    bhyp = kygO/(1-epsGamma)/(denominator + eps*np.where(np.sign(denominator) == 0, 1, np.sign(denominator)))
+    bhypPhi = bhyp*rOPhi
+    shyp = dhyp*np.sin(chyp*np.arctan(bhypPhi-ehyp*(bhypPhi-np.arctan(bhypPhi))))
+    zeta4 = 1+shyp-svyg/kya_
+
+    # pneumatic trail and residual moment stiffness reductions
+    zeta5 = np.cos(np.arctan(c.QDTP1*rOPhi))
+    zeta6 = np.cos(np.arctan(c.QBRP1*rOPhi))
+
+    # 4.E23, residual moment from spin and its limit at large spin
+    muy = _muy(c, dfz, pf, gammaAst)
+    mzpInf = np.maximum(c.QCRP1*np.abs(muy)*rO*fz*np.sqrt(np.maximum(fz, 0)/fzO)*c.LMP, eps)
+    cdrp = c.QDRP1
+    ddrp = mzpInf/np.sin(0.5*np.pi*cdrp)
+    kzgrO = fz*rO*(c.QDZ8+c.QDZ9*dfz)*pf.ppz2*c.LKZC
+    bdrp = kzgrO/(cdrp*ddrp*(1-epsGamma))
+    drp = ddrp*np.sin(cdrp*np.arctan(bdrp*rOPhi))
+    zeta8 = 1+drp
+
+    # residual moment shape at 90 degrees slip angle (pure slip, so gyk = 1)
+    mzp90 = mzpInf*(2/np.pi)*np.arctan(c.QCRP2*rOPhiAbs)
+    zeta7 = (2/np.pi)*np.arccos(np.clip(mzp90/np.maximum(np.abs(drp), eps), -1, 1))
+
+    return MF62TurnSlip(zeta0, zeta1, zeta2, zeta3, zeta4, zeta5, zeta6, zeta7, zeta8)
+
+
+def _evaluate_pack(c, longslip, slipangl, fz, pressure, inclangl, vcx, intermediates=False, combined=False, moments=False, pf=None, turnslip=None) -> MF62Forces:
+
+    """Fused Fx0, Fy0 and Mz0 kernel behind MF62tire.evaluate, run against a coefficient pack"""
+
+    # 4.E2b and its pressure polynomials, unless already cached for this pressure
+    if pf is None:
+        pf = _pressure_factors(c, pressure)
+
+    # ZETA factors, all 1 without turn slip and then left out of the terms entirely
+    z = None if turnslip is None else _turn_slip_factors(c, turnslip, longslip, slipangl, fz, pf, inclangl, vcx)
+
+    # ----- longitudinal ----- #
+
+    # 4.E10 - 4.E18
+    longitudinal, kxk = _longitudinal_shape(c, fz, pf, inclangl, longslip, z=z)
+
+    # 4.E9
+    fx0 = _magic_formula_curve(longitudinal, longslip+longitudinal.SH)
+
+    # ----- lateral ----- #
+
+    # 4.E20 - 4.E30, 4.E39
+    lateral, kya, kya_, muy = _lateral_shape(c, fz, pf, inclangl, slipangl, z=z)
+
+    # 4.E19
+    fy0 = _magic_formula_curve(lateral, slipangl+lateral.SH)
+
+    # ----- aligning ----- #
+
+    # 4.E34 - 4.E47
+    trail, residual, alphaAst = _aligning_shape(c, fz, pf, inclangl, slipangl, vcx, lateral, kya_, z)
+    alphat = alphaAst+trail.SH
+    alphar = alphaAst+residual.SH
+
+    # 4.E33
+    tO = _magic_formula_curve(trail, alphat, np.cos)
+
+    # 4.E32, 4.E36
+    mzrO = _magic_formula_curve(residual, alphar, np.cos)
+    mz0 = -tO*fy0 + mzrO
+
+    forces = MF62Forces(fx0=fx0, fy0=fy0, mz0=mz0)
+    if intermediates:
+        forces.kxk, forces.kya, forces.trail, forces.mzr0 = kxk, kya, tO, mzrO
+    if not combined:
+        if moments:
+            forces.mx = _mx(c, fy0, fz, pf, inclangl)
+            forces.my = _my(c, fx0, fz, pf, inclangl, vcx)
+        return forces
+
+    # ----- combined slip ----- #
+
+    fzO = c.fzO
+    rO = c.UNLOADED_RADIUS
+    dfz = (fz-fzO)/fzO
+    gammaAst = np.sin(inclangl)
+    gammaAst2 = gammaAst**2
+
+    # 4.E54 - 4.E57
+    bxa = (c.RBX1+c.RBX3*gammaAst2)*np.cos(np.arctan(c.RBX2*longslip))*c.LXAL
+    cxa = c.RCX1
+    exa = c.REX1+c.REX2*dfz
+    shxa = c.RHX1
+
+    # 4.E53
+    alphas = alphaAst+shxa
+
+    # 4.E52, 4.E51
+    bxaShxa = bxa*shxa
+    gxa0 = np.cos(cxa*np.arctan(bxaShxa-exa*(bxaShxa-np.arctan(bxaShxa))))
+    bxaAlphas = bxa*alphas
+    gxa = np.cos(cxa*np.arctan(bxaAlphas-exa*(bxaAlphas-np.arctan(bxaAlphas))))/gxa0
+
+    # 4.E50
+    fx = gxa*fx0
+
+    # 4.E67, 4.E66
+    dvyk = muy*fz*(c.RVY1+c.RVY2*dfz+c.RVY3*gammaAst)*np.cos(np.arctan(c.RVY4*alphaAst))
+    if z is not None:
+        dvyk = dvyk*z.zeta2
+    svyk = dvyk*np.sin(c.RVY5*np.arctan(c.RVY6*longslip))*c.LVYKA
+
+    # 4.E62 - 4.E65
+    byk = (c.RBY1+c.RBY4*gammaAst2)*np.cos(np.arctan(c.RBY2*(alphaAst-c.RBY3)))*c.LYKA
+    cyk = c.RCY1
+    eyk = c.REY1+c.REY2*dfz
+    shyk = c.RHY1+c.RHY2*dfz
+
+    # 4.E61
+    kappas = longslip+shyk
+
+    # 4.E60, 4.E59
+    bykShyk = byk*shyk
+    gyk0 = np.cos(cyk*np.arctan(bykShyk-eyk*(bykShyk-np.arctan(bykShyk))))
+    bykKappas = byk*kappas
+    gyk = np.cos(cyk*np.arctan(bykKappas-eyk*(bykKappas-np.arctan(bykKappas))))/gyk0
+
+    # 4.E58
+    fy = gyk*fy0+svyk
+
+    # 4.E77, 4.E78
+    kappaEq2 = (kxk/kya_)**2*longslip**2
+    alphatEq = np.sqrt(alphat**2+kappaEq2)*np.sign(alphat)
+    alpharEq = np.sqrt(alphar**2+kappaEq2)*np.sign(alphar)
+
+    # 4.E76
+    s = rO*(c.SSZ1+c.SSZ2*(fy/fzO)+(c.SSZ3+c.SSZ4*dfz)*gammaAst)*c.LS
+
+    # 4.E72
+    t = _magic_formula_curve(trail, alphatEq, np.cos)
+
+    # 4.E75
+    mzr = _magic_formula_curve(residual, alpharEq, np.cos)
+
+    # 4.E74, 4.E73, 4.E71
+    mz = -t*(fy-svyk)+mzr+s*fx
+
+    forces.fx, forces.fy, forces.mz = fx, fy, mz
+    if intermediates:
+        forces.gxa, forces.gyk, forces.svyk, forces.s = gxa, gyk, svyk, s
+    if moments:
+        forces.mx = _mx(c, fy, fz, pf, inclangl)
+        forces.my = _my(c, fx, fz, pf, inclangl, vcx)
+    return forces
+
+
+def _mx(c, fy, fz, pf, inclangl):
+
+    """Overturning moment Mx (4.E69) from a coefficient pack"""
+
+    rO = c.UNLOADED_RADIUS
+    fyFzO = fy/c.fzO
+    fzFzO = fz/c.fzO
+    gammaAbs = np.abs(inclangl)
+
+    return rO*fz*c.LMX*(c.QSX1*c.LVMX - c.QSX2*inclangl*pf.ppmx1 + c.QSX3*fyFzO
+                        + c.QSX4*np.cos(c.QSX5*np.arctan((c.QSX6*fzFzO)**2))*np.sin(c.QSX7*inclangl+c.QSX8*np.arctan(c.QSX9*fyFzO))
+                        + c.QSX10*np.arctan(c.QSX11*fzFzO)*inclangl) \
+        + rO*c.LMX*(fy*(c.QSX13+c.QSX14*gammaAbs) - fz*c.QSX12*inclangl*gammaAbs)
+
+
+def _my(c, fx, fz, pf, inclangl, vcx):
+
+    """Rolling resistance moment My (4.E70) from a coefficient pack"""
+
+    vxVref = vcx/c.LONGVL
+
+    return -c.UNLOADED_RADIUS*c.fzO*c.LMY*(c.QSY1 + c.QSY2*fx/c.fzO + c.QSY3*np.abs(vxVref) + c.QSY4*vxVref**4
+                                           + (c.QSY5+c.QSY6*fz/c.fzO)*inclangl**2) \
+        * (fz/c.fzO)**c.QSY7*pf.pQsy8
+
+
+def _magic_formula_slope(u, e, C):
+
+    """sin(C*atan(phi)) with phi = u - e*(u - atan(u)), and its derivatives d/dphi, dphi/du, dphi/de"""
+
+    atanU = np.arctan(u)
+    phi = u-e*(u-atanU)
+    theta = C*np.arctan(phi)
+    return np.sin(theta), np.cos(theta)*C/(1+phi**2), 1-e*u**2/(1+u**2), -(u-atanU)
+
+
+def _evaluate_jacobian_pack(c, longslip, slipangl, fz, pf, inclangl) -> 'MF62Jacobian':
+
+    """Fx0 and Fy0 of _evaluate_pack together with their chain-rule derivatives (suffix _f: d/dfz, _g: d/dinclangl)"""
+
+    # the values come from the shared shape helpers, only their derivatives
+    # are written out here; turn slip is not modelled, so every ZETA factor is 1
+    eps = np.finfo(float).eps
+    (bx, cx, dx, ex, shx, sVx), kxk = _longitudinal_shape(c, fz, pf, inclangl, longslip)
+    (by, cy, dy, ey, shy, svy), kya, kya_, muy = _lateral_shape(c, fz, pf, inclangl, slipangl)
+
+    # 4.E1, 4.E2a
+    fzO = c.fzO
+    dfz = (fz-fzO)/fzO
+    dfz_f = 1/fzO
+
+    # 4.E4
+    gammaAst = np.sin(inclangl)
+    gammaAst_g = np.cos(inclangl)
+    gammaAst2 = gammaAst**2
+    gammaAst2_g = 2*gammaAst*gammaAst_g
+    gammaAstAbs_g = np.sign(gammaAst)*gammaAst_g
+
+    # ----- longitudinal ----- #
+
+    # 4.E13, 4.E12
+    ppx = pf.ppx34
+    camberX = 1-c.PDX3*inclangl**2
+    dx_f = c.LMUX*(c.PDX2*dfz_f*fz + c.PDX1+c.PDX2*dfz)*ppx*camberX
+    dx_g = c.LMUX*(c.PDX1+c.PDX2*dfz)*ppx*(-2*c.PDX3*inclangl)*fz
+
+    # 4.E17, 4.E10
+    kappax = longslip+shx
+    kappax_f = c.LHX*c.PHX2*dfz_f
+
+    # 4.E18
+    sVx_f = c.lmux*c.LVX*(c.PVX1+c.PVX2*dfz+fz*c.PVX2*dfz_f)
+
+    # 4.E14
+    ex_f = c.LEX*(c.PEX2+2*c.PEX3*dfz)*dfz_f*(1-c.PEX4*np.sign(kappax))
+
+    # 4.E15
+    kxk_f = ((c.PKX1+c.PKX2*dfz)*(1+fz*c.PKX3*dfz_f) + fz*c.PKX2*dfz_f)*pf.ppx12*np.exp(c.PKX3*dfz)*c.LKX
+
+    # 4.E16, the eps guard is held constant
+    den = cx*dx+eps*np.maximum(1, np.abs(kxk))
+    bx_f = (kxk_f*den-kxk*cx*dx_f)/den**2
+    bx_g = -kxk*cx*dx_g/den**2
+
+    # 4.E9
+    u = bx*kappax
+    sinX, sinX_phi, phi_u, phi_e = _magic_formula_slope(u, ex, cx)
+    fx0 = dx*sinX+sVx
+    fx0_k = dx*sinX_phi*phi_u*bx
+    fx0_f = dx_f*sinX + dx*sinX_phi*(phi_u*(bx_f*kappax+bx*kappax_f) + phi_e*ex_f) + sVx_f
+    fx0_g = dx_g*sinX + dx*sinX_phi*phi_u*bx_g*kappax
+
+    # ----- lateral ----- #
+
+    # 4.E23, 4.E22
+    dy_f = c.PDY2*dfz_f*pf.ppy34*c.LMUY*(1-c.PDY3*gammaAst2)*fz + muy
+    dy_g = (c.PDY1+c.PDY2*dfz)*pf.ppy34*c.LMUY*(-c.PDY3*gammaAst2_g)*fz
+
+    # 4.E25
+    kyaScale = c.PKY1*fzO*pf.ppy1*c.LKY
+    kyaCamber = 1-c.PKY3*np.abs(gammaAst)
+    kyaDen = (c.PKY2+c.PKY5*gammaAst2)*pf.ppy2
+    q = fz/fzO/kyaDen
+    kyaSin_q = np.cos(c.PKY4*np.arctan(q))*c.PKY4/(1+q**2)
+    kya_f = kyaScale*kyaCamber*kyaSin_q/(fzO*kyaDen)
+    kya_g = kyaScale*(-c.PKY3*gammaAstAbs_g*np.sin(c.PKY4*np.arctan(q)) - kyaCamber*kyaSin_q*q*c.PKY5*gammaAst2_g/(c.PKY2+c.PKY5*gammaAst2))
+
+    # 4.E28, 4.E30
+    svyg, kygO = _camber_terms(c, fz, dfz, pf, gammaAst)
+    svyg_f = c.LKYC*c.LMUY*(c.PVY3+c.PVY4*dfz+fz*c.PVY4*dfz_f)*gammaAst
+    svyg_g = c.LKYC*c.LMUY*(c.PVY3+c.PVY4*dfz)*fz*gammaAst_g
+    kygO_f = (c.PKY6+c.PKY7*dfz+fz*c.PKY7*dfz_f)*pf.ppy5*c.LKYC
+
+    # 4.E29
+    svy_f = c.LMUY*c.LVY*(c.PVY1+c.PVY2*dfz+fz*c.PVY2*dfz_f)+svyg_f
+    svy_g = svyg_g
+
+    # 4.E27, kya_ differs from kya by a constant
+    shyNum = kygO*gammaAst-svyg
+    shy_f = c.LHY*c.PHY2*dfz_f+((kygO_f*gammaAst-svyg_f)*kya_-shyNum*kya_f)/kya_**2
+    shy_g = ((kygO*gammaAst_g-svyg_g)*kya_-shyNum*kya_g)/kya_**2
+
+    # 4.E20
+    alphay = slipangl+shy
+
+    # 4.E24
+    ey_f = c.PEY2*dfz_f*c.LEY*(1+c.PEY5*gammaAst2-(c.PEY3+c.PEY4*gammaAst)*np.sign(alphay))
+    ey_g = (c.PEY1+c.PEY2*dfz)*c.LEY*(c.PEY5*gammaAst2_g-c.PEY4*gammaAst_g*np.sign(alphay))
+
+    # 4.E26
+    den = cy*dy+c.epsCy
+    by_f = (kya_f*den-kya*cy*dy_f)/den**2
+    by_g = (kya_g*den-kya*cy*dy_g)/den**2
+
+    # 4.E19
+    u = by*alphay
+    sinY, sinY_phi, phi_u, phi_e = _magic_formula_slope(u, ey, cy)
+    fy0 = dy*sinY+svy
+    fy0_a = dy*sinY_phi*phi_u*by
+    fy0_f = dy_f*sinY + dy*sinY_phi*(phi_u*(by_f*alphay+by*shy_f) + phi_e*ey_f) + svy_f
+    fy0_g = dy_g*sinY + dy*sinY_phi*(phi_u*(by_g*alphay+by*shy_g) + phi_e*ey_g) + svy_g
+
+    return MF62Jacobian(
+        fx0=fx0, fy0=fy0,
+        dfx0_dlongslip=fx0_k, dfx0_dfz=fx0_f, dfx0_dinclangl=fx0_g,
+        dfy0_dslipangl=fy0_a, dfy0_dfz=fy0_f, dfy0_dinclangl=fy0_g,
+    )
+
+
+# B, C, D, E, horizontal and vertical shift of a Magic Formula curve, see _magic_formula_curve
+MF62ShapeFactors = namedtuple('MF62ShapeFactors', ('B', 'C', 'D', 'E', 'SH', 'SV'))
+
+
+def _magic_formula_curve(shape, x, trig=np.sin):
+
+    """D*trig(C*atan(B*x - E*(B*x - atan(B*x)))) + SV of MF62ShapeFactors at the shifted slip x"""
+
+    bx = shape.B*x
+    return shape.D*trig(shape.C*np.arctan(bx-shape.E*(bx-np.arctan(bx))))+shape.SV
+
+
+def _kxk(c, fz, dfz, pf):
+
+    """Longitudinal slip stiffness (4.E15)"""
+
+    return c.LKX*fz*(c.PKX1+c.PKX2*dfz)*(np.exp(c.PKX3*dfz))*pf.ppx12
+
+
+def _kya(c, fz, pf, gammaAst):
+
+    """Cornering stiffness (4.E25)"""
+
+    fzO = c.fzO
+    return (c.PKY1*fzO*pf.ppy1*(1-c.PKY3*np.abs(gammaAst))*np.sin(c.PKY4*np.arctan(fz/fzO/((c.PKY2+c.PKY5*gammaAst**2)*pf.ppy2)))*c.LKY)
+
+
+def _muy(c, dfz, pf, gammaAst):
+
+    """Lateral friction coefficient (4.E23)"""
+
+    return (c.PDY1+c.PDY2*dfz)*pf.ppy34*(1-c.PDY3*gammaAst**2)*c.LMUY
+
+
+def _camber_terms(c, fz, dfz, pf, gammaAst):
+
+    """(svyg, kygO): vertical shift from camber (4.E28) and camber stiffness (4.E30)"""
+
+    svyg = c.LKYC*c.LMUY*fz*(c.PVY3+c.PVY4*dfz)*gammaAst
+    kygO = fz*(c.PKY6+c.PKY7*dfz)*pf.ppy5*c.LKYC
+    return svyg, kygO
+
+
+def _longitudinal_shape(c, fz, pf, inclangl, longslip=None, side=1, z=None):
+
+    """(MF62ShapeFactors of the pure-slip fx0 curve, kxk), with E on the side of longslip, or on side without one"""
+
+    eps = np.finfo(float).eps
+    dfz = (fz-c.fzO)/c.fzO
+
+    # 4.E13, 4.E12
+    dx = c.LMUX*(c.PDX1 + c.PDX2*dfz)*pf.ppx34*(1-c.PDX3*inclangl**2)*fz
+
+    # 4.E17, 4.E18
+    shx = c.LHX*(c.PHX1+c.PHX2*dfz)
+    svx = c.lmux*c.LVX*fz*(c.PVX1+c.PVX2*dfz)
+    if z is not None:
+        dx = dx*z.zeta1
+        svx = svx*z.zeta1
+
+    # 4.E10, 4.E14
+    if longslip is not None:
+        side = np.sign(longslip+shx)
+    ex = c.LEX*(c.PEX1+c.PEX2*dfz+c.PEX3*dfz**2)*(1-c.PEX4*side)
+
+    # 4.E15, 4.E16
+    kxk = _kxk(c, fz, dfz, pf)
+    bx = kxk/(c.cx*dx + eps*np.maximum(1, np.abs(kxk)))
+
+    return MF62ShapeFactors(bx, c.cx, dx, ex, shx, svx), kxk
+
+
+def _lateral_shape(c, fz, pf, inclangl, slipangl=None, side=1, z=None):
+
+    """(MF62ShapeFactors of the pure-slip fy0 curve, kya, kya_ of 4.E39, muy), with E on the side of slipangl, or on side without one"""
+
+    eps = np.finfo(float).eps
+    dfz = (fz-c.fzO)/c.fzO
+    gammaAst = np.sin(inclangl)
+
+    # 4.E23, 4.E22
+    muy = _muy(c, dfz, pf, gammaAst)
+    dy = muy*fz if z is None else muy*fz*z.zeta2
+
+    # 4.E25
+    kya = _kya(c, fz, pf, gammaAst)
+    if z is not None:
+        kya = kya*z.zeta3
+
+    # 4.E39
+    signKya = np.sign(kya)
+    kya_ = kya + eps*np.where(signKya == 0, 1, signKya)
+
+    # 4.E28, 4.E30
+    svyg, kygO = _camber_terms(c, fz, dfz, pf, gammaAst)
+
+    # 4.E29, 4.E27
+    if z is None:
+        svy = c.LMUY*c.LVY*fz*(c.PVY1+c.PVY2*dfz)+svyg
+        shy = c.LHY*(c.PHY1+c.PHY2*dfz)+(kygO*gammaAst-svyg)/kya_
+    else:
+        svyg = svyg*z.zeta2
+        svy = c.LMUY*c.LVY*fz*(c.PVY1+c.PVY2*dfz)*z.zeta2+svyg
+        shy = c.LHY*(c.PHY1+c.PHY2*dfz)+(kygO*gammaAst-svyg)/kya_*z.zeta0+z.zeta4-1
+
+    # 4.E20, 4.E24
+    if slipangl is not None:
+        side = np.sign(slipangl+shy)
+    ey = (c.PEY1+c.PEY2*dfz)*(1+c.PEY5*gammaAst**2-(c.PEY3+c.PEY4*gammaAst)*side)*c.LEY
+
+    # 4.E26
+    by = kya/(c.cy*dy+c.epsCy)
+
+    return MF62ShapeFactors(by, c.cy, dy, ey, shy, svy), kya, kya_, muy
+
+
+def _aligning_shape(c, fz, pf, inclangl, slipangl, vcx, lateral, kya_, z=None):
+
+    """(trail, residual, alphaAst): MF62ShapeFactors of the pneumatic trail and residual moment curves over alphaAst, cos(alpha) folded into D"""
+
+    eps = np.finfo(float).eps
+    fzO = c.fzO
+    rO = c.UNLOADED_RADIUS
+    dfz = (fz-fzO)/fzO
+    dfz2 = dfz**2
+    gammaAst = np.sin(inclangl)
+    gammaAst2 = gammaAst**2
+    gammaAstAbs = np.abs(gammaAst)
+
+    # 4.E3
+    tanAlpha = np.tan(slipangl)
+    sgnVcx = np.sign(vcx)
+    alphaAst = tanAlpha*sgnVcx
+
+    # 4.E6a, 4.E6
+    vc = np.sqrt(vcx**2+(vcx*tanAlpha)**2)+eps
+    alphaCos = vcx/vc
+
+    # 4.E35, 4.E34
+    sht = c.QHZ1+c.QHZ2*dfz+(c.QHZ3+c.QHZ4*dfz)*gammaAst
+    alphat = alphaAst+sht
+
+    # 4.E38
+    shf = lateral.SH+lateral.SV/kya_
+
+    # 4.E42, 4.E43
+    dt = fz*(rO/fzO)*(c.QDZ1+c.QDZ2*dfz)*pf.ppz1*c.LTR*sgnVcx*(1+c.QDZ3*gammaAstAbs+c.QDZ4*gammaAst2)
+    if z is not None:
+        dt = dt*z.zeta5
+
+    # 4.E40
+    bt = (c.QBZ1+c.QBZ2*dfz+c.QBZ3*dfz2)*(1+c.QBZ4*gammaAst+c.QBZ5*gammaAstAbs)*c.lkyLmuy
+
+    # 4.E41
+    ct = c.QCZ1
+
+    # 4.E44
+    et = (c.QEZ1+c.QEZ2*dfz+c.QEZ3*dfz2)*(1+(c.QEZ4+c.QEZ5*gammaAst)*(2/np.pi)*np.arctan(bt*ct*alphat))
+
+    # 4.E45, 4.E46 (cr = 1 without turn slip), 4.E47
+    br = c.QBZ9*c.lkyLmuy+c.QBZ10*lateral.B*lateral.C
+    if z is None:
+        cr = 1.0
+        dr = fz*rO*((c.QDZ6+c.QDZ7*dfz)*c.LRES + ((c.QDZ8+c.QDZ9*dfz)*pf.ppz2+(c.QDZ10+c.QDZ11*dfz)*gammaAstAbs)*gammaAst*c.LKZC)*c.LMUY*sgnVcx*alphaCos
+    else:
+        br = br*z.zeta6
+        cr = z.zeta7
+        dr = fz*rO*((c.QDZ6+c.QDZ7*dfz)*c.LRES*z.zeta2 + ((c.QDZ8+c.QDZ9*dfz)*pf.ppz2+(c.QDZ10+c.QDZ11*dfz)*gammaAstAbs)*gammaAst*c.LKZC*z.zeta0)*c.LMUY*sgnVcx*alphaCos+z.zeta8-1
+
+    trail = MF62ShapeFactors(bt, ct, dt*alphaCos, et, sht, 0.0)
+    residual = MF62ShapeFactors(br, cr, dr*alphaCos, 0.0, shf, 0.0)
+    return trail, residual, alphaAst
+
+
+def _slip_shape_factors(c, fz, pf, inclangl, side):
+
+    """MF62ShapeFactors of the pure-slip Fx0 and Fy0 curves, with E on the given slip side"""
+
+    # turn slip is not modelled, so every ZETA factor is 1
+    return _longitudinal_shape(c, fz, pf, inclangl, side=side)[0], _lateral_shape(c, fz, pf, inclangl, side=side)[0]
+
+
+def _relaxation_lengths(c, fz, pf, inclangl):
+
+    """(sigmaKappa, sigmaAlpha): slip stiffness over carcass stiffness, longitudinal and lateral"""
+
+    dfz = (fz-c.fzO)/c.fzO
+
+    # 4.E15, 4.E25
+    kxk = _kxk(c, fz, dfz, pf)
+    kya = _kya(c, fz, pf, np.sin(inclangl))
+
+    # carcass stiffnesses at the contact, varying with load and pressure
+    cfx = c.LONGITUDINAL_STIFFNESS*(1+c.PCFX1*dfz+c.PCFX2*dfz**2)*(1+c.PCFX3*pf.dpi)
+    cfy = c.LATERAL_STIFFNESS*(1+c.PCFY1*dfz+c.PCFY2*dfz**2)*(1+c.PCFY3*pf.dpi)
+
+    return np.abs(kxk)/cfx, np.abs(kya)/cfy
+
+
+def _align_sample_axis(pack, shape):
+
+    """Pack with its (K, 1) sample axis reshaped to lie along the first axis of a batch shape"""
+
+    aligned = []
+    for value in pack:
+        if np.ndim(value):
+            value = np.reshape(value, (np.shape(value)[0],)+(1,)*(len(shape)-1))
+            if np.broadcast_shapes(value.shape, shape) != shape:
+                raise ValueError(f"Coefficients with {value.shape[0]} samples do not fit a batch of shape {shape}")
+        aligned.append(value)
+    return pack._make(aligned)
+
+
+def _relax(state, target, decay):
+
+    """state = target + (state-target)*decay, in place"""
+
+    np.subtract(state, target, out=state)
+    np.multiply(state, decay, out=state)
+    np.add(state, target, out=state)
+
+
+def _free_radius(c, omega):
+
+    """Free tyre radius, growing with the spin velocity"""
+
+    rO = c.UNLOADED_RADIUS
+    return rO*(c.Q_RE0+c.Q_V1*(rO*omega/c.LONGVL)**2)
+
+
+def _vertical_stiffness_terms(c, pf, omega, fx, fy):
+
+    """(Q_FZ1, load scale) of Fz = scale*(Q_FZ1*rho/r0 + Q_FZ2*(rho/r0)**2)"""
+
+    rO = c.UNLOADED_RADIUS
+    fzO = c.FNOMIN
+
+    # linear term giving VERTICAL_STIFFNESS as the slope at the nominal load
+    qfz1 = np.sqrt((c.VERTICAL_STIFFNESS*rO/fzO)**2-4*c.Q_FZ2)
+
+    # stiffening with speed, softening with fx and fy, and the pressure effect
+    scale = (1+c.Q_V2*rO*np.abs(omega)/c.LONGVL-(c.Q_FCX*fx/fzO)**2-(c.Q_FCY*fy/fzO)**2)*pf.pfz1*fzO
+    return qfz1, scale
+
+
+def _rolling(c, pf, rOmega, rho, fz, omega, vcx) -> MF62Vertical:
+
+    """MF62Vertical of a deflection and its load, with the effective rolling radius and slip"""
+
+    # deflection in units of the nominal-load deflection
+    czO = c.VERTICAL_STIFFNESS*pf.pfz1
+    rhoFzO = c.FNOMIN/czO
+    rhoFz = rho/rhoFzO
+    effectiveRadius = rOmega-rhoFzO*(c.DREFF*np.arctan(c.BREFF*rhoFz)+c.FREFF*rhoFz)
+
+    rollingSpeed = omega*effectiveRadius
+    longslip = None
+    if vcx is not None:
+        # VXLOW keeps the slip finite at standstill
+        longslip = (rollingSpeed-vcx)/np.maximum(np.abs(vcx), c.VXLOW)
+
+    return MF62Vertical(
+        fz=fz,
+        deflection=rho,
+        loaded_radius=rOmega-rho,
+        effective_radius=effectiveRadius,
+        rolling_speed=rollingSpeed,
+        longslip=longslip,
+    )
+
+
+def _ellipse_basis(length, height, order, increment) -> np.ndarray:
+
+    """Rise of a super-ellipse cam above its lowest point, sampled every increment over its length, cached per shape"""
+
+    key = (length, height, order, increment)
+    basis = _ELLIPSE_BASES.get(key)
+    if basis is None:
+        # rounded like the road grid, 0.29/0.01 = 28.999... still reaches the cam ends
+        half = int(round(length/increment))
+        u = np.abs(np.arange(-half, half+1)*increment/length)
+        basis = height*(1-np.clip(1-u**order, 0, None)**(1/order))
+        basis.flags.writeable = False
+        _ELLIPSE_BASES[key] = basis
+    return basis
+
+
+def _magic_formula_peak_slope(w, C, E):
+
+    """d/dw of sin(C*atan(phi(w)))/C and its second derivative"""
+
+    w2 = w**2
+    phi = w-E*(w-np.arctan(w))
+    phiW = 1-E*w2/(1+w2)
+    phiWW = -2*E*w/(1+w2)**2
+    theta = C*np.arctan(phi)
+    q = 1+phi**2
+    cosTheta, sinTheta = np.cos(theta), np.sin(theta)
+
+    slope = cosTheta*phiW/q
+    curvature = -C*sinTheta*phiW**2/q**2 - 2*phi*cosTheta*phiW**2/q**2 + cosTheta*phiWW/q
+    return slope, curvature
+
+
+def _slip_at_peak(curve, bound, side, iterations, tolerance):
+
+    """
+    Slip of the first force peak on one side of a Magic Formula curve,
+    capped at the slip range bound. Solved in w = |B*(slip+shift)| by
+    Newton on the analytic slope, falling back to bisection whenever a
+    step leaves the bracket or the curve is not concave.
+    """
+
+    B, C, _, E, shift, _ = curve
+    absB = np.abs(B)
+    hi = absB*np.maximum(side*(bound+shift), 0)
+    # with E > 1 phi(w) turns back at w = 1/sqrt(E-1) and the curve folds
+    # over, so the first peak is never past that point
+    with np.errstate(divide='ignore'):
+        turn = np.where(E > 1, 1/np.sqrt(np.maximum(E-1, 0)), np.inf)
+    interior = (_magic_formula_peak_slope(hi, C, E)[0] < 0) | (turn < hi)
+    hi = np.minimum(hi, turn)
+    # curves still rising at the bound are pinned there
+    lo = np.where(interior, 0, hi)
+
+    # exact peak of the E = 0 curve as the first guess
+    w = np.clip(np.tan(np.pi/(2*np.maximum(C, 1+1e-9)))*np.ones_like(hi), lo, hi)
+    for _ in range(iterations):
+        slope, curvature = _magic_formula_peak_slope(w, C, E)
+        rising = slope > 0
+        lo = np.where(rising, w, lo)
+        hi = np.where(rising, hi, w)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            newton = w-slope/curvature
+        useNewton = (curvature < 0) & (newton >= lo) & (newton <= hi)
+        wNew = np.where(useNewton, newton, 0.5*(lo+hi))
+        converged = not np.any(np.abs(wNew-w) > tolerance*np.maximum(1, w))
+        w = wNew
+        if converged:
+            break
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(interior, side*w/absB-shift, bound)
+
+
+def _slip_for_force(target, positive, negative, peaks, iterations, tolerance):
+
+    """
+    Slip giving the target force on the monotonic branch between the two
+    peaks of a Magic Formula curve, and a flag for targets beyond a peak
+    (where the peak slip is returned). positive and negative are the
+    _slip_shape_factors curves for either slip side, peaks the two peak
+    slips. With G = (target - Sv)/D the Magic Formula inverts to
+    phi(w) = tan(asin(G)/C), solved for w = |B*(slip+shift)| by Newton
+    safeguarded with bisection.
+    """
+
+    B, C, D, _, shift, sv = positive
+    with np.errstate(divide='ignore', invalid='ignore'):
+        g = (target-sv)/D
+
+    # side of kappax/alphay the target lies on, and the E and peak of that side
+    side = np.where(np.sign(B)*np.sign(g) < 0, -1.0, 1.0)
+    E = np.where(side > 0, positive[3], negative[3])
+    peak = np.where(side > 0, peaks[0], peaks[1])
+
+    absB = np.abs(B)
+    wPeak = absB*np.abs(peak+shift)
+    gPeak = np.sin(C*np.arctan(wPeak-E*(wPeak-np.arctan(wPeak))))
+    absG = np.abs(g)
+    saturated = ~(absG <= gPeak)
+
+    phiTarget = np.tan(np.arcsin(np.where(saturated, 0, absG))/C)
+    lo = np.zeros_like(wPeak)
+    hi = wPeak
+    # exact for E = 0
+    w = np.minimum(phiTarget, hi)
+    for _ in range(iterations):
+        wAtan = w-np.arctan(w)
+        excess = w-E*wAtan-phiTarget
+        slope = 1-E*w**2/(1+w**2)
+        above = excess > 0
+        hi = np.where(above, w, hi)
+        lo = np.where(above, lo, w)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            newton = w-excess/slope
+        useNewton = (slope > 0) & (newton >= lo) & (newton <= hi)
+        wNew = np.where(useNewton, newton, 0.5*(lo+hi))
+        converged = not np.any(np.abs(wNew-w) > tolerance*np.maximum(1, w))
+        w = wNew
+        if converged:
+            break
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slip = side*w/absB-shift
+    return np.where(saturated, peak, slip), saturated
+
+
+def _affine(x, a, b, out):
+
+    """out = a + b*x, in place"""
+
+    np.multiply(x, b, out=out)
+    np.add(out, a, out=out)
+
+
+def _magic_formula(x, e, C, out, tmp, trig=np.sin):
+
+    """out = trig(C*atan(x - e*(x - atan(x)))), in place"""
+
+    np.arctan(x, out=tmp)
+    np.subtract(x, tmp, out=tmp)
+    np.multiply(e, tmp, out=tmp)
+    np.subtract(x, tmp, out=tmp)
+    np.arctan(tmp, out=tmp)
+    np.multiply(tmp, C, out=tmp)
+    trig(tmp, out=out)
+
+
+def _evaluate_workspace(c, w, out, longslip, slipangl, fz, pf, inclangl, vcx):
+
+    """Fused kernel of _evaluate_pack written with out= ufuncs into a MF62Workspace"""
+
+    # turn slip is not modelled, so every ZETA factor is 1
+    eps = np.finfo(float).eps
+    tmp1, tmp2 = w.tmp1, w.tmp2
+
+    spare = w.forces
+    fx0, fy0, mz0 = out.fx0, out.fy0, out.mz0
+    kxk = spare.kxk if out.kxk is None else out.kxk
+    kya = spare.kya if out.kya is None else out.kya
+    tO = spare.trail if out.trail is None else out.trail
+    mzrO = spare.mzr0 if out.mzr0 is None else out.mzr0
+
+    # 4.E1, 4.E2a
+    np.subtract(fz, c.fzO, out=w.dfz)
+    np.divide(w.dfz, c.fzO, out=w.dfz)
+    np.multiply(w.dfz, w.dfz, out=w.dfz2)
+
+    # 4.E4
+    np.sin(inclangl, out=w.gammaAst)
+    np.multiply(w.gammaAst, w.gammaAst, out=w.gammaAst2)
+    np.abs(w.gammaAst, out=w.gammaAstAbs)
+
+    # ----- longitudinal ----- #
+
+    # 4.E13, 4.E12
+    _affine(w.dfz, c.PDX1, c.PDX2, w.dx)
+    np.multiply(w.dx, c.LMUX, out=w.dx)
+    np.multiply(w.dx, pf.ppx34, out=w.dx)
+    np.multiply(inclangl, inclangl, out=tmp1)
+    _affine(tmp1, 1, -c.PDX3, tmp1)
+    np.multiply(w.dx, tmp1, out=w.dx)
+    np.multiply(w.dx, fz, out=w.dx)
+
+    # 4.E17, 4.E10
+    _affine(w.dfz, c.PHX1, c.PHX2, w.kappax)
+    np.multiply(w.kappax, c.LHX, out=w.kappax)
+    np.add(longslip, w.kappax, out=w.kappax)
+
+    # 4.E18
+    _affine(w.dfz, c.PVX1, c.PVX2, w.svx)
+    np.multiply(w.svx, fz, out=w.svx)
+    np.multiply(w.svx, c.lmux*c.LVX, out=w.svx)
+
+    # 4.E14
+    _affine(w.dfz, c.PEX1, c.PEX2, w.ex)
+    np.multiply(w.dfz2, c.PEX3, out=tmp1)
+    np.add(w.ex, tmp1, out=w.ex)
+    np.multiply(w.ex, c.LEX, out=w.ex)
+    np.sign(w.kappax, out=tmp1)
+    _affine(tmp1, 1, -c.PEX4, tmp1)
+    np.multiply(w.ex, tmp1, out=w.ex)
+
+    # 4.E15
+    _affine(w.dfz, c.PKX1, c.PKX2, kxk)
+    np.multiply(kxk, fz, out=kxk)
+    np.multiply(kxk, c.LKX, out=kxk)
+    np.multiply(w.dfz, c.PKX3, out=tmp1)
+    np.exp(tmp1, out=tmp1)
+    np.multiply(kxk, tmp1, out=kxk)
+    np.multiply(kxk, pf.ppx12, out=kxk)
+
+    # 4.E16
+    np.abs(kxk, out=tmp1)
+    np.maximum(tmp1, 1, out=tmp1)
+    np.multiply(tmp1, eps, out=tmp1)
+    np.multiply(w.dx, c.cx, out=w.bx)
+    np.add(w.bx, tmp1, out=w.bx)
+    np.divide(kxk, w.bx, out=w.bx)
+
+    # 4.E9
+    np.multiply(w.bx, w.kappax, out=tmp1)
+    _magic_formula(tmp1, w.ex, c.cx, fx0, tmp2)
+    np.multiply(w.dx, fx0, out=fx0)
+    np.add(fx0, w.svx, out=fx0)
+
+    # ----- lateral ----- #
+
+    # 4.E23, 4.E22
+    _affine(w.dfz, c.PDY1, c.PDY2, w.dy)
+    np.multiply(w.dy, pf.ppy34, out=w.dy)
+    _affine(w.gammaAst2, 1, -c.PDY3, tmp1)
+    np.multiply(w.dy, tmp1, out=w.dy)
+    np.multiply(w.dy, c.LMUY, out=w.dy)
+    np.multiply(w.dy, fz, out=w.dy)
+
+    # 4.E25
+    _affine(w.gammaAst2, c.PKY2, c.PKY5, tmp1)
+    np.multiply(tmp1, pf.ppy2, out=tmp1)
+    np.divide(fz, c.fzO, out=tmp2)
+    np.divide(tmp2, tmp1, out=tmp1)
+    np.arctan(tmp1, out=tmp1)
+    np.multiply(tmp1, c.PKY4, out=tmp1)
+    np.sin(tmp1, out=kya)
+    np.multiply(kya, pf.ppy1, out=kya)
+    _affine(w.gammaAstAbs, 1, -c.PKY3, tmp1)
+    np.multiply(kya, tmp1, out=kya)
+    np.multiply(kya, c.PKY1*c.fzO*c.LKY, out=kya)
+
+    # 4.E39
+    np.copysign(eps, kya, out=w.kya_)
+    np.add(kya, w.kya_, out=w.kya_)
+
+    # 4.E28
+    _affine(w.dfz, c.PVY3, c.PVY4, w.svyg)
+    np.multiply(w.svyg, fz, out=w.svyg)
+    np.multiply(w.svyg, w.gammaAst, out=w.svyg)
+    np.multiply(w.svyg, c.LKYC*c.LMUY, out=w.svyg)
+
+    # 4.E30
+    _affine(w.dfz, c.PKY6, c.PKY7, w.kygO)
+    np.multiply(w.kygO, fz, out=w.kygO)
+    np.multiply(w.kygO, pf.ppy5, out=w.kygO)
+    np.multiply(w.kygO, c.LKYC, out=w.kygO)
+
+    # 4.E29
+    _affine(w.dfz, c.PVY1, c.PVY2, w.svy)
+    np.multiply(w.svy, fz, out=w.svy)
+    np.multiply(w.svy, c.LMUY*c.LVY, out=w.svy)
+    np.add(w.svy, w.svyg, out=w.svy)
+
+    # 4.E27
+    np.multiply(w.kygO, w.gammaAst, out=tmp1)
+    np.subtract(tmp1, w.svyg, out=tmp1)
+    np.divide(tmp1, w.kya_, out=tmp1)
+    _affine(w.dfz, c.PHY1, c.PHY2, w.shy)
+    np.multiply(w.shy, c.LHY, out=w.shy)
+    np.add(w.shy, tmp1, out=w.shy)
+
+    # 4.E20
+    np.add(slipangl, w.shy, out=w.alphay)
+
+    # 4.E24
+    _affine(w.gammaAst, c.PEY3, c.PEY4, tmp1)
+    np.sign(w.alphay, out=tmp2)
+    np.multiply(tmp1, tmp2, out=tmp1)
+    _affine(w.gammaAst2, 1, c.PEY5, w.ey)
+    np.subtract(w.ey, tmp1, out=w.ey)
+    _affine(w.dfz, c.PEY1, c.PEY2, tmp1)
+    np.multiply(tmp1, w.ey, out=w.ey)
+    np.multiply(w.ey, c.LEY, out=w.ey)
+
+    # 4.E26
+    np.multiply(w.dy, c.cy, out=w.by)
+    np.add(w.by, c.epsCy, out=w.by)
+    np.divide(kya, w.by, out=w.by)
+
+    # 4.E19
+    np.multiply(w.by, w.alphay, out=tmp1)
+    _magic_formula(tmp1, w.ey, c.cy, fy0, tmp2)
+    np.multiply(w.dy, fy0, out=fy0)
+    np.add(fy0, w.svy, out=fy0)
+
+    # ----- aligning ----- #
+
+    # 4.E3
+    np.tan(slipangl, out=tmp1)
+    np.sign(vcx, out=w.sgnVcx)
+    np.multiply(tmp1, w.sgnVcx, out=w.alphaAst)
+
+    # 4.E6a, 4.E6
+    np.multiply(vcx, tmp1, out=tmp1)
+    np.multiply(tmp1, tmp1, out=tmp1)
+    np.multiply(vcx, vcx, out=tmp2)
+    np.add(tmp2, tmp1, out=tmp1)
+    np.sqrt(tmp1, out=tmp1)
+    np.add(tmp1, eps, out=tmp1)
+    np.divide(vcx, tmp1, out=w.alphaCos)
+
+    # 4.E38, 4.E37
+    np.divide(w.svy, w.kya_, out=tmp1)
+    np.add(w.shy, tmp1, out=tmp1)
+    np.add(w.alphaAst, tmp1, out=w.alphar)
+
+    # 4.E35, 4.E34
+    _affine(w.dfz, c.QHZ3, c.QHZ4, tmp1)
+    np.multiply(tmp1, w.gammaAst, out=tmp1)
+    _affine(w.dfz, c.QHZ1, c.QHZ2, tmp2)
+    np.add(tmp2, tmp1, out=tmp1)
+    np.add(w.alphaAst, tmp1, out=w.alphat)
+
+    # 4.E42, 4.E43
+    _affine(w.dfz, c.QDZ1, c.QDZ2, w.dt)
+    np.multiply(w.dt, fz, out=w.dt)
+    np.multiply(w.dt, c.UNLOADED_RADIUS/c.fzO*c.LTR, out=w.dt)
+    np.multiply(w.dt, pf.ppz1, out=w.dt)
+    np.multiply(w.dt, w.sgnVcx, out=w.dt)
+    _affine(w.gammaAstAbs, 1, c.QDZ3, tmp1)
+    np.multiply(w.gammaAst2, c.QDZ4, out=tmp2)
+    np.add(tmp1, tmp2, out=tmp1)
+    np.multiply(w.dt, tmp1, out=w.dt)
+
+    # 4.E40
+    _affine(w.dfz, c.QBZ1, c.QBZ2, w.bt)
+    np.multiply(w.dfz2, c.QBZ3, out=tmp1)
+    np.add(w.bt, tmp1, out=w.bt)
+    _affine(w.gammaAst, 1, c.QBZ4, tmp1)
+    np.multiply(w.gammaAstAbs, c.QBZ5, out=tmp2)
+    np.add(tmp1, tmp2, out=tmp1)
+    np.multiply(w.bt, tmp1, out=w.bt)
+    np.multiply(w.bt, c.lkyLmuy, out=w.bt)
+
+    # 4.E44
+    np.multiply(w.bt, c.QCZ1, out=tmp1)
+    np.multiply(tmp1, w.alphat, out=tmp1)
+    np.arctan(tmp1, out=tmp1)
+    np.multiply(tmp1, 2/np.pi, out=tmp1)
+    _affine(w.gammaAst, c.QEZ4, c.QEZ5, tmp2)
+    np.multiply(tmp2, tmp1, out=tmp1)
+    np.add(tmp1, 1, out=tmp1)
+    _affine(w.dfz, c.QEZ1, c.QEZ2, w.et)
+    np.multiply(w.dfz2, c.QEZ3, out=tmp2)
+    np.add(w.et, tmp2, out=w.et)
+    np.multiply(w.et, tmp1, out=w.et)
+
+    # 4.E33
+    np.multiply(w.bt, w.alphat, out=tmp1)
+    _magic_formula(tmp1, w.et, c.QCZ1, tO, tmp2, np.cos)
+    np.multiply(w.dt, tO, out=tO)
+    np.multiply(tO, w.alphaCos, out=tO)
+
+    # 4.E45, 4.E46 (cr = 1)
+    np.multiply(w.by, c.QBZ10*c.cy, out=w.br)
+    np.add(w.br, c.QBZ9*c.lkyLmuy, out=w.br)
+
+    # 4.E47
+    _affine(w.dfz, c.QDZ10, c.QDZ11, w.dr)
+    np.multiply(w.dr, w.gammaAstAbs, out=w.dr)
+    _affine(w.dfz, c.QDZ8, c.QDZ9, tmp1)
+    np.multiply(tmp1, pf.ppz2, out=tmp1)
+    np.add(tmp1, w.dr, out=w.dr)
+    np.multiply(w.dr, w.gammaAst, out=w.dr)
+    np.multiply(w.dr, c.LKZC, out=w.dr)
+    _affine(w.dfz, c.QDZ6, c.QDZ7, tmp1)
+    np.multiply(tmp1, c.LRES, out=tmp1)
+    np.add(tmp1, w.dr, out=w.dr)
+    np.multiply(w.dr, fz, out=w.dr)
+    np.multiply(w.dr, c.UNLOADED_RADIUS*c.LMUY, out=w.dr)
+    np.multiply(w.dr, w.sgnVcx, out=w.dr)
+    np.multiply(w.dr, w.alphaCos, out=w.dr)
+
+    # 4.E32, 4.E36
+    np.multiply(w.br, w.alphar, out=tmp1)
+    np.arctan(tmp1, out=tmp1)
+    np.cos(tmp1, out=tmp1)
+    np.multiply(w.dr, tmp1, out=mzrO)
+    np.multiply(mzrO, w.alphaCos, out=mzrO)
+    np.multiply(tO, fy0, out=mz0)
+    np.subtract(mzrO, mz0, out=mz0)
+
+
+@_jitable
+def _point_operating(c, fz, inclangl):
+
+    """Scalar load and camber terms shared by the point kernels: (dfz, dfz2, gammaAst, gammaAst2, gammaAstAbs)"""
+
+    # 4.E1, 4.E2a
+    fzO = c[_IDX_fzO]
+    dfz = (fz-fzO)/fzO
+
+    # 4.E4
+    gammaAst = math.sin(inclangl)
+    return dfz, dfz*dfz, gammaAst, gammaAst*gammaAst, abs(gammaAst)
+
+
+@_jitable
+def _point_longitudinal(c, longslip, fz, pf, inclangl, dfz, dfz2):
+
+    """Scalar pure-slip longitudinal force: (fx0, kxk)"""
+
+    eps = 2.220446049250313e-16
+
+    # 4.E11
+    cx = c[_IDX_cx]
+
+    # 4.E13
+    mux = c[_IDX_LMUX]*(c[_IDX_PDX1] + c[_IDX_PDX2]*dfz)*pf.ppx34*(1-c[_IDX_PDX3]*inclangl**2)
+
+    # 4.E12
+    dx = mux*fz
+
+    # 4.E17
+    shx = c[_IDX_LHX]*(c[_IDX_PHX1]+c[_IDX_PHX2]*dfz)
+
+    # 4.E18
+    sVx = c[_IDX_lmux]*c[_IDX_LVX]*fz*(c[_IDX_PVX1]+c[_IDX_PVX2]*dfz)
+
+    # 4.E10
+    kappax = longslip + shx
+    kappaxSgn = 1.0 if kappax > 0 else (-1.0 if kappax < 0 else 0.0)
+
+    # 4.E14
+    ex = c[_IDX_LEX]*(c[_IDX_PEX1]+c[_IDX_PEX2]*dfz+c[_IDX_PEX3]*dfz2)*(1-c[_IDX_PEX4]*kappaxSgn)
+
+    # 4.E15
+    kxk = c[_IDX_LKX]*fz*(c[_IDX_PKX1]+c[_IDX_PKX2]*dfz)*(math.exp(c[_IDX_PKX3]*dfz))*pf.ppx12
+
+    # 4.E16
+    bx = kxk/(cx*dx + eps*max(1.0, abs(kxk)))
+
+    # 4.E9
+    bxk = bx*kappax
+    fx0 = dx*math.sin(cx*math.atan(bxk-ex*(bxk-math.atan(bxk))))+sVx
+    return fx0, kxk
+
+
+@_jitable
+def _point_lateral(c, slipangl, fz, pf, dfz, gammaAst, gammaAst2, gammaAstAbs):
+
+    """Scalar pure-slip lateral force and the terms the aligning moment reuses: (fy0, kya, kya_, by, shy, svy)"""
+
+    eps = 2.220446049250313e-16
+    fzO = c[_IDX_fzO]
+
+    # 4.E21
+    cy = c[_IDX_cy]
+
+    # 4.E23
+    muy = (c[_IDX_PDY1]+c[_IDX_PDY2]*dfz)*pf.ppy34*(1-c[_IDX_PDY3]*gammaAst2)*c[_IDX_LMUY]
+
+    # 4.E22
+    dy = muy*fz
+
+    # 4.E25
+    kya = (c[_IDX_PKY1]*fzO*pf.ppy1*(1-c[_IDX_PKY3]*gammaAstAbs)*math.sin(c[_IDX_PKY4]*math.atan(fz/fzO/((c[_IDX_PKY2]+c[_IDX_PKY5]*gammaAst2)*pf.ppy2)))*c[_IDX_LKY])
+
+    # 4.E39
+    kya_ = kya - eps if kya < 0 else kya + eps
+
+    # 4.E28
+    svyg = c[_IDX_LKYC]*c[_IDX_LMUY]*fz*(c[_IDX_PVY3]+c[_IDX_PVY4]*dfz)*gammaAst
+
+    # 4.E30
+    kygO = fz*(c[_IDX_PKY6]+c[_IDX_PKY7]*dfz)*pf.ppy5*c[_IDX_LKYC]
+
+    # 4.E29
+    svy = c[_IDX_LMUY]*c[_IDX_LVY]*fz*(c[_IDX_PVY1]+c[_IDX_PVY2]*dfz)+svyg
+
+    # 4.E27
+    shy = c[_IDX_LHY]*(c[_IDX_PHY1]+c[_IDX_PHY2]*dfz)+(kygO*gammaAst-svyg)/kya_
+
+    # 4.E20
+    alphay = slipangl+shy
+    alphaySgn = 1.0 if alphay > 0 else (-1.0 if alphay < 0 else 0.0)
+
+    # 4.E24
+    ey = (c[_IDX_PEY1]+c[_IDX_PEY2]*dfz)*(1+c[_IDX_PEY5]*gammaAst2-(c[_IDX_PEY3]+c[_IDX_PEY4]*gammaAst)*alphaySgn)*c[_IDX_LEY]
+
+    # 4.E26
+    by = kya/(cy*dy+c[_IDX_epsCy])
+
+    # 4.E19
+    bya = by*alphay
+    fy0 = dy*math.sin(cy*math.atan(bya-ey*(bya-math.atan(bya))))+svy
+    return fy0, kya, kya_, by, shy, svy
+
+
+@_jitable
+def _point_aligning(c, slipangl, fz, pf, vcx, dfz, dfz2, gammaAst, gammaAst2, gammaAstAbs, fy0, kya_, by, shy, svy):
+
+    """Scalar pure-slip aligning moment from the lateral terms: (mz0, trail, mzr0)"""
+
+    eps = 2.220446049250313e-16
+    fzO = c[_IDX_fzO]
+    rO = c[_IDX_UNLOADED_RADIUS]
+
+    # 4.E3
+    tanAlpha = math.tan(slipangl)
+    sgnVcx = 1.0 if vcx > 0 else (-1.0 if vcx < 0 else 0.0)
+    alphaAst = tanAlpha*sgnVcx
+
+    # 4.E6a, 4.E6
+    vc = math.sqrt(vcx**2+(vcx*tanAlpha)**2)+eps
+    alphaCos = vcx/vc
+
+    # 4.E38, 4.E37
+    alphar = alphaAst+shy+svy/kya_
+
+    # 4.E35, 4.E34
+    alphat = alphaAst+c[_IDX_QHZ1]+c[_IDX_QHZ2]*dfz+(c[_IDX_QHZ3]+c[_IDX_QHZ4]*dfz)*gammaAst
+
+    # 4.E42, 4.E43
+    dt = fz*(rO/fzO)*(c[_IDX_QDZ1]+c[_IDX_QDZ2]*dfz)*pf.ppz1*c[_IDX_LTR]*sgnVcx*(1+c[_IDX_QDZ3]*gammaAstAbs+c[_IDX_QDZ4]*gammaAst2)
+
+    # 4.E40
+    bt = (c[_IDX_QBZ1]+c[_IDX_QBZ2]*dfz+c[_IDX_QBZ3]*dfz2)*(1+c[_IDX_QBZ4]*gammaAst+c[_IDX_QBZ5]*gammaAstAbs)*c[_IDX_lkyLmuy]
+
+    # 4.E41
+    ct = c[_IDX_QCZ1]
+
+    # 4.E44
+    et = (c[_IDX_QEZ1]+c[_IDX_QEZ2]*dfz+c[_IDX_QEZ3]*dfz2)*(1+(c[_IDX_QEZ4]+c[_IDX_QEZ5]*gammaAst)*(2/math.pi)*math.atan(bt*ct*alphat))
+
+    # 4.E45, 4.E46 (cr = 1)
+    br = c[_IDX_QBZ9]*c[_IDX_lkyLmuy]+c[_IDX_QBZ10]*by*c[_IDX_cy]
+
+    # 4.E47
+    dr = fz*rO*((c[_IDX_QDZ6]+c[_IDX_QDZ7]*dfz)*c[_IDX_LRES] + ((c[_IDX_QDZ8]+c[_IDX_QDZ9]*dfz)*pf.ppz2+(c[_IDX_QDZ10]+c[_IDX_QDZ11]*dfz)*gammaAstAbs)*gammaAst*c[_IDX_LKZC])*c[_IDX_LMUY]*sgnVcx*alphaCos
+
+    # 4.E33
+    btAlpha = bt*alphat
+    tO = dt*math.cos(ct*math.atan(btAlpha-et*(btAlpha-math.atan(btAlpha))))*alphaCos
+
+    # 4.E32, 4.E36
+    mzrO = dr*math.cos(math.atan(br*alphar))*alphaCos
+    mz0 = -tO*fy0 + mzrO
+    return mz0, tO, mzrO
+
+
+def _point_fx0(c, longslip, fz, pf, inclangl) -> float:
+
+    """Scalar fx0 alone, for calc_fx0"""
+
+    # turn slip is not modelled, so every ZETA factor is 1
+    dfz, dfz2, gammaAst, gammaAst2, gammaAstAbs = _point_operating(c, fz, inclangl)
+    return _point_longitudinal(c, longslip, fz, pf, inclangl, dfz, dfz2)[0]
+
+
+def _point_fy0(c, slipangl, fz, pf, inclangl) -> float:
+
+    """Scalar fy0 alone, for calc_fy0"""
+
+    dfz, dfz2, gammaAst, gammaAst2, gammaAstAbs = _point_operating(c, fz, inclangl)
+    return _point_lateral(c, slipangl, fz, pf, dfz, gammaAst, gammaAst2, gammaAstAbs)[0]
+
+
+def _point_mz0(c, slipangl, fz, pf, inclangl, vcx) -> float:
+
+    """Scalar mz0 alone, for calc_mz0: the lateral terms it needs but no longitudinal ones"""
+
+    dfz, dfz2, gammaAst, gammaAst2, gammaAstAbs = _point_operating(c, fz, inclangl)
+    fy0, kya, kya_, by, shy, svy = _point_lateral(c, slipangl, fz, pf, dfz, gammaAst, gammaAst2, gammaAstAbs)
+    return _point_aligning(c, slipangl, fz, pf, vcx, dfz, dfz2, gammaAst, gammaAst2, gammaAstAbs, fy0, kya_, by, shy, svy)[0]
+
+
+def _evaluate_point(c, longslip, slipangl, fz, pf, inclangl, vcx):
+
+    """Scalar twin of _evaluate_pack using the math module, for single-point calls.
+    Returns (fx0, fy0, mz0, kxk, kya, trail, mzr0) as floats."""
+
+    # turn slip is not modelled, so every ZETA factor is 1
+    dfz, dfz2, gammaAst, gammaAst2, gammaAstAbs = _point_operating(c, fz, inclangl)
+    fx0, kxk = _point_longitudinal(c, longslip, fz, pf, inclangl, dfz, dfz2)
+    fy0, kya, kya_, by, shy, svy = _point_lateral(c, slipangl, fz, pf, dfz, gammaAst, gammaAst2, gammaAstAbs)
+    mz0, tO, mzrO = _point_aligning(c, slipangl, fz, pf, vcx, dfz, dfz2, gammaAst, gammaAst2, gammaAstAbs, fy0, kya_, by, shy, svy)
+    return fx0, fy0, mz0, kxk, kya, tO, mzrO
+
+
+def _numba_pure_slip_kernel():
+
+    """Compile (once) the parallel element-wise Numba kernel around _evaluate_point"""
+
+    if 'pure_slip' not in _NUMBA_KERNELS:
+        # a flat coefficient array, not the ~400-field pack, crosses into the
+        # parallel region, so numba's tuple size limit is never reached; the
+        # point helpers index it with the same _IDX_* constants as the pack
+        point = numba.njit(_evaluate_point)
+
+        @numba.njit(parallel=True)
+        def pure_slip(c, longslip, slipangl, fz, pressure, inclangl, vcx, out):
+            for i in numba.prange(longslip.shape[0]):
+                out[0, i], out[1, i], out[2, i], out[3, i], out[4, i], out[5, i], out[6, i] = point(
+                    c, longslip[i], slipangl[i], fz[i], _pressure_factors(c, pressure[i]), inclangl[i], vcx[i])
+
+        _NUMBA_KERNELS['pure_slip'] = pure_slip
+    return _NUMBA_KERNELS['pure_slip']
+
+
+def _evaluate_numba(c, longslip, slipangl, fz, pressure, inclangl, vcx, intermediates=False) -> MF62Forces:
+
+    """Numba backend of MF62tire.evaluate: one pass per element, no temporary arrays"""
+
+    inputs = np.broadcast_arrays(longslip, slipangl, fz, pressure, inclangl, vcx)
+    shape = inputs[0].shape
+    flat = [np.ascontiguousarray(x, dtype=float).ravel() for x in inputs]
+    out = np.empty((7, flat[0].shape[0]))
+    _numba_pure_slip_kernel()(c.as_array(), *flat, out)
+
+    fx0, fy0, mz0, kxk, kya, tO, mzrO = (row.reshape(shape) for row in out)
+    if not intermediates:
+        return MF62Forces(fx0=fx0, fy0=fy0, mz0=mz0)
+    return MF62Forces(fx0=fx0, fy0=fy0, mz0=mz0, kxk=kxk, kya=kya, trail=tO, mzr0=mzrO)
+
+
+def _grid_cell(grid, x):
+
+    """Cell index and weight of x on an evenly spaced grid (first node, step, count), clamped to the grid"""
+
+    start, step, count = grid
+    if np.ndim(x) == 0:
+        u = min(max((x-start)/step, 0.0), count-1)
+        i = min(int(u), count-2)
+        return i, u-i
+
+    # np.clip costs several times minimum/maximum on small arrays
+    u = np.subtract(x, start)
+    u /= step
+    np.maximum(u, 0.0, out=u)
+    np.minimum(u, count-1, out=u)
+    i = u.astype(np.intp)
+    np.minimum(i, count-2, out=i)
+    u -= i
+    return i, u
+
+
+def _interpolate(table, grids, points, folded, foldedSize):
+
+    """Multilinear interpolation of table (one dimension per evenly spaced grid) at points clamped to the grids.
+    Scalar points are folded into the table first, and the folded tables are kept in the folded LRU for later calls."""
+
+    # np.ndim costs a microsecond a call, which shows on small batches
+    points = [x if isinstance(x, np.ndarray) else np.asarray(x, dtype=float) for x in points]
+
+    shape = np.broadcast_shapes(*(x.shape for x in points))
+
+    # a constant pressure or camber leaves a lower-dimensional table, built once per value; on
+    # large batches a load input that is an array of one repeated value is folded the same way
+    scalars = tuple((dim, float(x.flat[0])) for dim, x in enumerate(points)
+                    if x.ndim == 0 or (dim and x.size >= _INTERPOLATE_BLOCK and x.min() == x.max()))
+    entry = folded.get(scalars)
+    if entry is None:
+        reduced = table
+        for dim, x in reversed(scalars):
+            i, t = _grid_cell(grids[dim], x)
+            reduced = (1-t)*reduced.take(i, axis=dim) + t*reduced.take(i+1, axis=dim)
+        reduced = np.ascontiguousarray(reduced)
+
+        # float32 values halve the cache misses of the corner gathers, far below the interpolation error;
+        # per remaining axis: grid as (d, 1) columns, flat strides, and the flat offset of every cell corner
+        grid = np.array([grids[dim] for dim in range(len(points)) if dim not in dict(scalars)], dtype=float).reshape(-1, 3)
+        strides = np.array([stride//reduced.itemsize for stride in reduced.strides], dtype=np.intp)
+        corners = np.array(list(itertools.product((0, 1), repeat=len(strides))), dtype=np.intp).reshape(-1, len(strides))
+        entry = (reduced.ravel().astype(np.float32), grid[:, :1], grid[:, 1:2], grid[:, 2:]-1, (grid[:, 2:]-2).astype(np.intp), strides, (corners @ strides)[:, None])
+        folded[scalars] = entry
+        while len(folded) > foldedSize:
+            folded.popitem(last=False)
+    else:
+        folded.move_to_end(scalars)
+
+    flatTable, start, step, last, penultimate, strides, offsets = entry
+    folds = dict(scalars)
+    arrays = [x for dim, x in enumerate(points) if dim not in folds]
+    if not arrays:
+        return float(flatTable[0]) if not shape else np.full(shape, float(flatTable[0]))
+
+    arraysShape = np.broadcast_shapes(*(x.shape for x in arrays))
+    points = np.empty((len(arrays),)+arraysShape)
+    for row, x in zip(points, arrays):
+        row[...] = x
+    points = points.reshape(len(arrays), -1)
+
+    # blocks keep the 2^d corner values in cache on large batches
+    out = np.empty(points.shape[1])
+    for begin in range(0, points.shape[1], _INTERPOLATE_BLOCK):
+        # cell index and weight of every point on every axis, as (d, n) arrays
+        u = points[:, begin:begin+_INTERPOLATE_BLOCK]
+        u -= start
+        u /= step
+        np.maximum(u, 0.0, out=u)
+        np.minimum(u, last, out=u)
+        i = u.astype(np.intp)
+        np.minimum(i, penultimate, out=i)
+        u -= i
+
+        # gather all 2^d corners at once, then halve them one axis at a time
+        values = flatTable.take(np.dot(strides, i) + offsets)
+        for t in u:
+            values = values.reshape(2, -1, values.shape[-1])
+            low, values = values[0], values[1]
+            values -= low
+            values *= t
+            values += low
+        out[begin:begin+_INTERPOLATE_BLOCK] = values[0]
+    out = out.reshape(arraysShape)
+    return out if arraysShape == shape else np.broadcast_to(out, shape).copy()
+
+
+# points per block of _interpolate
+_INTERPOLATE_BLOCK = 8192
+
+
+def _is_scalar(*args) -> bool:
+
+    """True when every argument is a plain Python or NumPy scalar number"""
+
+    for arg in args:
+        # the concrete check first, the numbers ABC check is several times slower
+        if not isinstance(arg, (float, int)) and not isinstance(arg, numbers.Real):
+            return False
+    return True
+
+
+# autotuned chunk sizes, keyed by the evaluate flags, calibrated once per process
+_CHUNK_SIZES = {}
+
+
+def _autotune_chunk(tire, intermediates, backend, combined, moments) -> int:
+
+    """Smallest chunk size within 10% of the best throughput of a short calibration run"""
+
+    key = (intermediates, backend, combined, moments)
+    if key not in _CHUNK_SIZES:
+        throughput = {}
+        for size in (2**12, 2**14, 2**16, 2**18):
+            inputs = (
+                np.linspace(tire.KPUMIN, tire.KPUMAX, size),
+                np.linspace(tire.ALPMIN, tire.ALPMAX, size),
+                np.linspace(tire.FZMIN, tire.FZMAX, size),
+                np.linspace(tire.PRESMIN, tire.PRESMAX, size),
+                np.linspace(tire.CAMMIN, tire.CAMMAX, size),
+                np.full(size, float(tire.LONGVL)),
+            )
+            elapsed = []
+            for _ in range(2):
+                start = time.perf_counter()
+                tire.evaluate(*inputs, intermediates=intermediates, backend=backend, combined=combined, moments=moments)
+                elapsed.append(time.perf_counter()-start)
+            throughput[size] = size/min(elapsed)
+        best = max(throughput.values())
+        _CHUNK_SIZES[key] = min(size for size, rate in throughput.items() if rate >= 0.9*best)
+    return _CHUNK_SIZES[key]
+
+
+def _input_chunk(x, shape, start, stop):
+
+    """Elements [start, stop) of x broadcast to shape and flattened, copying only the chunk"""
+
+    if np.ndim(x) == 0:
+        return x
+    if x.shape == shape and x.flags.c_contiguous:
+        return x.reshape(-1)[start:stop]
+    return np.broadcast_to(x, shape).flat[start:stop]
+
+
+def _evaluate_chunked(evaluate, inputs, workers, chunk) -> MF62Forces:
+
+    """Run evaluate over flat chunks of the broadcast inputs on a thread pool, writing into preallocated outputs"""
+
+    inputs = [x if _is_scalar(x) else np.asarray(x, dtype=float) for x in inputs]
+    shape = np.broadcast_shapes(*(np.shape(x) for x in inputs))
+    if shape == ():
+        # nothing to split, and the unchunked path returns plain floats
+        return evaluate(*inputs)
+    size = math.prod(shape)
+    bounds = [(start, min(start+chunk, size)) for start in range(0, size, chunk)] or [(0, 0)]
+
+    # the first chunk tells which outputs the flags fill
+    first = evaluate(*(_input_chunk(x, shape, *bounds[0]) for x in inputs))
+    out = {}
+    for name, value in vars(first).items():
+        if value is not None:
+            out[name] = np.empty(size)
+            out[name][:bounds[0][1]] = value
+
+    def run(bound):
+        forces = evaluate(*(_input_chunk(x, shape, *bound) for x in inputs))
+        for name, values in out.items():
+            values[bound[0]:bound[1]] = getattr(forces, name)
+
+    # NumPy releases the GIL inside its ufunc loops, so threads overlap
+    if workers > 1 and len(bounds) > 2:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(run, bounds[1:]))
+    else:
+        for bound in bounds[1:]:
+            run(bound)
+
+    return MF62Forces(**{name: values.reshape(shape) for name, values in out.items()})
+
+
+# order of the grid axes in sweep() and of the dimensions of its outputs
+_SWEEP_AXES = ('longslip', 'slipangl', 'fz', 'pressure', 'inclangl', 'vcx')
+
+# per-process view of the shared sweep buffers, set by _sweep_init
+_SWEEP_STATE = {}
+
+
+def _sweep_init(packName, packShape, outName, outShape, axes, names, flags):
+
+    """Attach a sweep worker to the shared coefficient and output blocks"""
+
+    packMemory = shared_memory.SharedMemory(name=packName)
+    outMemory = shared_memory.SharedMemory(name=outName)
+    packs = np.ndarray(packShape, dtype=float, buffer=packMemory.buf)
+    _SWEEP_STATE.update(
+        memory=(packMemory, outMemory),
+        packs=[MF62Coefficients(*row.tolist()) for row in packs],
+        out=np.ndarray(outShape, dtype=float, buffer=outMemory.buf),
+        axes=axes,
+        shape=tuple(len(axis) for axis in axes),
+        names=names,
+        flags=flags,
+    )
+
+
+def _sweep_release():
+
+    """Drop this process's views of the shared sweep blocks"""
+
+    memory = _SWEEP_STATE.get('memory', ())
+    _SWEEP_STATE.clear()
+    for block in memory:
+        block.close()
+
+
+def _sweep_task(tyre, start, stop) -> int:
+
+    """Evaluate grid points [start, stop) of one tyre into the shared output block"""
+
+    state = _SWEEP_STATE
+    index = np.unravel_index(np.arange(start, stop), state['shape'])
+    inputs = [axis[i] for axis, i in zip(state['axes'], index)]
+    forces = _evaluate_pack(state['packs'][tyre], *inputs, *state['flags'])
+    for i, name in enumerate(state['names']):
+        state['out'][i, tyre, start:stop] = getattr(forces, name)
+    return stop-start
+
+
+def _numba_tbb_running() -> bool:
+
+    """True once the Numba backend has started the TBB threading layer in this process"""
+
+    if numba is None or 'pure_slip' not in _NUMBA_KERNELS:
+        return False
+    try:
+        return numba.threading_layer() == 'tbb'
+    except ValueError:  # compiled but never run, no layer chosen yet
+        return False
+
+
+def sweep(tires, grid: dict, workers=None, chunk: int = 65_536, intermediates=False, combined=False, moments=False, progress=True) -> 'MF62Forces':
+
+    """
+    Evaluate every tyre on the full outer product of the grid axes,
+    partitioned into chunks across a process pool. The coefficient packs
+    and the outputs live in shared memory, so tasks only carry
+    (tyre, start, stop). Chunks are identical with any number of workers,
+    so results are bit-identical to the serial run (workers=1). Once the
+    Numba backend has run on the TBB threading layer, forking workers hangs
+    the interpreter at exit, so the sweep then runs serially instead.
+
+    Parameters:
+    - tires (MF62tire or sequence of MF62tire): tyres to sweep
+    - grid (dict): 1-D array or scalar for each of longslip, slipangl, fz,
+      pressure, inclangl and vcx
+    - workers (int): worker processes, None for one per CPU, 1 to run serially
+    - chunk (int): grid points per task
+    - intermediates, combined, moments (bool): as in MF62tire.evaluate
+    - progress (bool): print progress and throughput while running
+
+    Returns:
+    - MF62Forces: every output has shape (n_tires, len(longslip), len(slipangl),
+      len(fz), len(pressure), len(inclangl), len(vcx))
+    
+    """
+
+    if isinstance(tires, MF62tire):
+        tires = [tires]
+    missing = [name for name in _SWEEP_AXES if name not in grid]
+    if missing:
+        raise ValueError(f"Sweep grid is missing {', '.join(missing)}")
+    if chunk < 1:
+        raise ValueError(f"chunk must be positive, got {chunk}")
+
+    axes = tuple(np.atleast_1d(np.asarray(grid[name], dtype=float)) for name in _SWEEP_AXES)
+    shape = tuple(len(axis) for axis in axes)
+    points = math.prod(shape)
+    flags = (intermediates, combined, moments)
+
+    # outputs the requested flags fill, probed on the first grid point
+    probe = _evaluate_pack(tires[0].frozen_coefficients(), *(axis[:1] for axis in axes), *flags)
+    names = [name for name, value in vars(probe).items() if value is not None]
+
+    packs = np.stack([tire.frozen_coefficients().as_array() for tire in tires])
+    outShape = (len(names), len(tires), points)
+    packMemory = shared_memory.SharedMemory(create=True, size=packs.nbytes)
+    outMemory = shared_memory.SharedMemory(create=True, size=max(1, math.prod(outShape)*8))
+    try:
+        np.ndarray(packs.shape, dtype=float, buffer=packMemory.buf)[:] = packs
+        initArgs = (packMemory.name, packs.shape, outMemory.name, outShape, axes, names, flags)
+        tasks = [(tyre, start, min(start+chunk, points)) for tyre in range(len(tires)) for start in range(0, points, chunk)]
+
+        total = len(tires)*points
+        done = 0
+        start = lastReport = time.perf_counter()
+
+        def report(final=False):
+            elapsed = time.perf_counter()-start
+            print(f"\rsweep {done/total:7.1%} {done/max(elapsed, 1e-9)/1e6:8.2f} M points/s", end='\n' if final else '', flush=True)
+
+        if workers == 1 or _numba_tbb_running():
+            _sweep_init(*initArgs)
+            try:
+                for task in tasks:
+                    done += _sweep_task(*task)
+                    if progress and time.perf_counter()-lastReport > 0.5:
+                        lastReport = time.perf_counter()
+                        report()
+            finally:
+                _sweep_release()
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_sweep_init, initargs=initArgs) as pool:
+                for future in as_completed([pool.submit(_sweep_task, *task) for task in tasks]):
+                    done += future.result()
+                    if progress and time.perf_counter()-lastReport > 0.5:
+                        lastReport = time.perf_counter()
+                        report()
+        if progress:
+            report(final=True)
+
+        out = np.ndarray(outShape, dtype=float, buffer=outMemory.buf)
+        results = {name: out[i].reshape((len(tires),)+shape).copy() for i, name in enumerate(names)}
+        del out
+    finally:
+        packMemory.close()
+        packMemory.unlink()
+        outMemory.close()
+        outMemory.unlink()
+
+    return MF62Forces(**results)
+
+
+def benchmark(tire: MF62tire, n: int = 1_000_000, seed: int = 0) -> dict:
+
+    """
+    Time the array evaluators on n random operating points inside the
+    tyre's valid ranges and print their throughput.
+
+    Returns:
+    - dict: {name: points per second}
+    """
+
+    rng = np.random.default_rng(seed)
+    longslip = rng.uniform(tire.KPUMIN, tire.KPUMAX, n)
+    slipangl = rng.uniform(tire.ALPMIN, tire.ALPMAX, n)
+    fz = rng.uniform(tire.FZMIN, tire.FZMAX, n)
+    pressure = rng.uniform(tire.PRESMIN, tire.PRESMAX, n)
+    inclangl = rng.uniform(tire.CAMMIN, tire.CAMMAX, n)
+    vcx = rng.uniform(1, 2*tire.LONGVL, n)
+    fx = tire.calc_fx0(longslip, fz, pressure, inclangl)
+    fy = tire.calc_fy0(slipangl, fz, pressure, inclangl)
+
+    cases = {
+        'calc_fx0': lambda: tire.calc_fx0(longslip, fz, pressure, inclangl),
+        'calc_fy0': lambda: tire.calc_fy0(slipangl, fz, pressure, inclangl),
+        'calc_mz0': lambda: tire.calc_mz0(slipangl, fz, pressure, inclangl, vcx),
+        'calc_mx': lambda: tire.calc_mx(fy, fz, pressure, inclangl),
+        'calc_my': lambda: tire.calc_my(fx, fz, pressure, inclangl, vcx),
+        'evaluate': lambda: tire.evaluate(longslip, slipangl, fz, pressure, inclangl, vcx),
+        'evaluate(moments)': lambda: tire.evaluate(longslip, slipangl, fz, pressure, inclangl, vcx, moments=True),
+        'evaluate(combined, moments)': lambda: tire.evaluate(longslip, slipangl, fz, pressure, inclangl, vcx, combined=True, moments=True),
+    }
+
+    throughput = {}
+    for name, case in cases.items():
+        start = time.perf_counter()
+        case()
+        throughput[name] = n/(time.perf_counter()-start)
+        print(f"{name:<30}{throughput[name]/1e6:8.2f} M points/s")
+    return throughput
 
-        with file_path.open('r') as file:
-            for line in file:
-                line = line.strip()
-                if not line:
-                    continue
-                elif line.startswith(("$", "[", " ")):
-                    continue
-                else:
-                    try:
-                        key, value = [item.strip() for item in line.split('=', 1)]
-                        value = value.split()[0].strip("'")
-                        if key in MF62tire.__annotations__:
-                            field_type = MF62tire.__annotations__[key]
-                        if field_type == float:
-                            value = float(value)
-                        elif field_type == int:
-                            value = int(value)
-                        elif field_type == str:
-                            value = str(value)
-                        value = field_type(value)
-                        data[key] = value
-                    except ValueError as e:
-                        print(f"Skiped {line} of tir file for {e}")
-
-        return MF62tire(**data)
-                    
 
 if __name__ == "__main__":
     file_path = Path(__file__).parent / 'vehicle_configs' / 'TireData' / 'vehicle_configs/TireData/16x6_10_LCO_10 PSI (Inaccurate My Fx and Combined Load).tir'
@@ -1488,4 +5024,5 @@ if __name__ == "__main__":
     
     tire1 = MF62tire.from_tir_file(file_path)
     tire1.calc_mz0(slipangl, fz, pressure, inclangl, vcx)
+    benchmark(tire1)
 
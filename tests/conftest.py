@@ -0,0 +1,27 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA = Path(__file__).resolve().parent / 'data'
+
+
+def _load_module():
+    # the module file name is not a valid identifier, so load it by path
+    spec = importlib.util.spec_from_file_location('mf62', ROOT / 'mf_6.2.TyreModel.py')
+    module = importlib.util.module_from_spec(spec)
+    sys.modules['mf62'] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope='session')
+def mf62():
+    return _load_module()
+
+
+@pytest.fixture
+def tire(mf62):
+    return mf62.MF62tire.from_tir_file(DATA / 'sample.tir')
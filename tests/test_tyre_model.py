@@ -0,0 +1,449 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+
+def test_model_copy_rebuilds_coefficients(tire):
+    before = tire.evaluate(0.1, 0.05, 1000.0, tire.NOMPRES, 0.0, 10.0)
+    copy = tire.model_copy(update={'PDX1': 2*tire.PDX1})
+    after = copy.evaluate(0.1, 0.05, 1000.0, copy.NOMPRES, 0.0, 10.0)
+
+    assert copy.frozen_coefficients().PDX1 == 2*tire.PDX1
+    assert not np.isclose(after.fx0, before.fx0)
+    assert np.array_equal(copy.calc_fx0(np.array([0.1]), 1000.0, copy.NOMPRES, 0.0), [after.fx0])
+    # the original keeps its own pack
+    assert tire.evaluate(0.1, 0.05, 1000.0, tire.NOMPRES, 0.0, 10.0).fx0 == before.fx0
+
+
+def test_transient_per_scenario_overrides(mf62, tire):
+    stiffness = np.array([-20.0, -22.0, -24.0, -26.0, -28.0])
+    pack = tire.with_overrides(PKY1=stiffness)
+    transient = mf62.MF62Transient(tire, len(stiffness), coefficients=pack)
+    for _ in range(3):
+        forces = transient.step(0.01, 0.02, 0.05, 1000.0, tire.NOMPRES, 0.0, 10.0)
+
+    assert forces.fy0.shape == (5,)
+    # each scenario runs against its own variant, as a single-tyre transient does
+    for k, value in enumerate(stiffness):
+        single = mf62.MF62Transient(tire.model_copy(update={'PKY1': value}), 1)
+        for _ in range(3):
+            reference = single.step(0.01, 0.02, 0.05, 1000.0, tire.NOMPRES, 0.0, 10.0)
+        assert np.allclose(forces.fy0[k], reference.fy0[0], rtol=1e-12)
+        assert np.allclose(transient.slipangl[k], single.slipangl[0], rtol=1e-12)
+
+
+def test_turn_slip_with_sample_axis_overrides(tire):
+    pack = tire.with_overrides(PHYP4=np.array([-4.0, 1.0, 2.0]))
+    forces = tire.evaluate(np.zeros(4), np.linspace(-0.1, 0.1, 4), 1000.0, tire.NOMPRES, 0.0, 10.0,
+                           coefficients=pack, turnslip=0.2)
+    assert forces.fy0.shape == (3, 4)
+    # PHYP4 is capped at 1
+    assert np.array_equal(forces.fy0[1], forces.fy0[2])
+    single = tire.evaluate(np.zeros(4), np.linspace(-0.1, 0.1, 4), 1000.0, tire.NOMPRES, 0.0, 10.0, turnslip=0.2)
+    assert np.allclose(forces.fy0[0], single.fy0, rtol=1e-12)
+
+
+def test_tyre_set_mirrors_turn_slip(mf62, tire):
+    tyres = mf62.TyreSet([tire, tire], sides=[tire.TYRESIDE, 'RIGHT' if 'LEFT' in tire.TYRESIDE.upper() else 'LEFT'])
+    slipangl = np.linspace(-0.1, 0.1, 5)
+    forces = tyres.evaluate(0.0, slipangl, 1000.0, tire.NOMPRES, 0.02, 10.0, turnslip=0.3)
+    own = tire.evaluate(np.zeros(5), slipangl, 1000.0, tire.NOMPRES, 0.02, 10.0, turnslip=0.3)
+    mirrored = tire.evaluate(np.zeros(5), -slipangl, 1000.0, tire.NOMPRES, -0.02, 10.0, turnslip=-0.3)
+    assert np.allclose(forces.fy0[0], own.fy0, rtol=1e-12)
+    assert np.allclose(forces.fy0[1], -mirrored.fy0, rtol=1e-12)
+    assert np.allclose(forces.mz0[1], -mirrored.mz0, rtol=1e-12)
+
+
+# slip, load, camber and pressure grid shared by the backend comparisons
+_LONGSLIP = np.linspace(-0.3, 0.3, 13)
+_SLIPANGL = np.radians(np.linspace(-12, 12, 13))
+_FZ = np.array([200.0, 600.0, 1000.0, 1600.0, 2400.0])
+_INCLANGL = np.radians([-4.0, 0.0, 2.0, 5.0])
+
+
+def _grid(tire, pressureScale):
+    longslip, slipangl, fz, inclangl = np.meshgrid(_LONGSLIP, _SLIPANGL, _FZ, _INCLANGL, indexing='ij')
+    return longslip, slipangl, fz, pressureScale*tire.NOMPRES, inclangl, tire.LONGVL
+
+
+@pytest.mark.parametrize('pressureScale', [0.8, 1.0, 1.2])
+@pytest.mark.parametrize('output', ['fx0', 'fy0', 'mz0', 'kxk', 'kya', 'trail', 'mzr0'])
+def test_numba_backend_matches_numpy(tire, pressureScale, output):
+    pytest.importorskip('numba')
+    inputs = _grid(tire, pressureScale)
+    reference = getattr(tire.evaluate(*inputs, intermediates=True), output)
+    compiled = getattr(tire.evaluate(*inputs, intermediates=True, backend='numba'), output)
+    assert compiled.shape == reference.shape
+    # both run the same equations, so only rounding differs
+    assert np.allclose(compiled, reference, rtol=1e-9, atol=1e-9*np.max(np.abs(reference)))
+
+
+def test_numba_backend_leaves_numba_config_alone(tire):
+    numba = pytest.importorskip('numba')
+    before = numba.config.PARFOR_MAX_TUPLE_SIZE
+    tire.evaluate(np.zeros(8), np.zeros(8), 1000.0, tire.NOMPRES, 0.0, 10.0, backend='numba')
+    assert numba.config.PARFOR_MAX_TUPLE_SIZE == before
+
+
+# (output, input) -> MF62Jacobian field, None where the pure-slip force does not depend on the input
+_JACOBIAN_PAIRS = {
+    ('fx0', 'longslip'): 'dfx0_dlongslip',
+    ('fx0', 'slipangl'): None,
+    ('fx0', 'fz'): 'dfx0_dfz',
+    ('fx0', 'inclangl'): 'dfx0_dinclangl',
+    ('fy0', 'longslip'): None,
+    ('fy0', 'slipangl'): 'dfy0_dslipangl',
+    ('fy0', 'fz'): 'dfy0_dfz',
+    ('fy0', 'inclangl'): 'dfy0_dinclangl',
+}
+
+# central-difference steps per input
+_STEPS = {'longslip': 1e-6, 'slipangl': 1e-6, 'fz': 1e-3, 'inclangl': 1e-6}
+
+
+@pytest.mark.parametrize('output, name', list(_JACOBIAN_PAIRS))
+def test_jacobian_matches_central_differences(tire, output, name):
+    # combined-slip operating points with camber, kept clear of the sign kinks at zero slip and camber
+    longslip, slipangl, fz, inclangl = np.meshgrid(
+        [-0.15, -0.04, 0.05, 0.2], np.radians([-9.0, -2.5, 3.0, 10.0]), [400.0, 1100.0, 2000.0], np.radians([-3.0, 1.5, 4.0]),
+        indexing='ij')
+    inputs = dict(longslip=longslip, slipangl=slipangl, fz=fz, pressure=tire.NOMPRES, inclangl=inclangl)
+
+    jacobian = tire.evaluate_jacobian(**inputs)
+    field = _JACOBIAN_PAIRS[output, name]
+    analytic = np.zeros_like(longslip) if field is None else getattr(jacobian, field)
+
+    h = _STEPS[name]
+    upper = tire.evaluate_jacobian(**{**inputs, name: inputs[name]+h})
+    lower = tire.evaluate_jacobian(**{**inputs, name: inputs[name]-h})
+    numeric = (getattr(upper, output)-getattr(lower, output))/(2*h)
+
+    # truncation and rounding of the difference stay well inside 1e-5 of the derivative scale
+    assert np.allclose(analytic, numeric, rtol=1e-5, atol=1e-5*np.max(np.abs(numeric)))
+    assert np.array_equal(getattr(jacobian, output), getattr(tire.evaluate(longslip, slipangl, fz, tire.NOMPRES, inclangl, tire.LONGVL), output))
+
+
+@pytest.fixture(scope='module')
+def lookup(mf62):
+    tire = mf62.MF62tire.from_tir_file(Path(__file__).resolve().parent / 'data' / 'sample.tir')
+    return tire, tire.build_lookup()
+
+
+def _lookup_points(lookup, n, seed):
+    rng = np.random.default_rng(seed)
+    return {name: rng.uniform(nodes[0], nodes[-1], n) for name, nodes in lookup.axes.items()}
+
+
+def test_lookup_error_bound(lookup):
+    tire, table = lookup
+    # the default grid stays within 0.5 % of the peak force
+    for output in ('fx0', 'fy0'):
+        peak = np.max(np.abs(getattr(table, f'{output}_table')))
+        assert table.max_error[output] < 5e-3*peak
+
+    # and the estimate holds on points it was not computed from
+    p = _lookup_points(table, 20_000, seed=1)
+    load = (p['fz'], p['pressure'], p['inclangl'])
+    fx0Error = np.max(np.abs(table.calc_fx0(p['longslip'], *load)-tire.calc_fx0(p['longslip'], *load)))
+    fy0Error = np.max(np.abs(table.calc_fy0(p['slipangl'], *load)-tire.calc_fy0(p['slipangl'], *load)))
+    assert fx0Error < 1.5*table.max_error['fx0']
+    assert fy0Error < 1.5*table.max_error['fy0']
+
+
+def test_lookup_folds_constant_inputs(lookup):
+    tire, table = lookup
+    p = _lookup_points(table, 20_000, seed=2)
+    pressure = np.full(20_000, tire.NOMPRES)
+    folded = table.calc_fy0(p['slipangl'], p['fz'], tire.NOMPRES, 0.01)
+    spread = table.calc_fy0(p['slipangl'], p['fz'], pressure, np.full(20_000, 0.01))
+    small = table.calc_fy0(p['slipangl'][:50], p['fz'][:50], pressure[:50], 0.01)
+    assert np.allclose(folded, spread, rtol=1e-6, atol=1e-3)
+    assert np.allclose(small, folded[:50], rtol=1e-6, atol=1e-3)
+    assert table.calc_fx0(0.05, p['fz'][:7, None], tire.NOMPRES, np.zeros(3)).shape == (7, 3)
+    assert isinstance(table.calc_fx0(0.05, 1000.0, tire.NOMPRES, 0.0), float)
+
+
+def test_lookup_needs_even_axes(mf62, lookup, tmp_path):
+    tire, table = lookup
+    with pytest.raises(ValueError):
+        tire.build_lookup(grid={'fz': np.array([100.0, 500.0, 3000.0])}, samples=10)
+
+    table.save(tmp_path / 'table.npz')
+    loaded = mf62.MF62Lookup.load(tmp_path / 'table.npz')
+    assert loaded.max_error == table.max_error
+    assert np.array_equal(loaded.calc_fy0(0.05, 900.0, tire.NOMPRES, 0.0), table.calc_fy0(0.05, 900.0, tire.NOMPRES, 0.0))
+
+
+@pytest.mark.parametrize('cast', [float, np.float32, np.float64, np.int64])
+def test_scalar_kernels_match_array_path(tire, mf62, cast, monkeypatch):
+    # NumPy scalars take the per-force scalar kernels, never the three-force point evaluation
+    monkeypatch.setattr(mf62, '_evaluate_point', None)
+    slip, fz, pressure, inclangl, vcx = (cast(x) for x in ((0, 4000, 200000, 0, 20) if cast is np.int64 else (0.05, 4000.0, tire.NOMPRES, 0.03, 20.0)))
+    scalar = (tire.calc_fx0(slip, fz, pressure, inclangl), tire.calc_fy0(slip, fz, pressure, inclangl), tire.calc_mz0(slip, fz, pressure, inclangl, vcx))
+    arrays = [np.array([float(x)]) for x in (slip, fz, pressure, inclangl, vcx)]
+    array = (tire.calc_fx0(*arrays[:4])[0], tire.calc_fy0(*arrays[:4])[0], tire.calc_mz0(*arrays)[0])
+    for value, expected in zip(scalar, array):
+        assert type(value) is float
+        np.testing.assert_allclose(value, expected, rtol=1e-12)
+
+
+def test_kernels_share_cached_pressure_factors(tire, mf62):
+    # every kernel takes its pressure polynomials from the tire's cache, so a scalar pressure is computed once
+    longslip, slipangl, fz, pressure, inclangl, vcx = _grid(tire, 1.1)
+    before = tire.pressure_cache_stats()
+    expected = tire.evaluate(longslip, slipangl, fz, pressure, inclangl, vcx, intermediates=True)
+    workspace = mf62.MF62Workspace(longslip.shape)
+    forces = tire.evaluate_into(workspace, longslip, slipangl, fz, pressure, inclangl, vcx)
+    for name in ('fx0', 'fy0', 'mz0', 'kxk', 'kya', 'trail', 'mzr0'):
+        np.testing.assert_allclose(getattr(forces, name), getattr(expected, name), rtol=1e-12)
+    tire.evaluate(0.05, 0.05, 4000.0, pressure, 0.02, 20.0)
+    tire.calc_fy0(0.05, 4000.0, pressure, 0.02)
+    tire.calc_peaks(4000.0, pressure, 0.02)
+    after = tire.pressure_cache_stats()
+    assert after['misses'] - before['misses'] == 1
+    assert after['hits'] - before['hits'] >= 4
+
+
+def test_calc_functions_match_evaluate(tire, monkeypatch):
+    # calc_fx0/fy0/mz0 and evaluate share the shape-factor helpers, and calc_mz0 does not rerun calc_fy0
+    longslip, slipangl, fz, pressure, inclangl, vcx = _grid(tire, 0.9)
+    forces = tire.evaluate(longslip, slipangl, fz, pressure, inclangl, vcx)
+    monkeypatch.setattr(type(tire), 'calc_fy0', None)
+    np.testing.assert_allclose(tire.calc_mz0(slipangl, fz, pressure, inclangl, vcx), forces.mz0, rtol=1e-12)
+    monkeypatch.undo()
+    np.testing.assert_allclose(tire.calc_fx0(longslip, fz, pressure, inclangl), forces.fx0, rtol=1e-12)
+    np.testing.assert_allclose(tire.calc_fy0(slipangl, fz, pressure, inclangl), forces.fy0, rtol=1e-12)
+
+
+def test_road_grid_keeps_last_sample(tire, mf62):
+    tire = tire.model_copy(update={'ROAD_INCREMENT': 0.01})
+    x = np.arange(30)*0.01
+    z = 0.001*np.arange(30)
+    road = mf62.MF62Road(tire, x, z)
+    assert road.heights.shape == (30, 1)
+    np.testing.assert_allclose(road.heights[:, 0], z, rtol=1e-12, atol=1e-15)
+
+
+def test_ellipse_basis_reaches_the_cam_ends(mf62):
+    basis = mf62._ellipse_basis(0.29, 0.05, 1.8, 0.01)
+    assert len(basis) == 2*29+1
+    assert basis[0] == basis[-1] == 0.05
+    assert basis[29] == 0.0
+
+
+def test_memo_counts_repeats_and_overflow(tire, mf62):
+    memo = mf62.MF62Memo(tire, maxsize=4)
+    fz = np.full(6, 4000.0)
+    memo.evaluate(np.repeat([0.01, 0.02, 0.03], 2), 0.0, fz, tire.NOMPRES, 0.0, 20.0)
+    stats = memo.stats()
+    assert (stats['hits'], stats['misses'], stats['evictions']) == (3, 3, 0)
+
+    # ten new cells into four slots: the three old cells and six of the new ones are evicted
+    memo.evaluate(np.linspace(0.1, 0.2, 10), 0.0, 4000.0, tire.NOMPRES, 0.0, 20.0)
+    stats = memo.stats()
+    assert (stats['hits'], stats['misses'], stats['evictions']) == (3, 13, 9)
+    assert stats['misses']-stats['evictions'] == stats['size'] == 4
+
+
+def test_tir_round_trip_is_silent(tire, mf62, tmp_path, capsys, recwarn):
+    path = tmp_path / 'round_trip.tir'
+    tire.to_tir_file(path)
+    assert "MASS                     = 'kg'" in path.read_text()
+    read = mf62.MF62tire.from_tir_file(path)
+    assert capsys.readouterr().out == ''
+    assert not recwarn.list
+    assert read.model_dump() == tire.model_dump()
+
+
+def test_turn_slip_scales_vertical_shifts(tire, mf62):
+    # SVx (4.E18) carries zeta1 like Dx, and DVykappa (4.E67) carries zeta2 like Dy
+    longslip, slipangl, fz, inclangl, vcx = 0.05, 0.04, np.array([2000.0, 4000.0, 6000.0]), 0.02, tire.LONGVL
+    spin = np.array([0.5, 2.0, 5.0])
+    c = tire.frozen_coefficients()
+    pf = mf62._pressure_factors(c, tire.NOMPRES)
+    z = mf62._turn_slip_factors(c, spin, longslip, slipangl, fz, pf, inclangl, vcx)
+    assert np.all(z.zeta1 < 1) and np.all(z.zeta2 < 1)
+
+    svx = mf62._longitudinal_shape(c, fz, pf, inclangl, longslip)[0].SV
+    svxSpin = mf62._longitudinal_shape(c, fz, pf, inclangl, longslip, z=z)[0].SV
+    np.testing.assert_allclose(svxSpin, svx*z.zeta1, rtol=1e-12)
+
+    straight = tire.evaluate(longslip, slipangl, fz, tire.NOMPRES, inclangl, vcx, intermediates=True, combined=True)
+    turning = tire.evaluate(longslip, slipangl, fz, tire.NOMPRES, inclangl, vcx, intermediates=True, combined=True, turnslip=spin)
+    np.testing.assert_allclose(turning.svyk, straight.svyk*z.zeta2, rtol=1e-12)
+
+
+def test_sweep_is_bit_identical_across_workers(tire, mf62):
+    grid = {
+        'longslip': np.linspace(-0.2, 0.2, 7),
+        'slipangl': np.linspace(-0.1, 0.1, 5),
+        'fz': np.array([2000.0, 5000.0]),
+        'pressure': tire.NOMPRES*np.array([0.9, 1.1]),
+        'inclangl': np.array([0.0, 0.03]),
+        'vcx': tire.LONGVL,
+    }
+    serial = mf62.sweep(tire, grid, workers=1, chunk=50, combined=True, progress=False)
+    parallel = mf62.sweep(tire, grid, workers=2, chunk=50, combined=True, progress=False)
+    direct = tire.evaluate(*np.meshgrid(*(np.atleast_1d(grid[name]) for name in mf62._SWEEP_AXES), indexing='ij'), combined=True)
+    for name in ('fx0', 'fy0', 'mz0', 'fx', 'fy', 'mz'):
+        np.testing.assert_array_equal(getattr(parallel, name), getattr(serial, name))
+        np.testing.assert_array_equal(getattr(serial, name)[0], getattr(direct, name))
+
+
+@pytest.mark.parametrize('axis', ['longslip', 'slipangl'])
+def test_slip_inversion_round_trip(tire, axis):
+    invert, forward, output = ((tire.calc_longslip, tire.calc_fx0, 'fx0') if axis == 'longslip'
+                               else (tire.calc_slipangl, tire.calc_fy0, 'fy0'))
+    fz = np.array([2000.0, 5000.0])[:, None]
+    peaks = [getattr(tire.calc_peaks(fz, tire.NOMPRES, 0.02, side), output) for side in (1, -1)]
+    high, low = np.maximum(*peaks), np.minimum(*peaks)
+    target = np.linspace(1.2*low[:, 0], 1.2*high[:, 0], 201, axis=-1)
+    assert target.shape == (2, 201)
+
+    slip, saturated = invert(target, fz, tire.NOMPRES, 0.02)
+    np.testing.assert_array_equal(saturated, (target > high) | (target < low))
+    np.testing.assert_allclose(forward(slip, fz, tire.NOMPRES, 0.02)[~saturated], target[~saturated], rtol=0, atol=1e-8)
+
+    slip, saturated = invert(0.5*float(high[0, 0]), 2000.0, tire.NOMPRES, 0.02)
+    assert type(slip) is float and type(saturated) is bool and not saturated
+
+
+@pytest.mark.parametrize('side', [1, -1])
+def test_calc_peaks_match_dense_scan(tire, side):
+    # 6000 N is twice FZMAX, where Ex > 1 folds the fx0 curve back through zero past its first peak
+    fz, inclangl = np.array([1000.0, 3000.0, 6000.0]), 0.02
+    peaks = tire.calc_peaks(fz, tire.NOMPRES, inclangl, side)
+    for slip, force, forward, bound in ((peaks.longslip, peaks.fx0, tire.calc_fx0, tire.KPUMAX if side > 0 else tire.KPUMIN),
+                                        (peaks.slipangl, peaks.fy0, tire.calc_fy0, tire.ALPMAX if side > 0 else tire.ALPMIN)):
+        scan = np.linspace(0, bound, 20001)
+        scanned = forward(scan[:, None], fz, tire.NOMPRES, inclangl)
+        # first extremum moving out from zero slip, the bound if the curve never turns
+        step = np.sign(np.diff(scanned, axis=0))
+        turned = step != step[:1]
+        first = np.where(turned.any(axis=0), turned.argmax(axis=0), scan.size-1)
+        np.testing.assert_allclose(force, scanned[first, range(fz.size)], rtol=1e-6)
+        np.testing.assert_allclose(slip, scan[first], rtol=0, atol=2*abs(scan[1]))
+
+
+@pytest.mark.parametrize('side', [1, -1])
+def test_calc_peaks_pin_rising_curves_to_the_bound(tire, side):
+    # the slip range ends well before either peak, so both curves are still rising there
+    narrow = tire.model_copy(update={'KPUMIN': -0.01, 'KPUMAX': 0.01, 'ALPMIN': -0.005, 'ALPMAX': 0.005})
+    fz = np.array([2000.0, 4000.0, 6000.0])
+    peaks = narrow.calc_peaks(fz, narrow.NOMPRES, 0.0, side)
+    np.testing.assert_array_equal(peaks.longslip, side*0.01)
+    np.testing.assert_array_equal(peaks.slipangl, side*0.005)
+    np.testing.assert_allclose(peaks.fx0, narrow.calc_fx0(side*0.01, fz, narrow.NOMPRES, 0.0), rtol=1e-12)
+    np.testing.assert_allclose(peaks.fy0, narrow.calc_fy0(side*0.005, fz, narrow.NOMPRES, 0.0), rtol=1e-12)
+
+
+def test_fit_recovers_perturbed_lateral_coefficients(tire):
+    truth = tire.model_copy(update={'PDY1': 1.1*tire.PDY1, 'PKY1': 0.9*tire.PKY1, 'PEY1': tire.PEY1+0.1})
+    rng = np.random.default_rng(0)
+    n = 4000
+    data = {
+        'slipangl': rng.uniform(-0.3, 0.3, n),
+        'fz': rng.uniform(tire.FZMIN, tire.FZMAX, n),
+        'inclangl': rng.uniform(-0.05, 0.05, n),
+        'pressure': tire.NOMPRES*rng.uniform(0.9, 1.1, n),
+    }
+    data['fy0'] = truth.calc_fy0(data['slipangl'], data['fz'], data['pressure'], data['inclangl'])
+
+    fitted = tire.fit(data, stages=['lateral'])
+    for name in ('PDY1', 'PKY1', 'PEY1'):
+        np.testing.assert_allclose(getattr(fitted, name), getattr(truth, name), rtol=1e-6)
+    np.testing.assert_allclose(fitted.calc_fy0(data['slipangl'], data['fz'], data['pressure'], data['inclangl']),
+                               data['fy0'], rtol=0, atol=1e-6)
+
+
+def _cached_tir(mf62, tmp_path):
+    path = tmp_path / 'cached.tir'
+    path.write_bytes((Path(__file__).parent / 'data' / 'sample.tir').read_bytes())
+    mf62.MF62tire.from_tir_file(path, cache=True, cache_dir=tmp_path / 'cache')
+    return path, tmp_path / 'cache' / 'cached.tir.mf62'
+
+
+def _no_parse(file_path):
+    raise AssertionError(f"{file_path} parsed despite a valid sidecar")
+
+
+def test_sidecar_reparses_an_edited_tir(mf62, tmp_path):
+    path, sidecar = _cached_tir(mf62, tmp_path)
+    path.write_text(path.read_text().replace('PDY1                     = 2.6', 'PDY1                     = 2.7'))
+    tire = mf62.MF62tire.from_tir_file(path, cache=True, cache_dir=sidecar.parent)
+    assert tire.PDY1 == tire.frozen_coefficients().PDY1 == 2.7
+    # the sidecar now holds the edit
+    assert mf62._load_sidecar(path, sidecar.parent).PDY1 == 2.7
+
+
+def test_sidecar_hits_a_touched_tir_and_refreshes_its_key(mf62, tmp_path, monkeypatch):
+    path, sidecar = _cached_tir(mf62, tmp_path)
+    expected = mf62.MF62tire.from_tir_file(path)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    monkeypatch.setattr(mf62, '_parse_tir_file', _no_parse)
+
+    # new mtime, same content: the sha1 matches and the key is rewritten
+    tire = mf62.MF62tire.from_tir_file(path, cache=True, cache_dir=sidecar.parent)
+    assert tire.model_dump() == expected.model_dump()
+    assert mf62._SIDECAR_HEADER.unpack_from(sidecar.read_bytes())[2] == path.stat().st_mtime_ns
+
+    # so the next load matches on size and mtime without hashing the file
+    monkeypatch.setattr(mf62, '_file_sha1', _no_parse)
+    assert mf62.MF62tire.from_tir_file(path, cache=True, cache_dir=sidecar.parent).model_dump() == expected.model_dump()
+
+
+def test_sidecar_from_another_layout_is_ignored(mf62, tmp_path, monkeypatch):
+    path, sidecar = _cached_tir(mf62, tmp_path)
+    monkeypatch.setattr(mf62, '_SIDECAR_LAYOUT', mf62._SIDECAR_LAYOUT ^ 1)
+    assert mf62._load_sidecar(path, sidecar.parent) is None
+
+
+def _with_strings(data, header, strings):
+    fields = header.unpack_from(data)
+    return header.pack(*fields[:6], len(strings)) + data[header.size:header.size+8*fields[5]] + strings
+
+
+@pytest.mark.parametrize('corrupt', [
+    lambda data, header: b'',
+    lambda data, header: data[:len(data)//2],
+    lambda data, header: data[:-4] + b'\xff{[',
+    lambda data, header: header.pack(*header.unpack_from(data)[:5], 1, 2) + data[header.size:],
+    lambda data, header: _with_strings(data, header, b'[]'),
+    lambda data, header: _with_strings(data, header, b'{"FILE_TYPE": 1}'),
+], ids=['empty', 'truncated', 'bad json', 'pack size', 'not a dict', 'bad field'])
+def test_corrupt_sidecar_falls_back_to_parsing(mf62, tmp_path, corrupt):
+    path, sidecar = _cached_tir(mf62, tmp_path)
+    expected = mf62.MF62tire.from_tir_file(path)
+    sidecar.write_bytes(corrupt(sidecar.read_bytes(), mf62._SIDECAR_HEADER))
+    assert mf62.MF62tire.from_tir_file(path, cache=True, cache_dir=sidecar.parent).model_dump() == expected.model_dump()
+    # and the sidecar is rewritten
+    assert mf62._load_sidecar(path, sidecar.parent).model_dump() == expected.model_dump()
+
+
+@pytest.mark.parametrize('turnslip', [None, 0.8, 'array'])
+def test_chunked_evaluate_matches_unchunked(tire, turnslip):
+    rng = np.random.default_rng(1)
+    longslip = np.linspace(-0.3, 0.3, 13)[:, None]
+    slipangl = np.linspace(-0.2, 0.2, 11)
+    # broadcast, non-contiguous and scalar inputs all go through _input_chunk
+    fz = rng.uniform(1000.0, 3000.0, (11, 13)).T
+    pressure, inclangl, vcx = tire.NOMPRES, rng.uniform(-0.05, 0.05, (13, 1)), tire.LONGVL
+    if turnslip == 'array':
+        turnslip = rng.uniform(-1.0, 1.0, 11)
+    flags = dict(intermediates=True, combined=True, moments=True, turnslip=turnslip)
+
+    expected = tire.evaluate(longslip, slipangl, fz, pressure, inclangl, vcx, **flags)
+    for workers, chunk in ((None, 17), (2, 17), (3, 1000)):
+        forces = tire.evaluate(longslip, slipangl, fz, pressure, inclangl, vcx, workers=workers, chunk=chunk, **flags)
+        for name, value in vars(expected).items():
+            if value is None:
+                assert getattr(forces, name) is None
+            else:
+                np.testing.assert_array_equal(getattr(forces, name), value)
+
+    scalar = tire.evaluate(0.05, 0.02, 2000.0, pressure, 0.01, vcx, workers=2, chunk=17, **{**flags, 'turnslip': 0.8})
+    assert type(scalar.fx) is type(tire.evaluate(0.05, 0.02, 2000.0, pressure, 0.01, vcx, **{**flags, 'turnslip': 0.8}).fx)
+    assert np.ndim(scalar.fx) == 0 and not isinstance(scalar.fx, np.ndarray)